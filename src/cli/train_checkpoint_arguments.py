@@ -0,0 +1,59 @@
+"""Checkpoint argument wiring for the train command.
+
+This module registers checkpoint cadence, retention, format, and resume
+flags. It keeps the train command module within size constraints.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from core.constants import (
+    DEFAULT_TRAIN_CHECKPOINT_EVERY_EPOCHS,
+    DEFAULT_TRAIN_CHECKPOINT_FORMAT,
+    DEFAULT_TRAIN_MAX_CHECKPOINT_FILES,
+    SUPPORTED_TRAIN_CHECKPOINT_FORMATS,
+)
+
+
+def add_train_checkpoint_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register checkpoint flags on the train subcommand parser."""
+    parser.add_argument(
+        "--checkpoint-every-epochs",
+        type=int,
+        default=DEFAULT_TRAIN_CHECKPOINT_EVERY_EPOCHS,
+        help="Save training checkpoint every N epochs",
+    )
+    parser.add_argument(
+        "--max-checkpoint-files",
+        type=int,
+        default=DEFAULT_TRAIN_MAX_CHECKPOINT_FILES,
+        help="Keep at most N epoch checkpoint files",
+    )
+    parser.add_argument(
+        "--checkpoint-format",
+        default=DEFAULT_TRAIN_CHECKPOINT_FORMAT,
+        choices=SUPPORTED_TRAIN_CHECKPOINT_FORMATS,
+        help="Checkpoint model tensor format (safetensors requires the safetensors extra)",
+    )
+    parser.add_argument(
+        "--async-checkpoint",
+        action="store_true",
+        help="Write checkpoint files on a background thread while training continues",
+    )
+    parser.add_argument(
+        "--checkpoint-fsync",
+        action="store_true",
+        help="Flush each checkpoint file to stable storage with fsync after writing",
+    )
+    parser.add_argument(
+        "--no-save-best-checkpoint",
+        action="store_false",
+        dest="save_best_checkpoint",
+        help="Disable writing best.pt checkpoint",
+    )
+    parser.set_defaults(save_best_checkpoint=True)
+    parser.add_argument(
+        "--resume-checkpoint-path",
+        help="Resume training state from a previously saved checkpoint file",
+    )
@@ -9,17 +9,19 @@ from __future__ import annotations
 import argparse
 from typing import Any, cast
 
+from cli.train_checkpoint_arguments import add_train_checkpoint_arguments
 from core.constants import (
     DEFAULT_BATCH_SIZE,
+    DEFAULT_LENGTH_BUCKET_COUNT,
     DEFAULT_MAX_TOKEN_LENGTH,
     DEFAULT_POSITION_EMBEDDING_TYPE,
     DEFAULT_TRAIN_ATTENTION_HEADS,
-    DEFAULT_TRAIN_CHECKPOINT_EVERY_EPOCHS,
+    DEFAULT_TRAIN_COMPILE_MODE,
     DEFAULT_TRAIN_DROPOUT,
     DEFAULT_TRAIN_EPOCHS,
+    DEFAULT_TRAIN_GRADIENT_ACCUMULATION_STEPS,
     DEFAULT_TRAIN_HIDDEN_DIM,
     DEFAULT_TRAIN_LEARNING_RATE,
-    DEFAULT_TRAIN_MAX_CHECKPOINT_FILES,
     DEFAULT_TRAIN_MLP_HIDDEN_DIM,
     DEFAULT_TRAIN_MLP_LAYERS,
     DEFAULT_TRAIN_NUM_LAYERS,
@@ -35,10 +37,12 @@ from core.constants import (
     DEFAULT_TRAIN_VALIDATION_SPLIT,
     DEFAULT_TRAIN_WEIGHT_DECAY,
     SUPPORTED_POSITION_EMBEDDING_TYPES,
+    SUPPORTED_TRAIN_COMPILE_MODES,
     SUPPORTED_TRAIN_OPTIMIZER_TYPES,
     SUPPORTED_TRAIN_PRECISION_MODES,
     SUPPORTED_TRAIN_SCHEDULER_TYPES,
 )
+from core.training_types import CheckpointFormat, CompileMode
 from core.types import (
     OptimizerType,
     PositionEmbeddingType,
@@ -61,6 +65,10 @@ def run_train_command(client: ForgeClient, args: argparse.Namespace) -> int:
         epochs=args.epochs,
         learning_rate=args.learning_rate,
         precision_mode=cast(PrecisionMode, args.precision_mode),
+        compile_model=args.compile_model,
+        compile_mode=cast(CompileMode, args.compile_mode),
+        gradient_checkpointing=args.gradient_checkpointing,
+        allow_tf32=args.allow_tf32,
         optimizer_type=cast(OptimizerType, args.optimizer_type),
         weight_decay=args.weight_decay,
         sgd_momentum=args.sgd_momentum,
@@ -70,6 +78,8 @@ def run_train_command(client: ForgeClient, args: argparse.Namespace) -> int:
         scheduler_t_max_epochs=args.scheduler_t_max_epochs,
         scheduler_eta_min=args.scheduler_eta_min,
         batch_size=args.batch_size,
+        gradient_accumulation_steps=args.gradient_accumulation_steps,
+        length_bucket_count=args.length_bucket_count,
         max_token_length=args.max_token_length,
         validation_split=args.validation_split,
         hidden_dim=args.hidden_dim,
@@ -87,6 +97,9 @@ def run_train_command(client: ForgeClient, args: argparse.Namespace) -> int:
         checkpoint_every_epochs=args.checkpoint_every_epochs,
         save_best_checkpoint=args.save_best_checkpoint,
         max_checkpoint_files=args.max_checkpoint_files,
+        checkpoint_format=cast(CheckpointFormat, args.checkpoint_format),
+        async_checkpoint=args.async_checkpoint,
+        checkpoint_fsync=args.checkpoint_fsync,
         resume_checkpoint_path=args.resume_checkpoint_path,
         progress_log_interval_steps=args.progress_log_interval_steps,
     )
@@ -134,6 +147,28 @@ def add_train_command(subparsers: Any) -> None:
         choices=SUPPORTED_TRAIN_PRECISION_MODES,
         help="Mixed precision mode (auto selects best available)",
     )
+    parser.add_argument(
+        "--compile-model",
+        action="store_true",
+        help="Compile the model with torch.compile before training",
+    )
+    parser.add_argument(
+        "--compile-mode",
+        default=DEFAULT_TRAIN_COMPILE_MODE,
+        choices=SUPPORTED_TRAIN_COMPILE_MODES,
+        help="torch.compile mode used with --compile-model",
+    )
+    parser.add_argument(
+        "--gradient-checkpointing",
+        action="store_true",
+        help="Recompute transformer block activations during backward to save memory",
+    )
+    parser.add_argument(
+        "--no-tf32",
+        action="store_false",
+        dest="allow_tf32",
+        help="Keep full-precision fp32 matmuls instead of TF32 on Ampere+ GPUs",
+    )
     parser.add_argument(
         "--optimizer-type",
         default=DEFAULT_TRAIN_OPTIMIZER_TYPE,
@@ -183,6 +218,18 @@ def add_train_command(subparsers: Any) -> None:
         help="Minimum learning rate for cosine scheduler",
     )
     parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Batch size")
+    parser.add_argument(
+        "--gradient-accumulation-steps",
+        type=int,
+        default=DEFAULT_TRAIN_GRADIENT_ACCUMULATION_STEPS,
+        help="Accumulate gradients over N batches per optimizer step",
+    )
+    parser.add_argument(
+        "--length-bucket-count",
+        type=int,
+        default=DEFAULT_LENGTH_BUCKET_COUNT,
+        help="Group similar-length sequences into batches (1 disables bucketing)",
+    )
     parser.add_argument(
         "--max-token-length",
         type=int,
@@ -234,29 +281,7 @@ def add_train_command(subparsers: Any) -> None:
         choices=SUPPORTED_POSITION_EMBEDDING_TYPES,
         help="Positional embedding mode for default model",
     )
-    parser.add_argument(
-        "--checkpoint-every-epochs",
-        type=int,
-        default=DEFAULT_TRAIN_CHECKPOINT_EVERY_EPOCHS,
-        help="Save training checkpoint every N epochs",
-    )
-    parser.add_argument(
-        "--max-checkpoint-files",
-        type=int,
-        default=DEFAULT_TRAIN_MAX_CHECKPOINT_FILES,
-        help="Keep at most N epoch checkpoint files",
-    )
-    parser.add_argument(
-        "--no-save-best-checkpoint",
-        action="store_false",
-        dest="save_best_checkpoint",
-        help="Disable writing best.pt checkpoint",
-    )
-    parser.set_defaults(save_best_checkpoint=True)
-    parser.add_argument(
-        "--resume-checkpoint-path",
-        help="Resume training state from a previously saved checkpoint file",
-    )
+    add_train_checkpoint_arguments(parser)
     parser.add_argument(
         "--progress-log-interval-steps",
         type=int,
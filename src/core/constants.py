@@ -21,9 +21,13 @@ ENGLISH_LANGUAGE_CODE = "en"
 DEFAULT_QUALITY_SCORE = 0.0
 DEFAULT_QUALITY_FLOOR = 0.0
 DEFAULT_SHUFFLE_BUFFER_SIZE = 1024
+DEFAULT_LENGTH_BUCKET_COUNT = 8
 DEFAULT_BATCH_SIZE = 16
 DEFAULT_MAX_TOKEN_LENGTH = 512
 HASH_ALGORITHM = "sha256"
+TRAINING_CONFIG_HASH_CACHE_SIZE = 8
+SNAPSHOT_RECORDS_CACHE_MAX_RECORDS = 100_000
+RECORD_ID_HASH_CHUNK_SIZE = 4096
 SUPPORTED_TEXT_EXTENSIONS = (".txt", ".md", ".text", ".jsonl")
 INGEST_CHECKPOINT_DIR_NAME = "ingest_checkpoint"
 CHECKPOINT_STATE_FILE_NAME = "state.json"
@@ -36,6 +40,7 @@ DEFAULT_QUALITY_MODEL = "perplexity"
 SUPPORTED_QUALITY_MODELS = ("hybrid", "perplexity")
 DEFAULT_EXPORT_SHARD_SIZE = 1000
 DEFAULT_TRAIN_EPOCHS = 3
+PAD_TOKEN_ID = 0
 DEFAULT_TRAIN_LEARNING_RATE = 1e-3
 DEFAULT_TRAIN_WEIGHT_DECAY = 0.0
 DEFAULT_TRAIN_SGD_MOMENTUM = 0.9
@@ -56,16 +61,31 @@ DEFAULT_TRAIN_CHECKPOINT_DIR_NAME = "checkpoints"
 DEFAULT_TRAIN_BEST_CHECKPOINT_FILE_NAME = "best.pt"
 DEFAULT_TRAIN_CHECKPOINT_EVERY_EPOCHS = 1
 DEFAULT_TRAIN_MAX_CHECKPOINT_FILES = 5
+DEFAULT_TRAIN_CHECKPOINT_FORMAT: Literal["torch", "safetensors"] = "torch"
+SUPPORTED_TRAIN_CHECKPOINT_FORMATS = ("torch", "safetensors")
+CHECKPOINT_MODEL_TENSORS_SUFFIX = ".safetensors"
+CHECKPOINT_PRUNE_MAX_WORKERS = 8
+CHECKPOINT_WRITER_THREAD_NAME = "forge-checkpoint-writer"
 RUNS_DIR_NAME = "runs"
 RUN_INDEX_FILE_NAME = "index.json"
 RUN_STATE_FILE_NAME = "lifecycle.json"
 LINEAGE_DIR_NAME = "lineage"
 LINEAGE_GRAPH_FILE_NAME = "model_lineage.json"
+TOKENIZER_CACHE_DIR_NAME = "tokenizers"
 TRAINING_ARTIFACT_CONTRACT_FILE_NAME = "training_artifacts_manifest.json"
 DEFAULT_REPRODUCIBILITY_BUNDLE_FILE_NAME = "reproducibility_bundle.json"
 DEFAULT_TRAIN_PROGRESS_LOG_INTERVAL_STEPS = 10
+DEFAULT_TRAIN_GRADIENT_ACCUMULATION_STEPS = 1
+DDP_BUCKET_CAP_MB = 25
+BATCH_STAGING_BUFFER_COUNT = 4
 DEFAULT_TRAIN_PRECISION_MODE: Literal["auto", "fp32", "fp16", "bf16"] = "auto"
 SUPPORTED_TRAIN_PRECISION_MODES = ("auto", "fp32", "fp16", "bf16")
+DEFAULT_TRAIN_COMPILE_MODE: Literal["default", "reduce-overhead", "max-autotune"] = "default"
+SUPPORTED_TRAIN_COMPILE_MODES = ("default", "reduce-overhead", "max-autotune")
+AMPERE_CUDA_CAPABILITY_MAJOR = 8
+PRECISION_PROBE_CACHE_SIZE = 8
+TF32_FLOAT32_MATMUL_PRECISION = "high"
+CUDNN_BENCHMARK_MAX_INPUT_SHAPES = 8
 DEFAULT_TRAIN_OPTIMIZER_TYPE: Literal["adam", "adamw", "sgd"] = "adam"
 SUPPORTED_TRAIN_OPTIMIZER_TYPES = ("adam", "adamw", "sgd")
 DEFAULT_TRAIN_SCHEDULER_TYPE: Literal["none", "step", "cosine"] = "none"
@@ -76,6 +96,9 @@ DEFAULT_TRAIN_SCHEDULER_T_MAX_EPOCHS: int | None = None
 DEFAULT_TRAIN_SCHEDULER_ETA_MIN = 0.0
 DEFAULT_TRAINING_CONFIG_FILE_NAME = "training_config.json"
 DEFAULT_TOKENIZER_VOCAB_FILE_NAME = "tokenizer_vocab.json"
+JSON_MMAP_MIN_BYTES = 1024 * 1024
+JSONL_WRITE_BUFFER_BYTES = 1024 * 1024
+VOCABULARY_FORMAT_SNIFF_ENTRY_COUNT = 5
 DEFAULT_CHAT_MAX_NEW_TOKENS = 80
 DEFAULT_CHAT_TEMPERATURE = 0.8
 DEFAULT_CHAT_TOP_K = 40
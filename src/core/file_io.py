@@ -0,0 +1,42 @@
+"""Filesystem helpers shared by metadata and catalog persistence.
+
+Files are replaced atomically through a per-process staging file, so a
+crash or concurrent reader never observes a partially written document.
+Parsed-file caches key their entries on a file's (mtime_ns, size)
+signature so an edited file is re-read while an unchanged one is reused.
+"""
+
+from __future__ import annotations
+
+import os
+from contextlib import suppress
+from pathlib import Path
+
+
+def write_bytes_atomically(target_path: Path, payload: bytes) -> None:
+    """Write bytes to a per-process staging file, then rename it over the target.
+
+    Args:
+        target_path: File to create or replace.
+        payload: Complete file contents.
+
+    Raises:
+        OSError: If the file cannot be written; the staging file is removed.
+    """
+    staging_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.tmp")
+    try:
+        staging_path.write_bytes(payload)
+        os.replace(staging_path, target_path)
+    except OSError:
+        with suppress(OSError):
+            staging_path.unlink(missing_ok=True)
+        raise
+
+
+def file_signature(file_path: Path) -> tuple[int, int] | None:
+    """Return a file's (mtime_ns, size) change signature, or None when missing."""
+    try:
+        file_stat = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
@@ -0,0 +1,109 @@
+"""JSON encoding helpers with an optional orjson fast path.
+
+This module reads and writes JSON artifacts through orjson when it is
+installed and falls back to the standard library json module otherwise.
+orjson decode errors subclass json.JSONDecodeError, so callers catch one
+exception type for both backends. Large files are memory-mapped and
+decoded in place by orjson rather than copied into a bytes object first.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any
+
+from core.constants import JSON_MMAP_MIN_BYTES
+
+
+def _import_orjson() -> Any:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+_ORJSON: Any = _import_orjson()
+
+
+def dumps_pretty_json(payload: object) -> bytes:
+    """Encode payload as two-space indented UTF-8 JSON with a trailing newline.
+
+    Both backends leave non-ASCII text unescaped, so files are byte-identical
+    whether or not orjson is installed.
+
+    Args:
+        payload: JSON-serializable value with string mapping keys.
+
+    Returns:
+        Encoded JSON bytes.
+    """
+    if _ORJSON is not None:
+        options = _ORJSON.OPT_INDENT_2 | _ORJSON.OPT_APPEND_NEWLINE
+        return bytes(_ORJSON.dumps(payload, option=options))
+    return (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def dumps_json_line(payload: object) -> bytes:
+    """Encode payload as one compact, key-sorted UTF-8 JSON line.
+
+    Both backends emit the same separators and leave non-ASCII text
+    unescaped, so lines match whether or not orjson is installed.
+
+    Args:
+        payload: JSON-serializable value with string mapping keys.
+
+    Returns:
+        Encoded JSON bytes ending in a newline.
+    """
+    if _ORJSON is not None:
+        options = _ORJSON.OPT_SORT_KEYS | _ORJSON.OPT_APPEND_NEWLINE
+        return bytes(_ORJSON.dumps(payload, option=options))
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return (encoded + "\n").encode("utf-8")
+
+
+def loads_json(raw_payload: bytes | str) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        raw_payload: UTF-8 encoded bytes or text.
+
+    Returns:
+        Decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON.
+    """
+    if _ORJSON is not None:
+        return _ORJSON.loads(raw_payload)
+    return json.loads(raw_payload)
+
+
+def load_json_file(json_path: Path) -> Any:
+    """Decode a JSON file, memory-mapping large files when orjson is available.
+
+    Args:
+        json_path: Path to a UTF-8 JSON document.
+
+    Returns:
+        Decoded JSON value.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    with json_path.open("rb") as json_file:
+        file_size = os.fstat(json_file.fileno()).st_size
+        if _ORJSON is None or file_size < JSON_MMAP_MIN_BYTES:
+            return loads_json(json_file.read())
+        # Context managers exit in reverse order, so the view is released
+        # before the mapping closes.
+        with (
+            mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file,
+            memoryview(mapped_file) as mapped_view,
+        ):
+            return _ORJSON.loads(mapped_view)
@@ -36,6 +36,22 @@ def get_logger(name: str) -> Any:
     return structlog.get_logger(name)
 
 
+def is_info_enabled(logger: Any) -> bool:
+    """Return whether a logger from get_logger would emit info events.
+
+    Args:
+        logger: Logger returned by get_logger.
+
+    Returns:
+        False only when the logger reports info level as disabled. Loggers
+        without a level check, such as structlog's default, always emit.
+    """
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    if is_enabled_for is None:
+        return True
+    return bool(is_enabled_for(logging.INFO))
+
+
 def _get_standard_logger(name: str) -> Any:
     """Create a stdlib logger fallback.
 
@@ -61,6 +77,10 @@ class _StructuredStandardLogger:
     def __init__(self, logger: logging.Logger) -> None:
         self._logger = logger
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Return whether events at this level would be emitted."""
+        return self._logger.isEnabledFor(level)
+
     def debug(self, event: str, **fields: object) -> None:
         """Log a debug-level structured event."""
         self._logger.debug(_format_event(event, fields))
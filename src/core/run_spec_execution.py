@@ -37,7 +37,8 @@ from core.run_spec_fields import (
     required_string,
 )
 from core.run_spec_option_builders import build_training_options_for_run_spec
-from core.types import IngestOptions, MetadataFilter, TrainingOptions, TrainingRunResult
+from core.training_types import TrainingRunResult
+from core.types import IngestOptions, MetadataFilter, TrainingOptions
 
 
 class RunSpecDatasetHandle(Protocol):
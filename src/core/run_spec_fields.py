@@ -10,15 +10,20 @@ from typing import Mapping, cast
 
 from core.constants import (
     DEFAULT_POSITION_EMBEDDING_TYPE,
+    DEFAULT_TRAIN_CHECKPOINT_FORMAT,
+    DEFAULT_TRAIN_COMPILE_MODE,
     DEFAULT_TRAIN_OPTIMIZER_TYPE,
     DEFAULT_TRAIN_PRECISION_MODE,
     DEFAULT_TRAIN_SCHEDULER_TYPE,
     SUPPORTED_POSITION_EMBEDDING_TYPES,
+    SUPPORTED_TRAIN_CHECKPOINT_FORMATS,
+    SUPPORTED_TRAIN_COMPILE_MODES,
     SUPPORTED_TRAIN_OPTIMIZER_TYPES,
     SUPPORTED_TRAIN_PRECISION_MODES,
     SUPPORTED_TRAIN_SCHEDULER_TYPES,
 )
 from core.errors import ForgeRunSpecError
+from core.training_types import CheckpointFormat, CompileMode
 from core.types import OptimizerType, PositionEmbeddingType, PrecisionMode, SchedulerType
 
 
@@ -126,6 +131,17 @@ def parse_precision_mode(args: Mapping[str, object]) -> PrecisionMode:
     raise ForgeRunSpecError(f"Invalid precision_mode '{value}'. Use one of: {supported_rows}.")
 
 
+def parse_compile_mode(args: Mapping[str, object]) -> CompileMode:
+    """Parse optional torch.compile mode from step arguments."""
+    value = optional_string(args, "compile_mode")
+    if value is None:
+        return cast(CompileMode, DEFAULT_TRAIN_COMPILE_MODE)
+    if value in SUPPORTED_TRAIN_COMPILE_MODES:
+        return cast(CompileMode, value)
+    supported_rows = ", ".join(SUPPORTED_TRAIN_COMPILE_MODES)
+    raise ForgeRunSpecError(f"Invalid compile_mode '{value}'. Use one of: {supported_rows}.")
+
+
 def parse_scheduler_type(args: Mapping[str, object]) -> SchedulerType:
     """Parse optional scheduler type from step arguments."""
     value = optional_string(args, "scheduler_type")
@@ -135,3 +151,14 @@ def parse_scheduler_type(args: Mapping[str, object]) -> SchedulerType:
         return cast(SchedulerType, value)
     supported_rows = ", ".join(SUPPORTED_TRAIN_SCHEDULER_TYPES)
     raise ForgeRunSpecError(f"Invalid scheduler_type '{value}'. Use one of: {supported_rows}.")
+
+
+def parse_checkpoint_format(args: Mapping[str, object]) -> CheckpointFormat:
+    """Parse optional checkpoint format from step arguments."""
+    value = optional_string(args, "checkpoint_format")
+    if value is None:
+        return cast(CheckpointFormat, DEFAULT_TRAIN_CHECKPOINT_FORMAT)
+    if value in SUPPORTED_TRAIN_CHECKPOINT_FORMATS:
+        return cast(CheckpointFormat, value)
+    supported_rows = ", ".join(SUPPORTED_TRAIN_CHECKPOINT_FORMATS)
+    raise ForgeRunSpecError(f"Invalid checkpoint_format '{value}'. Use one of: {supported_rows}.")
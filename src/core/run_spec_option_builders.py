@@ -10,11 +10,13 @@ from typing import Mapping
 
 from core.constants import (
     DEFAULT_BATCH_SIZE,
+    DEFAULT_LENGTH_BUCKET_COUNT,
     DEFAULT_MAX_TOKEN_LENGTH,
     DEFAULT_TRAIN_ATTENTION_HEADS,
     DEFAULT_TRAIN_CHECKPOINT_EVERY_EPOCHS,
     DEFAULT_TRAIN_DROPOUT,
     DEFAULT_TRAIN_EPOCHS,
+    DEFAULT_TRAIN_GRADIENT_ACCUMULATION_STEPS,
     DEFAULT_TRAIN_HIDDEN_DIM,
     DEFAULT_TRAIN_LEARNING_RATE,
     DEFAULT_TRAIN_MAX_CHECKPOINT_FILES,
@@ -36,6 +38,8 @@ from core.run_spec_fields import (
     optional_bool,
     optional_int,
     optional_string,
+    parse_checkpoint_format,
+    parse_compile_mode,
     parse_optimizer_type,
     parse_position_embedding_type,
     parse_precision_mode,
@@ -64,6 +68,10 @@ def build_training_options_for_run_spec(
         epochs=int_with_default(args, "epochs", DEFAULT_TRAIN_EPOCHS),
         learning_rate=float_with_default(args, "learning_rate", DEFAULT_TRAIN_LEARNING_RATE),
         precision_mode=parse_precision_mode(args),
+        compile_model=optional_bool(args, "compile_model", default_value=False),
+        compile_mode=parse_compile_mode(args),
+        gradient_checkpointing=optional_bool(args, "gradient_checkpointing", default_value=False),
+        allow_tf32=optional_bool(args, "allow_tf32", default_value=True),
         optimizer_type=parse_optimizer_type(args),
         weight_decay=float_with_default(args, "weight_decay", DEFAULT_TRAIN_WEIGHT_DECAY),
         sgd_momentum=float_with_default(args, "sgd_momentum", DEFAULT_TRAIN_SGD_MOMENTUM),
@@ -81,6 +89,16 @@ def build_training_options_for_run_spec(
             DEFAULT_TRAIN_SCHEDULER_ETA_MIN,
         ),
         batch_size=int_with_default(args, "batch_size", DEFAULT_BATCH_SIZE),
+        gradient_accumulation_steps=int_with_default(
+            args,
+            "gradient_accumulation_steps",
+            DEFAULT_TRAIN_GRADIENT_ACCUMULATION_STEPS,
+        ),
+        length_bucket_count=int_with_default(
+            args,
+            "length_bucket_count",
+            DEFAULT_LENGTH_BUCKET_COUNT,
+        ),
         max_token_length=int_with_default(args, "max_token_length", DEFAULT_MAX_TOKEN_LENGTH),
         validation_split=float_with_default(
             args,
@@ -107,6 +125,9 @@ def build_training_options_for_run_spec(
             "max_checkpoint_files",
             DEFAULT_TRAIN_MAX_CHECKPOINT_FILES,
         ),
+        checkpoint_format=parse_checkpoint_format(args),
+        async_checkpoint=optional_bool(args, "async_checkpoint", default_value=False),
+        checkpoint_fsync=optional_bool(args, "checkpoint_fsync", default_value=False),
         resume_checkpoint_path=optional_string(args, "resume_checkpoint_path"),
         progress_log_interval_steps=int_with_default(
             args,
@@ -0,0 +1,51 @@
+"""Typed models for training data loading and run results.
+
+This module holds the torch.compile mode and checkpoint format literals,
+the dataloader options, and the artifact summary returned by a training
+run.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+from core.constants import DEFAULT_LENGTH_BUCKET_COUNT
+
+CompileMode = Literal["default", "reduce-overhead", "max-autotune"]
+CheckpointFormat = Literal["torch", "safetensors"]
+
+
+@dataclass(frozen=True)
+class DataLoaderOptions:
+    """PyTorch serving options.
+
+    Attributes:
+        batch_size: Number of tokenized records per batch.
+        shuffle: Whether to shuffle records before yielding.
+        shuffle_buffer_size: Buffer size for shuffle algorithm.
+        max_token_length: Truncation length for tokenized records.
+        length_bucket_count: Length buckets used to group similar-length
+            sequences into batches when shuffling; 1 disables bucketing.
+    """
+
+    batch_size: int
+    shuffle: bool
+    shuffle_buffer_size: int
+    max_token_length: int
+    length_bucket_count: int = DEFAULT_LENGTH_BUCKET_COUNT
+
+
+@dataclass(frozen=True)
+class TrainingRunResult:
+    """Training command output artifact paths and summary metadata."""
+
+    model_path: str
+    history_path: str
+    plot_path: str | None
+    epochs_completed: int
+    checkpoint_dir: str | None = None
+    best_checkpoint_path: str | None = None
+    resumed_from_checkpoint: str | None = None
+    run_id: str | None = None
+    artifact_contract_path: str | None = None
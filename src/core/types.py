@@ -12,13 +12,17 @@ from typing import Literal, Mapping
 
 from core.constants import (
     DEFAULT_BATCH_SIZE,
+    DEFAULT_LENGTH_BUCKET_COUNT,
     DEFAULT_MAX_TOKEN_LENGTH,
     DEFAULT_POSITION_EMBEDDING_TYPE,
     DEFAULT_QUALITY_MODEL,
     DEFAULT_TRAIN_ATTENTION_HEADS,
     DEFAULT_TRAIN_CHECKPOINT_EVERY_EPOCHS,
+    DEFAULT_TRAIN_CHECKPOINT_FORMAT,
+    DEFAULT_TRAIN_COMPILE_MODE,
     DEFAULT_TRAIN_DROPOUT,
     DEFAULT_TRAIN_EPOCHS,
+    DEFAULT_TRAIN_GRADIENT_ACCUMULATION_STEPS,
     DEFAULT_TRAIN_HIDDEN_DIM,
     DEFAULT_TRAIN_LEARNING_RATE,
     DEFAULT_TRAIN_MAX_CHECKPOINT_FILES,
@@ -37,6 +41,7 @@ from core.constants import (
     DEFAULT_TRAIN_VALIDATION_SPLIT,
     DEFAULT_TRAIN_WEIGHT_DECAY,
 )
+from core.training_types import CheckpointFormat, CompileMode
 
 PositionEmbeddingType = Literal["learned", "sinusoidal"]
 PrecisionMode = Literal["auto", "fp32", "fp16", "bf16"]
@@ -199,23 +204,6 @@ class TrainingExportRequest:
     include_metadata: bool = False
 
 
-@dataclass(frozen=True)
-class DataLoaderOptions:
-    """PyTorch serving options.
-
-    Attributes:
-        batch_size: Number of tokenized records per batch.
-        shuffle: Whether to shuffle records before yielding.
-        shuffle_buffer_size: Buffer size for shuffle algorithm.
-        max_token_length: Truncation length for tokenized records.
-    """
-
-    batch_size: int
-    shuffle: bool
-    shuffle_buffer_size: int
-    max_token_length: int
-
-
 @dataclass(frozen=True)
 class TrainingOptions:
     """Training command options used by CLI, SDK, and run-spec workflows."""
@@ -229,6 +217,10 @@ class TrainingOptions:
     epochs: int = DEFAULT_TRAIN_EPOCHS
     learning_rate: float = DEFAULT_TRAIN_LEARNING_RATE
     precision_mode: PrecisionMode = DEFAULT_TRAIN_PRECISION_MODE
+    compile_model: bool = False
+    compile_mode: CompileMode = DEFAULT_TRAIN_COMPILE_MODE
+    gradient_checkpointing: bool = False
+    allow_tf32: bool = True
     optimizer_type: OptimizerType = DEFAULT_TRAIN_OPTIMIZER_TYPE
     weight_decay: float = DEFAULT_TRAIN_WEIGHT_DECAY
     sgd_momentum: float = DEFAULT_TRAIN_SGD_MOMENTUM
@@ -238,6 +230,8 @@ class TrainingOptions:
     scheduler_t_max_epochs: int | None = DEFAULT_TRAIN_SCHEDULER_T_MAX_EPOCHS
     scheduler_eta_min: float = DEFAULT_TRAIN_SCHEDULER_ETA_MIN
     batch_size: int = DEFAULT_BATCH_SIZE
+    gradient_accumulation_steps: int = DEFAULT_TRAIN_GRADIENT_ACCUMULATION_STEPS
+    length_bucket_count: int = DEFAULT_LENGTH_BUCKET_COUNT
     max_token_length: int = DEFAULT_MAX_TOKEN_LENGTH
     validation_split: float = DEFAULT_TRAIN_VALIDATION_SPLIT
     hidden_dim: int = DEFAULT_TRAIN_HIDDEN_DIM
@@ -252,9 +246,20 @@ class TrainingOptions:
     checkpoint_every_epochs: int = DEFAULT_TRAIN_CHECKPOINT_EVERY_EPOCHS
     save_best_checkpoint: bool = True
     max_checkpoint_files: int | None = DEFAULT_TRAIN_MAX_CHECKPOINT_FILES
+    checkpoint_format: CheckpointFormat = DEFAULT_TRAIN_CHECKPOINT_FORMAT
+    async_checkpoint: bool = False
+    checkpoint_fsync: bool = False
     resume_checkpoint_path: str | None = None
     progress_log_interval_steps: int = DEFAULT_TRAIN_PROGRESS_LOG_INTERVAL_STEPS
 
+    def to_dict(self) -> dict[str, object]:
+        """Serialize options into a JSON-friendly mapping.
+
+        Every field is a scalar or string, so a shallow copy of the instance
+        dict matches ``asdict`` without its recursive deep copy.
+        """
+        return dict(vars(self))
+
 
 @dataclass(frozen=True)
 class EpochMetric:
@@ -286,18 +291,3 @@ class BatchLossMetric:
     batch_index: int
     global_step: int
     train_loss: float
-
-
-@dataclass(frozen=True)
-class TrainingRunResult:
-    """Training command output artifact paths and summary metadata."""
-
-    model_path: str
-    history_path: str
-    plot_path: str | None
-    epochs_completed: int
-    checkpoint_dir: str | None = None
-    best_checkpoint_path: str | None = None
-    resumed_from_checkpoint: str | None = None
-    run_id: str | None = None
-    artifact_contract_path: str | None = None
@@ -8,7 +8,8 @@ from typing import Callable
 
 from core.chat_types import ChatOptions
 from core.errors import ForgeVerificationError
-from core.types import IngestOptions, MetadataFilter, TrainingOptions, TrainingRunResult
+from core.training_types import TrainingRunResult
+from core.types import IngestOptions, MetadataFilter, TrainingOptions
 from core.verification_types import VerificationMode, VerificationRuntime
 from store.dataset_sdk import ForgeClient
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
-from core.types import TrainingRunResult
+from core.training_types import TrainingRunResult
 from store.dataset_sdk import ForgeClient
 
 VerificationMode = Literal["quick", "full"]
@@ -7,14 +7,8 @@ It re-exports the primary client and typed option models.
 from __future__ import annotations
 
 from core.config import ForgeConfig
-from core.types import (
-    DataLoaderOptions,
-    IngestOptions,
-    MetadataFilter,
-    TrainingExportRequest,
-    TrainingOptions,
-    TrainingRunResult,
-)
+from core.training_types import DataLoaderOptions, TrainingRunResult
+from core.types import IngestOptions, MetadataFilter, TrainingExportRequest, TrainingOptions
 from serve.training_dataloader import build_default_dataloader_options, create_pytorch_dataloader
 from serve.training_runner import run_training
 from store.dataset_sdk import Dataset, ForgeClient
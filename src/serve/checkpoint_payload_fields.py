@@ -0,0 +1,76 @@
+"""Typed field readers for training checkpoint payloads.
+
+This module validates the fields of a loaded checkpoint mapping so resume
+logic can report exactly which field is missing or malformed.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Mapping
+
+from core.errors import ForgeServeError
+
+
+def read_mapping_field(
+    payload: Mapping[str, object], key: str, checkpoint_path: Path
+) -> Mapping[str, object]:
+    """Read one required mapping field from a checkpoint payload."""
+    value = payload.get(key)
+    if isinstance(value, Mapping):
+        return value
+    raise ForgeServeError(
+        f"Invalid checkpoint at {checkpoint_path}: missing mapping field '{key}'."
+    )
+
+
+def read_epoch_field(payload: Mapping[str, object], checkpoint_path: Path) -> int:
+    """Read the completed epoch index from a checkpoint payload."""
+    raw_epoch = payload.get("epoch")
+    if isinstance(raw_epoch, int) and raw_epoch >= 1:
+        return raw_epoch
+    raise ForgeServeError(
+        f"Invalid checkpoint at {checkpoint_path}: field 'epoch' must be integer >= 1."
+    )
+
+
+def read_global_step_field(payload: Mapping[str, object], checkpoint_path: Path) -> int:
+    """Read the global optimizer step from a checkpoint payload."""
+    raw_global_step = payload.get("global_step")
+    if isinstance(raw_global_step, int) and raw_global_step >= 0:
+        return raw_global_step
+    raise ForgeServeError(
+        f"Invalid checkpoint at {checkpoint_path}: field 'global_step' must be integer >= 0."
+    )
+
+
+def read_optional_float_field(
+    payload: Mapping[str, object],
+    key: str,
+    checkpoint_path: Path,
+) -> float | None:
+    """Read one optional numeric field from a checkpoint payload."""
+    raw_value = payload.get(key)
+    if raw_value is None:
+        return None
+    if isinstance(raw_value, (float, int)):
+        return float(raw_value)
+    raise ForgeServeError(
+        f"Invalid checkpoint at {checkpoint_path}: field '{key}' must be numeric."
+    )
+
+
+def read_optional_mapping_field(
+    payload: Mapping[str, object],
+    key: str,
+    checkpoint_path: Path,
+) -> Mapping[str, object] | None:
+    """Read one optional mapping field from a checkpoint payload."""
+    raw_value = payload.get(key)
+    if raw_value is None:
+        return None
+    if isinstance(raw_value, Mapping):
+        return raw_value
+    raise ForgeServeError(
+        f"Invalid checkpoint at {checkpoint_path}: field '{key}' must be a mapping."
+    )
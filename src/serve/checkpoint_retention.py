@@ -0,0 +1,59 @@
+"""Retention pruning for epoch checkpoint files.
+
+This module lists epoch checkpoints in a checkpoint directory and removes
+the oldest ones, with their model tensor sidecars, beyond the configured
+retention limit.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from pathlib import Path
+
+from core.constants import CHECKPOINT_PRUNE_MAX_WORKERS
+from core.errors import ForgeServeError
+from serve.checkpoint_safetensors import model_tensors_path
+
+_EPOCH_CHECKPOINT_PATTERN = re.compile(r"epoch-(\d+)\.pt")
+
+
+def prune_epoch_checkpoints(checkpoint_dir: Path, max_files: int | None) -> None:
+    """Remove oldest epoch checkpoints to satisfy retention policy."""
+    if max_files is None:
+        return
+    epoch_files = _list_epoch_checkpoints(checkpoint_dir)
+    if len(epoch_files) <= max_files:
+        return
+    stale_paths = epoch_files[: len(epoch_files) - max_files]
+    # Unlinks are independent syscalls; on network filesystems each one is
+    # latency-bound, so dispatching them concurrently overlaps the round trips.
+    worker_count = min(CHECKPOINT_PRUNE_MAX_WORKERS, len(stale_paths))
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        list(executor.map(_remove_epoch_checkpoint, stale_paths))
+
+
+def _list_epoch_checkpoints(checkpoint_dir: Path) -> list[Path]:
+    # os.scandir reads names in batches without a stat per entry, which keeps
+    # listing cheap in directories holding many historical checkpoints.
+    epoch_files: list[tuple[int, str]] = []
+    with os.scandir(checkpoint_dir) as entries:
+        for entry in entries:
+            match = _EPOCH_CHECKPOINT_PATTERN.fullmatch(entry.name)
+            if match is not None:
+                epoch_files.append((int(match.group(1)), entry.path))
+    epoch_files.sort(key=itemgetter(0))
+    return [Path(path) for _, path in epoch_files]
+
+
+def _remove_epoch_checkpoint(stale_path: Path) -> None:
+    try:
+        stale_path.unlink()
+        model_tensors_path(stale_path).unlink(missing_ok=True)
+    except OSError as error:
+        raise ForgeServeError(
+            f"Failed to remove old checkpoint {stale_path}: {error}. "
+            "Check output directory permissions and retry."
+        ) from error
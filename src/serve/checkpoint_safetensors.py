@@ -0,0 +1,102 @@
+"""Safetensors persistence for checkpoint model tensors.
+
+This module stores the model weights of training checkpoints in the
+safetensors format so resume and fine-tuning can memory-map tensors directly
+onto the target device instead of unpickling them. Optimizer and scheduler
+state stay in the torch checkpoint payload because they hold nested
+non-tensor structures that safetensors cannot represent.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Mapping
+
+from core.constants import CHECKPOINT_MODEL_TENSORS_SUFFIX
+from core.errors import ForgeDependencyError, ForgeServeError
+
+MODEL_TENSORS_FILE_FIELD = "model_state_file"
+
+
+def model_tensors_path(checkpoint_path: Path) -> Path:
+    """Return the safetensors sidecar path for one checkpoint file."""
+    return checkpoint_path.with_suffix(CHECKPOINT_MODEL_TENSORS_SUFFIX)
+
+
+def save_model_tensors(model: Any, tensors_path: Path) -> None:
+    """Write model weights to a safetensors file.
+
+    Tensors that share storage (for example tied embedding and output
+    weights) are written once; safetensors restores the aliasing on load.
+
+    Raises:
+        ForgeDependencyError: If safetensors is not installed.
+        ForgeServeError: If the file cannot be written.
+    """
+    safetensors_torch = _import_safetensors_torch()
+    try:
+        safetensors_torch.save_model(model, str(tensors_path))
+    except (OSError, RuntimeError, ValueError) as error:
+        raise ForgeServeError(
+            f"Failed to save checkpoint model tensors at {tensors_path}: {error}. "
+            "Check available disk space and directory permissions."
+        ) from error
+
+
+def load_model_tensors(model: Any, tensors_path: Path, device: Any) -> None:
+    """Load safetensors model weights into a model on the target device.
+
+    Raises:
+        ForgeDependencyError: If safetensors is not installed.
+        ForgeServeError: If the file is missing or does not match the model.
+    """
+    _ensure_tensors_file_exists(tensors_path)
+    safetensors_torch = _import_safetensors_torch()
+    try:
+        safetensors_torch.load_model(model, str(tensors_path), strict=True, device=str(device))
+    except (OSError, RuntimeError) as error:
+        raise ForgeServeError(
+            f"Failed to apply model tensors from {tensors_path}: {error}. "
+            "Use a checkpoint created for the same model setup."
+        ) from error
+
+
+def read_model_tensors(tensors_path: Path, device: Any) -> Mapping[str, object]:
+    """Read safetensors model weights as a state dict on the target device.
+
+    Raises:
+        ForgeDependencyError: If safetensors is not installed.
+        ForgeServeError: If the file is missing or unreadable.
+    """
+    _ensure_tensors_file_exists(tensors_path)
+    safetensors_torch = _import_safetensors_torch()
+    try:
+        state_dict: Mapping[str, object] = safetensors_torch.load_file(
+            str(tensors_path),
+            device=str(device),
+        )
+    except (OSError, RuntimeError) as error:
+        raise ForgeServeError(
+            f"Failed to read model tensors from {tensors_path}: {error}. "
+            "Verify checkpoint file integrity and compatibility."
+        ) from error
+    return state_dict
+
+
+def _ensure_tensors_file_exists(tensors_path: Path) -> None:
+    if not tensors_path.exists():
+        raise ForgeServeError(
+            f"Checkpoint model tensors not found at {tensors_path}. "
+            "Keep the .safetensors file beside its checkpoint when copying checkpoints."
+        )
+
+
+def _import_safetensors_torch() -> Any:
+    try:
+        import safetensors.torch as safetensors_torch
+    except ImportError as error:
+        raise ForgeDependencyError(
+            "Checkpoint format 'safetensors' requires safetensors, but it is not installed. "
+            "Install with pip install -e .[safetensors] or use --checkpoint-format torch."
+        ) from error
+    return safetensors_torch
@@ -0,0 +1,56 @@
+"""Pinned host staging for CUDA checkpoint state.
+
+This module copies CUDA model tensors into pinned host tensors that are
+allocated once and reused across checkpoints. Serializing from these
+tensors avoids a fresh pageable host allocation for every parameter on
+every save, and pinned memory lets the device-to-host copies run as
+non-blocking DMA transfers.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+
+class PinnedStagingBuffers:
+    """Reusable pinned host tensors keyed by state-dict entry name."""
+
+    def __init__(self) -> None:
+        self._host_tensors: dict[str, Any] = {}
+
+    def stage(self, torch_module: Any, state_dict: Mapping[str, Any]) -> dict[str, Any]:
+        """Copy CUDA entries into pinned host tensors and return the staged mapping.
+
+        Non-CUDA entries are passed through unchanged. Entries that alias the
+        same device memory are staged into one host tensor, so tied weights
+        still serialize as a single storage. Staged tensors are overwritten by
+        the next call, so callers must serialize them before staging again.
+        """
+        staged: dict[str, Any] = {}
+        staged_by_source: dict[tuple[int, tuple[int, ...], Any], Any] = {}
+        for name, tensor in state_dict.items():
+            if not getattr(tensor, "is_cuda", False):
+                staged[name] = tensor
+                continue
+            source_key = (tensor.data_ptr(), tuple(tensor.shape), tensor.dtype)
+            host_tensor = staged_by_source.get(source_key)
+            if host_tensor is None:
+                host_tensor = self._host_tensor(torch_module, name, tensor)
+                host_tensor.copy_(tensor, non_blocking=True)
+                staged_by_source[source_key] = host_tensor
+            staged[name] = host_tensor
+        if staged_by_source:
+            torch_module.cuda.current_stream().synchronize()
+        return staged
+
+    def _host_tensor(self, torch_module: Any, name: str, tensor: Any) -> Any:
+        host_tensor = self._host_tensors.get(name)
+        reusable = (
+            host_tensor is not None
+            and host_tensor.shape == tensor.shape
+            and host_tensor.dtype == tensor.dtype
+        )
+        if not reusable:
+            host_tensor = torch_module.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+            self._host_tensors[name] = host_tensor
+        return host_tensor
@@ -0,0 +1,200 @@
+"""Ordered checkpoint file writer for training loops.
+
+This module serializes checkpoint payloads into memory and runs the disk
+writes either inline or on a single background thread. One worker keeps
+writes and retention pruning in submission order, so pruning never races
+with an in-flight save while the next epoch computes on the main thread.
+After a background job fails, later queued jobs are skipped and the next
+submit raises, so training stops instead of running on without saves.
+Notifications such as user hooks never run on the worker: they wait for
+the writes queued before them and then run on the training thread when
+it flushes them at an epoch boundary or waits for the writer.
+
+Pickling happens on the training thread before a write is queued, so the
+worker only runs file writes and fsync, which release the GIL. A worker
+process would not remove any GIL-bound work and would add a copy of every
+serialized checkpoint across the process boundary.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+from core.constants import CHECKPOINT_WRITER_THREAD_NAME
+from core.errors import ForgeServeError
+from core.logging_config import get_logger
+from serve.checkpoint_staging import PinnedStagingBuffers
+
+_LOGGER = get_logger(__name__)
+
+
+class CheckpointWriter:
+    """Run checkpoint writes inline or on one ordered background worker.
+
+    The writer also owns the run's pinned staging buffers, so CUDA model
+    state is copied into the same host tensors on every save.
+    """
+
+    def __init__(self, background: bool) -> None:
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=CHECKPOINT_WRITER_THREAD_NAME)
+            if background
+            else None
+        )
+        self._pending: list[Future[None]] = []
+        self._notifications: list[tuple[list[Future[None]], Callable[[], None]]] = []
+        self._failure: BaseException | None = None
+        self._staging_buffers = PinnedStagingBuffers()
+
+    def stage_model_state(
+        self, torch_module: Any, model_state: Mapping[str, Any]
+    ) -> dict[str, Any]:
+        """Copy CUDA model state into this run's reusable pinned host tensors."""
+        return self._staging_buffers.stage(torch_module, model_state)
+
+    def submit(self, write: Callable[[], None]) -> Future[None]:
+        """Run one write now, or queue it behind earlier background writes.
+
+        Raises:
+            ForgeServeError: If an earlier background write already failed.
+        """
+        self._raise_if_failed()
+        if self._executor is None:
+            write()
+            completed: Future[None] = Future()
+            completed.set_result(None)
+            return completed
+        future = self._executor.submit(self._run_unless_failed, write)
+        self._pending.append(future)
+        return future
+
+    def notify_after_writes(self, notify: Callable[[], None]) -> None:
+        """Call notify on the training thread once every queued write finishes.
+
+        Inline writers have nothing in flight and notify immediately;
+        background writers defer the call to flush_notifications or wait.
+        """
+        if self._executor is None:
+            notify()
+            return
+        self._notifications.append((list(self._pending), notify))
+
+    def flush_notifications(self) -> None:
+        """Run deferred notifications on this thread after their writes finish."""
+        notifications, self._notifications = self._notifications, []
+        for futures, notify in notifications:
+            for future in futures:
+                future.result()
+            notify()
+
+    def wait(self) -> None:
+        """Block until queued writes finish, run notifications, and re-raise failures."""
+        self.flush_notifications()
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        """Stop the worker, logging failures of writes nobody waited for."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            error = future.exception()
+            if error is not None:
+                _LOGGER.error("checkpoint_write_failed", error=str(error))
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _run_unless_failed(self, write: Callable[[], None]) -> None:
+        """Run one queued job on the worker unless an earlier job failed."""
+        if self._failure is not None:
+            return
+        try:
+            write()
+        except BaseException as error:
+            self._failure = error
+            raise
+
+    def _raise_if_failed(self) -> None:
+        """Surface an earlier background failure on the training thread."""
+        if self._failure is not None:
+            raise ForgeServeError(
+                f"Background checkpoint write failed: {self._failure}. "
+                "Check available disk space and directory permissions."
+            ) from self._failure
+
+
+def serialize_checkpoint_payload(
+    torch_module: Any,
+    checkpoint_path: Path,
+    payload: object,
+) -> io.BytesIO:
+    """Serialize a checkpoint payload into an in-memory buffer.
+
+    Raises:
+        ForgeServeError: If the payload cannot be serialized.
+    """
+    payload_buffer = io.BytesIO()
+    try:
+        torch_module.save(payload, payload_buffer)
+    except (OSError, RuntimeError) as error:
+        raise ForgeServeError(
+            f"Failed to serialize checkpoint for {checkpoint_path}: {error}. "
+            "Check that model and optimizer state contain only serializable values."
+        ) from error
+    return payload_buffer
+
+
+def write_checkpoint_bytes(
+    checkpoint_path: Path,
+    payload_buffer: io.BytesIO,
+    fsync: bool,
+) -> None:
+    """Write a serialized checkpoint with one write call, optionally fsynced.
+
+    Raises:
+        ForgeServeError: If the file cannot be written.
+    """
+    try:
+        # A best checkpoint may be a hard link to an epoch file; unlinking
+        # first keeps a rewrite of one name from truncating the other.
+        checkpoint_path.unlink(missing_ok=True)
+        with checkpoint_path.open("wb") as checkpoint_file:
+            checkpoint_file.write(payload_buffer.getbuffer())
+            if fsync:
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+    except OSError as error:
+        raise ForgeServeError(
+            f"Failed to save checkpoint at {checkpoint_path}: {error}. "
+            "Check available disk space and directory permissions."
+        ) from error
+
+
+def link_checkpoint_file(source_path: Path, link_path: Path) -> None:
+    """Expose a written checkpoint under a second name without rewriting it.
+
+    A hard link is tried first and a file copy is used where links are not
+    supported. The new name is swapped in with one rename, so readers never
+    see a partial file.
+
+    Raises:
+        ForgeServeError: If the second checkpoint name cannot be created.
+    """
+    staging_path = link_path.with_name(f".{link_path.name}.tmp")
+    try:
+        staging_path.unlink(missing_ok=True)
+        try:
+            os.link(source_path, staging_path)
+        except OSError:
+            shutil.copyfile(source_path, staging_path)
+        os.replace(staging_path, link_path)
+    except OSError as error:
+        raise ForgeServeError(
+            f"Failed to save checkpoint at {link_path}: {error}. "
+            "Check available disk space and directory permissions."
+        ) from error
@@ -6,7 +6,10 @@ It keeps accelerator detection consistent across serve components.
 
 from __future__ import annotations
 
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from core.constants import CUDNN_BENCHMARK_MAX_INPUT_SHAPES
 
 
 def resolve_execution_device(torch_module: Any) -> Any:
@@ -31,3 +34,28 @@ def is_mps_available(torch_module: Any) -> bool:
     if not callable(probe):
         return False
     return bool(probe())
+
+
+@contextmanager
+def cudnn_benchmark_scope(torch_module: Any, device: Any, input_shape_count: int) -> Iterator[bool]:
+    """Turn on the cuDNN autotuner for one CUDA run with few distinct input shapes.
+
+    The autotuner benchmarks kernels once per new input shape, so it pays
+    off only when shapes repeat; runs with many input shapes keep the
+    default heuristics. The process-wide flag is restored on exit, so a
+    later run starts from the caller's setting. Yields whether the
+    autotuner was enabled.
+    """
+    if getattr(device, "type", str(device)) != "cuda":
+        yield False
+        return
+    if input_shape_count > CUDNN_BENCHMARK_MAX_INPUT_SHAPES:
+        yield False
+        return
+    cudnn = torch_module.backends.cudnn
+    previous_benchmark = cudnn.benchmark
+    cudnn.benchmark = True
+    try:
+        yield True
+    finally:
+        cudnn.benchmark = previous_benchmark
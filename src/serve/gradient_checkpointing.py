@@ -0,0 +1,92 @@
+"""Optional activation checkpointing for training models.
+
+This module trades compute for memory: instead of keeping every
+transformer block's activations alive until backward, each block's
+forward is rerun during backward. Peak activation memory then scales
+with one block rather than the whole stack, which allows larger batches
+on memory-bound models. Recomputation only happens in training mode
+with autograd enabled, so validation passes run the plain forward.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from core.logging_config import get_logger
+from core.types import TrainingOptions
+
+_LOGGER = get_logger(__name__)
+
+
+def apply_gradient_checkpointing(
+    torch_module: Any,
+    model: Any,
+    options: TrainingOptions,
+) -> None:
+    """Enable activation checkpointing in place when gradient_checkpointing is set.
+
+    Models that expose ``gradient_checkpointing_enable`` (for example
+    Hugging Face transformers) use their own implementation. Otherwise
+    every module held in an ``nn.ModuleList`` is treated as a block, which
+    covers ``TransformerEncoder.layers`` in the default model and the usual
+    ``blocks``/``layers`` lists in custom architectures. Must run before
+    compilation and DDP wrapping so both see the checkpointed forwards.
+    """
+    if not options.gradient_checkpointing:
+        return
+    enable_method = getattr(model, "gradient_checkpointing_enable", None)
+    if callable(enable_method):
+        enable_method()
+        _LOGGER.info(
+            "training_gradient_checkpointing_enabled",
+            dataset_name=options.dataset_name,
+            method="model",
+        )
+        return
+    block_count = _checkpoint_block_lists(torch_module, model)
+    if block_count == 0:
+        _LOGGER.warning(
+            "training_gradient_checkpointing_skipped",
+            dataset_name=options.dataset_name,
+            reason="no_module_list_blocks_found",
+        )
+        return
+    _LOGGER.info(
+        "training_gradient_checkpointing_enabled",
+        dataset_name=options.dataset_name,
+        method="block_forward",
+        block_count=block_count,
+    )
+
+
+def _checkpoint_block_lists(torch_module: Any, module: Any) -> int:
+    """Wrap each block of the outermost module lists; return the wrapped count.
+
+    Blocks are not searched further, so nested lists inside one block are
+    recomputed once as part of that block rather than checkpointed twice.
+    """
+    block_count = 0
+    for child in module.children():
+        if isinstance(child, torch_module.nn.ModuleList):
+            for block in child:
+                block.forward = _checkpointed_forward(torch_module, block, block.forward)
+                block_count += 1
+        else:
+            block_count += _checkpoint_block_lists(torch_module, child)
+    return block_count
+
+
+def _checkpointed_forward(
+    torch_module: Any,
+    block: Any,
+    forward: Callable[..., Any],
+) -> Callable[..., Any]:
+    """Build a forward that recomputes its activations during backward."""
+    checkpoint = torch_module.utils.checkpoint.checkpoint
+
+    def _forward(*args: Any, **kwargs: Any) -> Any:
+        if not (block.training and torch_module.is_grad_enabled()):
+            return forward(*args, **kwargs)
+        return checkpoint(forward, *args, use_reentrant=False, **kwargs)
+
+    return _forward
@@ -0,0 +1,49 @@
+"""Length-bucketed batch planning shared by the trainer and dataloader.
+
+Rows are split into equal-count buckets by length rank, so each batch pads
+only up to lengths similar to its own. Bucket sizes are rounded up to whole
+batches so at most one batch is partial, and batch order is shuffled
+afterwards so training still sees mixed lengths.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Callable, Iterable
+
+
+def plan_length_bucketed_batches(
+    row_indexes: Iterable[int],
+    row_length: Callable[[int], int],
+    batch_size: int,
+    bucket_count: int,
+    random_seed: int,
+) -> list[list[int]]:
+    """Group row indexes into shuffled batches of similar-length rows.
+
+    Args:
+        row_indexes: Rows to batch; ties in length keep this order.
+        row_length: Length lookup for one row index.
+        batch_size: Target batch size.
+        bucket_count: Number of equal-count length buckets.
+        random_seed: Deterministic seed for bucket and batch shuffles.
+
+    Returns:
+        Batches of row indexes.
+    """
+    ranked_rows = sorted(row_indexes, key=row_length)
+    if not ranked_rows:
+        return []
+    randomizer = random.Random(random_seed)
+    rows_per_bucket = -(-len(ranked_rows) // max(bucket_count, 1))
+    bucket_size = -(-rows_per_bucket // batch_size) * batch_size
+    batches: list[list[int]] = []
+    for bucket_start in range(0, len(ranked_rows), bucket_size):
+        bucket = ranked_rows[bucket_start : bucket_start + bucket_size]
+        randomizer.shuffle(bucket)
+        batches.extend(
+            bucket[batch_start : batch_start + batch_size]
+            for batch_start in range(0, len(bucket), batch_size)
+        )
+    randomizer.shuffle(batches)
+    return batches
@@ -0,0 +1,56 @@
+"""Optional graph compilation for training models.
+
+This module applies torch.compile to the training model when requested so
+the forward and backward passes run as fused kernels instead of eager
+per-op dispatch. Compilation is opt-in because the first steps pay a
+compile cost and not every custom architecture is traceable.
+
+The compile mode is configurable: "reduce-overhead" adds CUDA graphs to
+cut per-step launch overhead on small batches, and "max-autotune" also
+benchmarks kernel configurations, which is slower to warm up. Shapes are
+left to dynamo's automatic dynamic detection, since sequence lengths
+still vary between length-bucketed batches.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from core.logging_config import get_logger
+from core.types import TrainingOptions
+
+_LOGGER = get_logger(__name__)
+
+
+def compile_training_model(model: Any, options: TrainingOptions) -> None:
+    """Compile the training model in place when compile_model is enabled.
+
+    Module.compile is used instead of wrapping with torch.compile so the
+    model keeps its own state_dict keys; a wrapped module would prefix every
+    key with ``_orig_mod.`` and break checkpoints and chat loading. When the
+    installed torch build cannot compile, training continues in eager mode.
+    """
+    if not options.compile_model:
+        return
+    compile_method = getattr(model, "compile", None)
+    if not callable(compile_method):
+        _LOGGER.warning(
+            "training_compile_skipped",
+            dataset_name=options.dataset_name,
+            reason="compile_not_supported_by_torch_build",
+        )
+        return
+    try:
+        compile_method(mode=options.compile_mode)
+    except RuntimeError as error:
+        _LOGGER.warning(
+            "training_compile_skipped",
+            dataset_name=options.dataset_name,
+            reason=str(error),
+        )
+        return
+    _LOGGER.info(
+        "training_model_compiled",
+        dataset_name=options.dataset_name,
+        compile_mode=options.compile_mode,
+    )
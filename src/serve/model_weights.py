@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, Mapping
 
 from core.errors import ForgeDependencyError, ForgeServeError
+from serve.checkpoint_safetensors import MODEL_TENSORS_FILE_FIELD, read_model_tensors
 from serve.model_format import detect_model_format
 
 
@@ -64,6 +65,10 @@ def read_model_state_dict(
     if detect_model_format(str(resolved_path)) == "onnx":
         return _read_onnx_model_state_dict(torch_module, resolved_path, device)
     checkpoint_payload = _read_torch_checkpoint(torch_module, resolved_path, device)
+    if isinstance(checkpoint_payload, Mapping):
+        tensors_file_name = checkpoint_payload.get(MODEL_TENSORS_FILE_FIELD)
+        if isinstance(tensors_file_name, str):
+            return read_model_tensors(resolved_path.parent / tensors_file_name, device)
     return _extract_model_state(checkpoint_payload, resolved_path)
 
 
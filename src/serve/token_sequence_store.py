@@ -0,0 +1,41 @@
+"""Compact ragged storage for tokenized sequences.
+
+This module keeps tokenized records in two flat typed arrays (token values
+and row offsets) instead of a list of Python int lists. Shuffling and
+batching then operate on integer row indexes, and token lists are only
+materialized when a batch is read.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+
+class TokenSequenceStore:
+    """Append-only CSR-style store of variable-length token sequences."""
+
+    def __init__(self) -> None:
+        self._values = array("i")
+        self._offsets = array("q", [0])
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def append(self, token_ids: list[int]) -> None:
+        """Append one token sequence as a new row."""
+        self._values.extend(token_ids)
+        self._offsets.append(len(self._values))
+
+    def sequence_length(self, row_index: int) -> int:
+        """Return token count of one stored row."""
+        return self._offsets[row_index + 1] - self._offsets[row_index]
+
+    def read_sequence(self, row_index: int) -> list[int]:
+        """Materialize one stored row as a token id list."""
+        start = self._offsets[row_index]
+        end = self._offsets[row_index + 1]
+        return self._values[start:end].tolist()
+
+    def read_batch(self, row_indexes: list[int]) -> list[list[int]]:
+        """Materialize a batch of stored rows in the given order."""
+        return [self.read_sequence(row_index) for row_index in row_indexes]
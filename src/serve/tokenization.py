@@ -9,14 +9,22 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable
 
+from core.constants import PAD_TOKEN_ID
 from core.types import DataRecord
+from serve.length_buckets import plan_length_bucketed_batches
 
 
 @dataclass
 class VocabularyTokenizer:
-    """Simple vocabulary tokenizer used by default training loop."""
+    """Simple vocabulary tokenizer used by default training loop.
+
+    ``vocabulary_is_id_sorted`` records that dict insertion order already
+    matches ascending token ids, which holds for tokenizers built with
+    ``create`` and ``fit`` because each new token takes the next id.
+    """
 
     vocabulary: dict[str, int]
+    vocabulary_is_id_sorted: bool = False
 
     @classmethod
     def create(cls) -> "VocabularyTokenizer":
@@ -25,24 +33,27 @@ class VocabularyTokenizer:
         Returns:
             Tokenizer with pad and unknown tokens initialized.
         """
-        return cls(vocabulary={"<pad>": 0, "<unk>": 1})
+        return cls(vocabulary={"<pad>": PAD_TOKEN_ID, "<unk>": 1}, vocabulary_is_id_sorted=True)
 
     def fit(self, texts: Iterable[str], max_vocabulary_size: int | None = None) -> None:
         """Fit tokenizer vocabulary from input texts.
 
+        Each text's tokens are de-duplicated with ``dict.fromkeys`` first, which
+        keeps first-occurrence order, so the Python loop visits each distinct
+        token once per text instead of every repeat.
+
         Args:
             texts: Input texts.
             max_vocabulary_size: Optional max token count including special tokens.
         """
+        vocabulary = self.vocabulary
         for text in texts:
-            for token in _split_tokens(text):
-                if token not in self.vocabulary:
-                    if (
-                        max_vocabulary_size is not None
-                        and len(self.vocabulary) >= max_vocabulary_size
-                    ):
-                        return
-                    self.vocabulary[token] = len(self.vocabulary)
+            for token in dict.fromkeys(_split_tokens(text)):
+                if token in vocabulary:
+                    continue
+                if max_vocabulary_size is not None and len(vocabulary) >= max_vocabulary_size:
+                    return
+                vocabulary[token] = len(vocabulary)
 
     def encode(self, text: str, max_token_length: int) -> list[int]:
         """Encode text to token ids.
@@ -70,7 +81,9 @@ class VocabularyTokenizer:
         """
         inverse_vocabulary = {value: key for key, value in self.vocabulary.items()}
         tokens = [
-            inverse_vocabulary.get(token_id, "<unk>") for token_id in token_ids if token_id != 0
+            inverse_vocabulary.get(token_id, "<unk>")
+            for token_id in token_ids
+            if token_id != PAD_TOKEN_ID
         ]
         return " ".join(tokens)
 
@@ -107,6 +120,13 @@ def build_training_sequences(
     return sequences
 
 
+def count_batch_shapes(batches: Iterable[SequenceBatch]) -> int:
+    """Return how many distinct padded (rows, width) input shapes the batches produce."""
+    return len(
+        {(len(batch.inputs), max(map(len, batch.inputs))) for batch in batches if batch.inputs}
+    )
+
+
 def split_sequences(
     sequences: list[list[int]],
     validation_split: float,
@@ -158,6 +178,44 @@ def build_sequence_batches(
     return batches
 
 
+def build_length_bucketed_batches(
+    sequences: list[list[int]],
+    batch_size: int,
+    bucket_count: int,
+    random_seed: int,
+) -> list[SequenceBatch]:
+    """Create next-token batches from similar-length sequences.
+
+    Batches are planned by ``plan_length_bucketed_batches``, which buckets
+    by length rank and shuffles batch order.
+
+    Args:
+        sequences: Input token sequences.
+        batch_size: Target batch size.
+        bucket_count: Number of length buckets; 1 keeps input order.
+        random_seed: Deterministic seed for bucket and batch shuffles.
+
+    Returns:
+        Sequence batch list.
+    """
+    if bucket_count <= 1 or not sequences:
+        return build_sequence_batches(sequences, batch_size)
+    batch_plans = plan_length_bucketed_batches(
+        range(len(sequences)),
+        lambda row_index: len(sequences[row_index]),
+        batch_size,
+        bucket_count,
+        random_seed,
+    )
+    return [
+        SequenceBatch(
+            inputs=[sequences[row_index][:-1] for row_index in batch_plan],
+            targets=[sequences[row_index][1:] for row_index in batch_plan],
+        )
+        for batch_plan in batch_plans
+    ]
+
+
 def _split_tokens(text: str) -> list[str]:
     """Split text into lowercase whitespace tokens.
 
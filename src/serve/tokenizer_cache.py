@@ -0,0 +1,93 @@
+"""Fitted tokenizer cache shared across training runs.
+
+A default tokenizer is a pure function of the record texts and the
+vocabulary limit, so its fitted vocabulary is stored under
+``data_root/tokenizers/{version_id}-{vocabulary_size}-{digest}.json`` and
+reused by later runs on the same records. The digest covers every record
+text in order, so callers that reuse a version label for different
+records never share a stale vocabulary. Hyperparameter sweeps and every rank of
+a distributed launch then read one small JSON file instead of re-scanning
+the whole corpus on the main thread before training starts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from core.constants import HASH_ALGORITHM, TOKENIZER_CACHE_DIR_NAME
+from core.errors import ForgeServeError
+from core.logging_config import get_logger
+from core.types import DataRecord, TrainingOptions
+from serve.tokenization import VocabularyTokenizer
+from serve.training_run_io import read_json_file, write_json_file
+from serve.training_setup import fit_training_tokenizer
+
+_LOGGER = get_logger(__name__)
+
+
+def load_or_fit_training_tokenizer(
+    records: list[DataRecord],
+    options: TrainingOptions,
+    data_root: Path,
+    dataset_version_id: str,
+) -> VocabularyTokenizer:
+    """Return the cached tokenizer for this snapshot, fitting and caching it on a miss.
+
+    Unreadable or malformed cache files are refit and overwritten, and a
+    failed cache write only logs a warning, so the cache never fails a run.
+    """
+    cache_path = tokenizer_cache_path(
+        data_root, dataset_version_id, options.vocabulary_size, hash_record_texts(records)
+    )
+    cached_tokenizer = _read_cached_tokenizer(cache_path)
+    if cached_tokenizer is not None:
+        return cached_tokenizer
+    tokenizer = fit_training_tokenizer(records, options)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_file(cache_path, tokenizer.vocabulary)
+    except (OSError, ForgeServeError) as error:
+        _LOGGER.warning("tokenizer_cache_write_failed", path=str(cache_path), error=str(error))
+    return tokenizer
+
+
+def tokenizer_cache_path(
+    data_root: Path,
+    dataset_version_id: str,
+    vocabulary_size: int | None,
+    records_digest: str,
+) -> Path:
+    """Return the cache file for one snapshot, vocabulary limit, and record digest."""
+    size_label = "all" if vocabulary_size is None else str(vocabulary_size)
+    file_name = f"{dataset_version_id}-{size_label}-{records_digest}.json"
+    return data_root / TOKENIZER_CACHE_DIR_NAME / file_name
+
+
+def hash_record_texts(records: list[DataRecord]) -> str:
+    """Return a short digest of record texts in order.
+
+    Each text is length-prefixed, so different splits of the same characters
+    never hash alike.
+    """
+    text_hash = hashlib.new(HASH_ALGORITHM)
+    for record in records:
+        encoded_text = record.text.encode("utf-8")
+        text_hash.update(len(encoded_text).to_bytes(8, "little"))
+        text_hash.update(encoded_text)
+    return text_hash.hexdigest()[:16]
+
+
+def _read_cached_tokenizer(cache_path: Path) -> VocabularyTokenizer | None:
+    """Load a cached vocabulary whose ids are exactly 0..n-1 in insertion order."""
+    if not cache_path.exists():
+        return None
+    try:
+        payload = read_json_file(cache_path)
+    except ForgeServeError as error:
+        _LOGGER.warning("tokenizer_cache_read_failed", path=str(cache_path), error=str(error))
+        return None
+    if not isinstance(payload, dict) or list(payload.values()) != list(range(len(payload))):
+        _LOGGER.warning("tokenizer_cache_invalid", path=str(cache_path))
+        return None
+    return VocabularyTokenizer(vocabulary=payload, vocabulary_is_id_sorted=True)
@@ -17,7 +17,8 @@ from core.constants import (
     TRAINING_ARTIFACT_CONTRACT_FILE_NAME,
 )
 from core.errors import ForgeServeError
-from core.types import TrainingRunResult
+from core.json_codec import dumps_pretty_json, loads_json
+from core.training_types import TrainingRunResult
 
 
 @dataclass(frozen=True)
@@ -96,7 +97,7 @@ def load_training_artifact_contract(model_path: str) -> dict[str, object] | None
 
 def _write_payload(payload_path: Path, payload: dict[str, object]) -> None:
     try:
-        payload_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        payload_path.write_bytes(dumps_pretty_json(payload))
     except OSError as error:
         raise ForgeServeError(
             f"Failed to write artifact contract at {payload_path}: {error}. "
@@ -106,7 +107,7 @@ def _write_payload(payload_path: Path, payload: dict[str, object]) -> None:
 
 def _read_payload(payload_path: Path) -> object:
     try:
-        return json.loads(payload_path.read_text(encoding="utf-8"))
+        return loads_json(payload_path.read_bytes())
     except json.JSONDecodeError as error:
         raise ForgeServeError(
             f"Failed to parse artifact contract at {payload_path}: {error.msg}."
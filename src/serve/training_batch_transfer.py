@@ -0,0 +1,91 @@
+"""Host-to-device copies for training batches.
+
+This module moves padded batch tensors onto the training device. On CUDA
+the host tensor is staged into a reusable pinned buffer and copied with
+non_blocking=True on a dedicated copy stream, so the transfer runs as async
+DMA instead of stalling the default stream on pageable memory. Staging
+buffers rotate through a small ring sized for the prefetch depth and only
+grow, so steady-state batches allocate no pinned memory; a buffer is
+refilled only after an event shows its previous copy finished. Starting a
+copy and waiting for it are separate steps, so a caller can issue the next
+batch's copy while the current batch is still computing. The compute
+stream waits on the copy stream only when the batch is used, and the
+device tensor is recorded on the compute stream so the caching allocator
+does not reuse it too early.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from core.constants import BATCH_STAGING_BUFFER_COUNT
+
+
+@dataclass(slots=True)
+class BatchTransfer:
+    """Per-run batch copy state, resolved once from the training device."""
+
+    torch_module: Any
+    device: Any
+    copy_stream: Any | None = None
+    _staging_buffers: list[Any | None] = field(
+        default_factory=lambda: [None] * BATCH_STAGING_BUFFER_COUNT
+    )
+    _copy_events: list[Any | None] = field(
+        default_factory=lambda: [None] * BATCH_STAGING_BUFFER_COUNT
+    )
+    _next_slot: int = 0
+
+    def start_copy(self, host_tensor: Any) -> Any:
+        """Issue one host-to-device copy without ordering compute after it.
+
+        Without a copy stream this is a plain blocking ``.to(device)``.
+        """
+        if self.copy_stream is None:
+            return host_tensor.to(self.device)
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % BATCH_STAGING_BUFFER_COUNT
+        staged_tensor = self._stage(slot, host_tensor)
+        copy_event = self.torch_module.cuda.Event()
+        with self.torch_module.cuda.stream(self.copy_stream):
+            device_tensor = staged_tensor.to(self.device, non_blocking=True)
+            copy_event.record(self.copy_stream)
+        self._copy_events[slot] = copy_event
+        return device_tensor
+
+    def _stage(self, slot: int, host_tensor: Any) -> Any:
+        """Copy a host tensor into the slot's pinned buffer once its last DMA is done."""
+        pending_event = self._copy_events[slot]
+        if pending_event is not None:
+            pending_event.synchronize()
+        element_count = host_tensor.numel()
+        buffer = self._staging_buffers[slot]
+        if buffer is None or buffer.dtype != host_tensor.dtype or buffer.numel() < element_count:
+            buffer = self.torch_module.empty(
+                element_count, dtype=host_tensor.dtype, pin_memory=True
+            )
+            self._staging_buffers[slot] = buffer
+        staged_tensor = buffer[:element_count].view(host_tensor.shape)
+        staged_tensor.copy_(host_tensor)
+        return staged_tensor
+
+    def wait_ready(self, device_tensor: Any) -> Any:
+        """Make the compute stream wait for a started copy before using it."""
+        if self.copy_stream is None:
+            return device_tensor
+        compute_stream = self.torch_module.cuda.current_stream()
+        compute_stream.wait_stream(self.copy_stream)
+        device_tensor.record_stream(compute_stream)
+        return device_tensor
+
+
+def build_batch_transfer(torch_module: Any, device: Any) -> BatchTransfer:
+    """Build batch copy state, with a dedicated copy stream on CUDA devices."""
+    if getattr(device, "type", str(device)) != "cuda":
+        return BatchTransfer(torch_module=torch_module, device=device)
+    return BatchTransfer(
+        torch_module=torch_module,
+        device=device,
+        copy_stream=torch_module.cuda.Stream(device=device),
+    )
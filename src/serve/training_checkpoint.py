@@ -1,20 +1,42 @@
 """Training checkpoint persistence helpers.
 
-This module saves epoch checkpoints, tracks best-model snapshots, applies
-retention policies, and restores model/optimizer state for resume workflows.
+This module saves epoch checkpoints, tracks best-model snapshots, and
+restores model/optimizer state for resume workflows.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 from core.constants import (
     DEFAULT_TRAIN_BEST_CHECKPOINT_FILE_NAME,
     DEFAULT_TRAIN_CHECKPOINT_DIR_NAME,
+    DEFAULT_TRAIN_CHECKPOINT_FORMAT,
 )
 from core.errors import ForgeServeError
+from core.training_types import CheckpointFormat
+from serve.checkpoint_payload_fields import (
+    read_epoch_field,
+    read_global_step_field,
+    read_mapping_field,
+    read_optional_float_field,
+    read_optional_mapping_field,
+)
+from serve.checkpoint_safetensors import (
+    MODEL_TENSORS_FILE_FIELD,
+    load_model_tensors,
+    model_tensors_path,
+    save_model_tensors,
+)
+from serve.checkpoint_writer import (
+    CheckpointWriter,
+    link_checkpoint_file,
+    serialize_checkpoint_payload,
+    write_checkpoint_bytes,
+)
 
 
 @dataclass(frozen=True)
@@ -43,18 +65,25 @@ def save_epoch_checkpoint(
     epoch: int,
     global_step: int,
     best_validation_loss: float | None,
+    checkpoint_format: CheckpointFormat = DEFAULT_TRAIN_CHECKPOINT_FORMAT,
+    checkpoint_writer: CheckpointWriter | None = None,
+    checkpoint_fsync: bool = False,
 ) -> Path:
     """Save periodic epoch checkpoint and return file path."""
     checkpoint_path = checkpoint_dir / _epoch_checkpoint_file_name(epoch)
     payload = _build_checkpoint_payload(
-        model,
         optimizer,
         scheduler,
         epoch,
         global_step,
         best_validation_loss,
     )
-    _save_checkpoint_payload(torch_module, checkpoint_path, payload)
+    _attach_model_state(
+        torch_module, model, checkpoint_path, payload, checkpoint_format, checkpoint_writer
+    )
+    _write_checkpoint_payload(
+        torch_module, checkpoint_path, payload, checkpoint_writer, checkpoint_fsync
+    )
     return checkpoint_path
 
 
@@ -67,36 +96,62 @@ def save_best_checkpoint(
     epoch: int,
     global_step: int,
     best_validation_loss: float,
+    checkpoint_format: CheckpointFormat = DEFAULT_TRAIN_CHECKPOINT_FORMAT,
+    checkpoint_writer: CheckpointWriter | None = None,
+    checkpoint_fsync: bool = False,
 ) -> Path:
     """Save best-model checkpoint and return path."""
     checkpoint_path = checkpoint_dir / DEFAULT_TRAIN_BEST_CHECKPOINT_FILE_NAME
     payload = _build_checkpoint_payload(
-        model,
         optimizer,
         scheduler,
         epoch,
         global_step,
         best_validation_loss,
     )
-    _save_checkpoint_payload(torch_module, checkpoint_path, payload)
+    _attach_model_state(
+        torch_module, model, checkpoint_path, payload, checkpoint_format, checkpoint_writer
+    )
+    _write_checkpoint_payload(
+        torch_module, checkpoint_path, payload, checkpoint_writer, checkpoint_fsync
+    )
     return checkpoint_path
 
 
-def prune_epoch_checkpoints(checkpoint_dir: Path, max_files: int | None) -> None:
-    """Remove oldest epoch checkpoints to satisfy retention policy."""
-    if max_files is None:
-        return
-    epoch_files = _list_epoch_checkpoints(checkpoint_dir)
-    if len(epoch_files) <= max_files:
-        return
-    for stale_path in epoch_files[: len(epoch_files) - max_files]:
-        try:
-            stale_path.unlink()
-        except OSError as error:
-            raise ForgeServeError(
-                f"Failed to remove old checkpoint {stale_path}: {error}. "
-                "Check output directory permissions and retry."
-            ) from error
+def save_epoch_and_best_checkpoints(
+    checkpoint_dir: Path,
+    torch_module: Any,
+    model: Any,
+    optimizer: Any,
+    scheduler: Any | None,
+    epoch: int,
+    global_step: int,
+    best_validation_loss: float,
+    checkpoint_writer: CheckpointWriter | None = None,
+    checkpoint_fsync: bool = False,
+) -> tuple[Path, Path]:
+    """Save epoch and best torch checkpoints of one state from one serialization.
+
+    When an epoch checkpoint is due in the same epoch the validation loss
+    improves, both files hold an identical payload, so state dicts are
+    collected and serialized once, written to the epoch path, and linked
+    to the best path.
+    """
+    epoch_path = checkpoint_dir / _epoch_checkpoint_file_name(epoch)
+    best_path = checkpoint_dir / DEFAULT_TRAIN_BEST_CHECKPOINT_FILE_NAME
+    payload = _build_checkpoint_payload(
+        optimizer,
+        scheduler,
+        epoch,
+        global_step,
+        best_validation_loss,
+    )
+    _attach_model_state(torch_module, model, epoch_path, payload, "torch", checkpoint_writer)
+    payload_buffer = serialize_checkpoint_payload(torch_module, epoch_path, payload)
+    write = partial(write_checkpoint_bytes, epoch_path, payload_buffer, checkpoint_fsync)
+    _submit_checkpoint_job(write, checkpoint_writer)
+    _submit_checkpoint_job(partial(link_checkpoint_file, epoch_path, best_path), checkpoint_writer)
+    return epoch_path, best_path
 
 
 def load_resume_checkpoint(
@@ -110,13 +165,12 @@ def load_resume_checkpoint(
     """Load checkpoint payload and apply model/optimizer state."""
     resolved_path = Path(checkpoint_path).expanduser().resolve()
     payload = _read_checkpoint_payload(resolved_path, torch_module, device)
-    model_state = _read_mapping(payload, "model_state_dict", resolved_path)
-    optimizer_state = _read_mapping(payload, "optimizer_state_dict", resolved_path)
-    epoch = _read_epoch(payload, resolved_path)
-    global_step = _read_global_step(payload, resolved_path)
-    best_validation_loss = _read_optional_float(payload, "best_validation_loss", resolved_path)
-    scheduler_state = _read_optional_mapping(payload, "scheduler_state_dict", resolved_path)
-    _apply_state_dict(model, model_state, resolved_path, "model")
+    optimizer_state = read_mapping_field(payload, "optimizer_state_dict", resolved_path)
+    epoch = read_epoch_field(payload, resolved_path)
+    global_step = read_global_step_field(payload, resolved_path)
+    best_validation_loss = read_optional_float_field(payload, "best_validation_loss", resolved_path)
+    scheduler_state = read_optional_mapping_field(payload, "scheduler_state_dict", resolved_path)
+    _apply_model_state(model, payload, resolved_path, device)
     _apply_state_dict(optimizer, optimizer_state, resolved_path, "optimizer")
     if scheduler is not None and scheduler_state is not None:
         _apply_state_dict(scheduler, scheduler_state, resolved_path, "scheduler")
@@ -129,15 +183,13 @@ def load_resume_checkpoint(
 
 
 def _build_checkpoint_payload(
-    model: Any,
     optimizer: Any,
     scheduler: Any | None,
     epoch: int,
     global_step: int,
     best_validation_loss: float | None,
 ) -> dict[str, object]:
-    payload = {
-        "model_state_dict": model.state_dict(),
+    payload: dict[str, object] = {
         "optimizer_state_dict": optimizer.state_dict(),
         "epoch": epoch,
         "global_step": global_step,
@@ -148,14 +200,61 @@ def _build_checkpoint_payload(
     return payload
 
 
-def _save_checkpoint_payload(torch_module: Any, checkpoint_path: Path, payload: object) -> None:
-    try:
-        torch_module.save(payload, str(checkpoint_path))
-    except (OSError, RuntimeError) as error:
-        raise ForgeServeError(
-            f"Failed to save checkpoint at {checkpoint_path}: {error}. "
-            "Check available disk space and directory permissions."
-        ) from error
+def _attach_model_state(
+    torch_module: Any,
+    model: Any,
+    checkpoint_path: Path,
+    payload: dict[str, object],
+    checkpoint_format: CheckpointFormat,
+    checkpoint_writer: CheckpointWriter | None,
+) -> None:
+    if checkpoint_format == "safetensors":
+        tensors_path = model_tensors_path(checkpoint_path)
+        save_model_tensors(model, tensors_path)
+        payload[MODEL_TENSORS_FILE_FIELD] = tensors_path.name
+        return
+    # state_dict() returns views that share parameter storage, and torch.save
+    # serializes each storage once, so tied weights are written a single time.
+    # Do not clone tensors one by one; that would duplicate aliased bytes.
+    model_state = model.state_dict()
+    if checkpoint_writer is not None:
+        model_state = checkpoint_writer.stage_model_state(torch_module, model_state)
+    payload["model_state_dict"] = model_state
+
+
+def _apply_model_state(
+    model: Any, payload: Mapping[str, object], checkpoint_path: Path, device: Any
+) -> None:
+    tensors_file_name = payload.get(MODEL_TENSORS_FILE_FIELD)
+    if isinstance(tensors_file_name, str):
+        load_model_tensors(model, checkpoint_path.parent / tensors_file_name, device)
+        return
+    model_state = read_mapping_field(payload, "model_state_dict", checkpoint_path)
+    _apply_state_dict(model, model_state, checkpoint_path, "model")
+
+
+def _write_checkpoint_payload(
+    torch_module: Any,
+    checkpoint_path: Path,
+    payload: dict[str, object],
+    checkpoint_writer: CheckpointWriter | None,
+    checkpoint_fsync: bool,
+) -> None:
+    # Serializing on the training thread snapshots parameters and optimizer
+    # buffers before later steps mutate them in place, so a background writer
+    # only performs the single file write.
+    payload_buffer = serialize_checkpoint_payload(torch_module, checkpoint_path, payload)
+    write = partial(write_checkpoint_bytes, checkpoint_path, payload_buffer, checkpoint_fsync)
+    _submit_checkpoint_job(write, checkpoint_writer)
+
+
+def _submit_checkpoint_job(
+    job: Callable[[], None], checkpoint_writer: CheckpointWriter | None
+) -> None:
+    if checkpoint_writer is None:
+        job()
+        return
+    checkpoint_writer.submit(job)
 
 
 def _read_checkpoint_payload(
@@ -180,65 +279,6 @@ def _read_checkpoint_payload(
     )
 
 
-def _read_mapping(
-    payload: Mapping[str, object], key: str, checkpoint_path: Path
-) -> Mapping[str, object]:
-    value = payload.get(key)
-    if isinstance(value, Mapping):
-        return value
-    raise ForgeServeError(
-        f"Invalid checkpoint at {checkpoint_path}: missing mapping field '{key}'."
-    )
-
-
-def _read_epoch(payload: Mapping[str, object], checkpoint_path: Path) -> int:
-    raw_epoch = payload.get("epoch")
-    if isinstance(raw_epoch, int) and raw_epoch >= 1:
-        return raw_epoch
-    raise ForgeServeError(
-        f"Invalid checkpoint at {checkpoint_path}: field 'epoch' must be integer >= 1."
-    )
-
-
-def _read_global_step(payload: Mapping[str, object], checkpoint_path: Path) -> int:
-    raw_global_step = payload.get("global_step")
-    if isinstance(raw_global_step, int) and raw_global_step >= 0:
-        return raw_global_step
-    raise ForgeServeError(
-        f"Invalid checkpoint at {checkpoint_path}: field 'global_step' must be integer >= 0."
-    )
-
-
-def _read_optional_float(
-    payload: Mapping[str, object],
-    key: str,
-    checkpoint_path: Path,
-) -> float | None:
-    raw_value = payload.get(key)
-    if raw_value is None:
-        return None
-    if isinstance(raw_value, (float, int)):
-        return float(raw_value)
-    raise ForgeServeError(
-        f"Invalid checkpoint at {checkpoint_path}: field '{key}' must be numeric."
-    )
-
-
-def _read_optional_mapping(
-    payload: Mapping[str, object],
-    key: str,
-    checkpoint_path: Path,
-) -> Mapping[str, object] | None:
-    raw_value = payload.get(key)
-    if raw_value is None:
-        return None
-    if isinstance(raw_value, Mapping):
-        return raw_value
-    raise ForgeServeError(
-        f"Invalid checkpoint at {checkpoint_path}: field '{key}' must be a mapping."
-    )
-
-
 def _apply_state_dict(
     target: Any, state: Mapping[str, object], checkpoint_path: Path, target_name: str
 ) -> None:
@@ -251,26 +291,5 @@ def _apply_state_dict(
         ) from error
 
 
-def _list_epoch_checkpoints(checkpoint_dir: Path) -> list[Path]:
-    epoch_files = []
-    for candidate in checkpoint_dir.glob("epoch-*.pt"):
-        epoch_index = _parse_epoch_index(candidate)
-        if epoch_index is None:
-            continue
-        epoch_files.append((epoch_index, candidate))
-    epoch_files.sort(key=lambda item: item[0])
-    return [path for _, path in epoch_files]
-
-
-def _parse_epoch_index(checkpoint_path: Path) -> int | None:
-    file_name = checkpoint_path.stem
-    if not file_name.startswith("epoch-"):
-        return None
-    raw_epoch = file_name.removeprefix("epoch-")
-    if not raw_epoch.isdigit():
-        return None
-    return int(raw_epoch)
-
-
 def _epoch_checkpoint_file_name(epoch: int) -> str:
     return f"epoch-{epoch:04d}.pt"
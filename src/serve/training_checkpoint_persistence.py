@@ -0,0 +1,190 @@
+"""Per-epoch checkpoint persistence for the default training loop.
+
+This module decides which checkpoints to write after each epoch, routes
+the writes and retention pruning through a checkpoint writer, and keeps
+run lifecycle state in sync while checkpointing. Checkpoint hooks and the
+return to the running state are deferred until the writes finish and run
+on the training thread at the next epoch boundary, so hooks only see files
+that are already on disk and never touch the model from the writer thread.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+from serve.checkpoint_retention import prune_epoch_checkpoints
+from serve.checkpoint_writer import CheckpointWriter
+from serve.training_checkpoint import (
+    ensure_checkpoint_dir,
+    save_best_checkpoint,
+    save_epoch_and_best_checkpoints,
+    save_epoch_checkpoint,
+)
+from serve.training_context import TrainingRuntimeContext
+from serve.training_hooks import invoke_hook
+from serve.training_run_types import TrainingRunState
+
+
+def persist_checkpoint_state(
+    context: TrainingRuntimeContext,
+    checkpoint_writer: CheckpointWriter,
+    epoch_index: int,
+    global_step: int,
+    validation_loss: float,
+    best_validation_loss: float | None,
+    checkpoint_dir: Path | None,
+    best_checkpoint_path: Path | None,
+) -> tuple[Path | None, Path | None, float | None]:
+    """Persist periodic and best checkpoints for one finished epoch.
+
+    In multi-process runs only the primary rank writes checkpoints; other
+    ranks hold identical weights after each all-reduced step.
+    """
+    checkpoint_writer.flush_notifications()
+    should_save_epoch = epoch_index % context.options.checkpoint_every_epochs == 0
+    # Without validation batches the loss is a 0.0 placeholder, so there is
+    # no signal for picking a best model.
+    improved_best = bool(context.validation_batches) and (
+        best_validation_loss is None or validation_loss < best_validation_loss
+    )
+    should_save_best = context.options.save_best_checkpoint and improved_best
+    next_best_validation = validation_loss if improved_best else best_validation_loss
+    if not context.distributed.is_primary or not (should_save_epoch or should_save_best):
+        return checkpoint_dir, best_checkpoint_path, next_best_validation
+    transition_run_state = _bind_run_state_transition(context)
+    transition_run_state("checkpointing")
+    resolved_checkpoint_dir = checkpoint_dir or ensure_checkpoint_dir(context.output_dir)
+    updated_best_path = best_checkpoint_path
+    save_request = _CheckpointSaveRequest(
+        context=context,
+        checkpoint_writer=checkpoint_writer,
+        checkpoint_dir=resolved_checkpoint_dir,
+        epoch_index=epoch_index,
+        global_step=global_step,
+    )
+    # With both due, best_validation_loss equals validation_loss, so the two
+    # checkpoints carry the same torch payload and can share one serialization.
+    if should_save_epoch and should_save_best and context.options.checkpoint_format == "torch":
+        updated_best_path = _save_shared_epoch_and_best(save_request, validation_loss)
+    else:
+        if should_save_epoch:
+            _save_epoch(save_request, next_best_validation)
+        if should_save_best:
+            updated_best_path = _save_best(save_request, validation_loss)
+    if should_save_epoch:
+        _queue_epoch_pruning(save_request)
+    checkpoint_writer.notify_after_writes(partial(transition_run_state, "running"))
+    return resolved_checkpoint_dir, updated_best_path, next_best_validation
+
+
+@dataclass(frozen=True)
+class _CheckpointSaveRequest:
+    """Shared arguments for the checkpoint writes of one epoch."""
+
+    context: TrainingRuntimeContext
+    checkpoint_writer: CheckpointWriter
+    checkpoint_dir: Path
+    epoch_index: int
+    global_step: int
+
+
+def _save_shared_epoch_and_best(request: _CheckpointSaveRequest, validation_loss: float) -> Path:
+    """Write epoch and best checkpoints from one serialized payload."""
+    context = request.context
+    epoch_path, best_path = save_epoch_and_best_checkpoints(
+        checkpoint_dir=request.checkpoint_dir,
+        torch_module=context.torch_module,
+        model=context.model,
+        optimizer=context.optimizer,
+        scheduler=context.scheduler,
+        epoch=request.epoch_index,
+        global_step=request.global_step,
+        best_validation_loss=validation_loss,
+        checkpoint_writer=request.checkpoint_writer,
+        checkpoint_fsync=context.options.checkpoint_fsync,
+    )
+    _queue_checkpoint_hook(request, epoch_path)
+    _queue_checkpoint_hook(request, best_path)
+    return best_path
+
+
+def _save_epoch(request: _CheckpointSaveRequest, best_validation_loss: float | None) -> None:
+    """Write one periodic epoch checkpoint."""
+    context = request.context
+    epoch_path = save_epoch_checkpoint(
+        checkpoint_dir=request.checkpoint_dir,
+        torch_module=context.torch_module,
+        model=context.model,
+        optimizer=context.optimizer,
+        scheduler=context.scheduler,
+        epoch=request.epoch_index,
+        global_step=request.global_step,
+        best_validation_loss=best_validation_loss,
+        checkpoint_format=context.options.checkpoint_format,
+        checkpoint_writer=request.checkpoint_writer,
+        checkpoint_fsync=context.options.checkpoint_fsync,
+    )
+    _queue_checkpoint_hook(request, epoch_path)
+
+
+def _save_best(request: _CheckpointSaveRequest, validation_loss: float) -> Path:
+    """Write the best-model checkpoint and return its path."""
+    context = request.context
+    best_path = save_best_checkpoint(
+        checkpoint_dir=request.checkpoint_dir,
+        torch_module=context.torch_module,
+        model=context.model,
+        optimizer=context.optimizer,
+        scheduler=context.scheduler,
+        epoch=request.epoch_index,
+        global_step=request.global_step,
+        best_validation_loss=validation_loss,
+        checkpoint_format=context.options.checkpoint_format,
+        checkpoint_writer=request.checkpoint_writer,
+        checkpoint_fsync=context.options.checkpoint_fsync,
+    )
+    _queue_checkpoint_hook(request, best_path)
+    return best_path
+
+
+def _queue_epoch_pruning(request: _CheckpointSaveRequest) -> None:
+    """Queue retention pruning behind the epoch checkpoint write."""
+    # The writer runs jobs in submission order, so pruning only sees files
+    # whose writes have already finished.
+    request.checkpoint_writer.submit(
+        partial(
+            prune_epoch_checkpoints,
+            checkpoint_dir=request.checkpoint_dir,
+            max_files=request.context.options.max_checkpoint_files,
+        )
+    )
+
+
+def _queue_checkpoint_hook(request: _CheckpointSaveRequest, checkpoint_path: Path) -> None:
+    """Notify the on_checkpoint hook on the training thread once the write finishes."""
+    request.checkpoint_writer.notify_after_writes(
+        partial(
+            invoke_hook,
+            "on_checkpoint",
+            request.context.hooks.on_checkpoint,
+            request.context,
+            request.epoch_index,
+            str(checkpoint_path),
+        )
+    )
+
+
+def _bind_run_state_transition(
+    context: TrainingRuntimeContext,
+) -> Callable[[TrainingRunState], object]:
+    """Bind lifecycle transitions to the run registry, or to a no-op without one."""
+    if context.run_registry is None or context.run_id is None:
+        return _skip_run_state_transition
+    return partial(context.run_registry.transition, context.run_id)
+
+
+def _skip_run_state_transition(state: TrainingRunState) -> None:
+    """Ignore lifecycle transitions for runs without registry tracking."""
@@ -8,15 +8,24 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import asdict
+from functools import lru_cache
 
-from core.constants import HASH_ALGORITHM
+from core.constants import HASH_ALGORITHM, TRAINING_CONFIG_HASH_CACHE_SIZE
 from core.types import TrainingOptions
 
 
+# TrainingOptions is a frozen dataclass of primitives, so it is hashable by
+# value and safe to use as a cache key. The digest algorithm stays on
+# HASH_ALGORITHM so hashes remain comparable with existing lineage records.
+@lru_cache(maxsize=TRAINING_CONFIG_HASH_CACHE_SIZE)
 def compute_training_config_hash(options: TrainingOptions) -> str:
-    """Compute a stable hash for one training options payload."""
-    payload = asdict(options)
+    """Compute a stable hash for one training options payload.
+
+    Results are memoized per options value because options are immutable
+    for the lifetime of a run and the hash is requested from several
+    lifecycle sites.
+    """
+    payload = options.to_dict()
     normalized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
     hash_builder = hashlib.new(HASH_ALGORITHM)
     hash_builder.update(normalized.encode("utf-8"))
@@ -6,12 +6,14 @@ It allows custom loops to reuse Forge-prepared datasets and model state.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from core.types import TrainingOptions
 from serve.tokenization import SequenceBatch, VocabularyTokenizer
+from serve.training_batch_transfer import BatchTransfer
+from serve.training_distributed import DistributedRuntime
 from serve.training_hooks import TrainingHooks
 from serve.training_run_registry import TrainingRunRegistry
 
@@ -37,3 +39,11 @@ class TrainingRuntimeContext:
     config_hash: str
     hooks: TrainingHooks
     run_registry: TrainingRunRegistry | None
+    batch_transfer: BatchTransfer | None = None
+    distributed: DistributedRuntime = field(default_factory=DistributedRuntime)
+    # DistributedDataParallel wrapper used for forward passes in multi-process
+    # runs; ``model`` stays the plain module so saved state keys are unchanged.
+    parallel_model: Any | None = None
+    # Padded host tensors for the run's own train/validation batches, keyed by
+    # batch id; those lists live as long as the context, so ids stay unique.
+    host_batch_tensors: dict[int, tuple[Any, Any]] = field(default_factory=dict)
@@ -2,21 +2,35 @@
 
 This module turns stored text records into tokenized training batches.
 It provides deterministic shuffling and optional PyTorch DataLoader wiring.
+Sized record collections are bucketed globally: every record's token ids
+are kept in compact ragged storage and batches are materialized from row
+indexes, so create_token_batches and the PyTorch loader agree batch for
+batch. Unsized record streams are batched in a single pass, holding only
+the shuffle buffer and the current batch, so they can cover data larger
+than RAM; length bucketing is then applied within shuffle-buffer windows.
 """
 
 from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import Any, Iterable, cast
+from functools import cache
+from typing import Any, Iterable, Iterator, Sized, TypeVar
 
 from core.constants import (
     DEFAULT_BATCH_SIZE,
+    DEFAULT_LENGTH_BUCKET_COUNT,
     DEFAULT_MAX_TOKEN_LENGTH,
     DEFAULT_SHUFFLE_BUFFER_SIZE,
+    PAD_TOKEN_ID,
 )
-from core.errors import ForgeDependencyError
-from core.types import DataLoaderOptions, DataRecord
+from core.errors import ForgeDependencyError, ForgeServeError
+from core.training_types import DataLoaderOptions
+from core.types import DataRecord
+from serve.length_buckets import plan_length_bucketed_batches
+from serve.token_sequence_store import TokenSequenceStore
+
+_ItemT = TypeVar("_ItemT")
 
 
 @dataclass
@@ -28,7 +42,7 @@ class WhitespaceTokenizer:
     @classmethod
     def create(cls) -> "WhitespaceTokenizer":
         """Create tokenizer with reserved padding token."""
-        return cls(vocabulary={"<pad>": 0})
+        return cls(vocabulary={"<pad>": PAD_TOKEN_ID})
 
     def encode(self, text: str, max_token_length: int) -> list[int]:
         """Encode text into integer token ids.
@@ -61,6 +75,7 @@ def build_default_dataloader_options() -> DataLoaderOptions:
         shuffle=True,
         shuffle_buffer_size=DEFAULT_SHUFFLE_BUFFER_SIZE,
         max_token_length=DEFAULT_MAX_TOKEN_LENGTH,
+        length_bucket_count=DEFAULT_LENGTH_BUCKET_COUNT,
     )
 
 
@@ -79,12 +94,45 @@ def create_token_batches(
     Returns:
         List of batches containing token-id sequences.
     """
+    return list(_iter_globally_bucketed_batches(records, options, random_seed))
+
+
+def iter_token_batches(
+    records: Iterable[DataRecord],
+    options: DataLoaderOptions,
+    random_seed: int,
+) -> Iterator[list[list[int]]]:
+    """Tokenize, shuffle, and batch records in a single streaming pass.
+
+    Only the shuffle buffer and the batch being filled are held in memory,
+    so datasets larger than RAM can be streamed. With length bucketing,
+    shuffled rows are bucketed within windows of the shuffle buffer size.
+
+    Args:
+        records: Records to tokenize.
+        options: Dataloader options.
+        random_seed: Seed for deterministic shuffling.
+
+    Yields:
+        Batches containing token-id sequences.
+    """
     tokenizer = WhitespaceTokenizer.create()
-    token_sequences = [
-        tokenizer.encode(record.text, options.max_token_length) for record in records
-    ]
-    ordered_sequences = _shuffle_sequences(token_sequences, options, random_seed)
-    return _batch_sequences(ordered_sequences, options.batch_size)
+    token_rows = (tokenizer.encode(record.text, options.max_token_length) for record in records)
+    shuffled_rows = _shuffle_items(token_rows, options, random_seed)
+    if not _uses_length_buckets(options):
+        yield from _batch_items(shuffled_rows, options.batch_size)
+        return
+    windows = _batch_items(shuffled_rows, _bucket_window_size(options))
+    for window_index, window in enumerate(windows):
+        window_lengths = [len(row) for row in window]
+        for batch_plan in plan_length_bucketed_batches(
+            range(len(window)),
+            window_lengths.__getitem__,
+            options.batch_size,
+            options.length_bucket_count,
+            random_seed + window_index,
+        ):
+            yield [window[row_index] for row_index in batch_plan]
 
 
 def create_pytorch_dataloader(
@@ -94,6 +142,12 @@ def create_pytorch_dataloader(
 ) -> Any:
     """Create a PyTorch DataLoader from snapshot records.
 
+    Sized records give the same batches as ``create_token_batches`` and a
+    loader length; other iterables are streamed through
+    ``iter_token_batches`` on every iteration. A one-shot iterator can be
+    consumed for a single epoch; iterating again raises ForgeServeError
+    instead of yielding an empty epoch.
+
     Args:
         records: Records to stream.
         options: Dataloader behavior.
@@ -112,75 +166,132 @@ def create_pytorch_dataloader(
             "PyTorch DataLoader integration requires torch, but it is not installed. "
             "Install torch to use training streaming."
         ) from error
-    batches = create_token_batches(records, options, random_seed)
-    dataset = _TokenBatchDataset(batches)
-    return torch.utils.data.DataLoader(cast(Any, dataset), batch_size=None)
+    dataset_type = _streaming_dataset_type(torch.utils.data.IterableDataset)
+    dataset = dataset_type(records, options, random_seed)
+    return torch.utils.data.DataLoader(dataset, batch_size=None)
+
+
+class _StreamingTokenBatches:
+    """Re-streams token batches from records on every iteration."""
+
+    def __init__(
+        self,
+        records: Iterable[DataRecord],
+        options: DataLoaderOptions,
+        random_seed: int,
+    ) -> None:
+        self._records = records
+        self._options = options
+        self._random_seed = random_seed
+        self._is_one_shot = iter(records) is records
+        self._iteration_started = False
+
+    def __len__(self) -> int:
+        if not isinstance(self._records, Sized):
+            raise TypeError("Streaming token batches have no length for unsized records.")
+        # Length buckets are whole batches, so only the last batch is partial.
+        batch_size = self._options.batch_size
+        return (len(self._records) + batch_size - 1) // batch_size
 
+    def __iter__(self) -> Iterator[list[list[int]]]:
+        if self._is_one_shot and self._iteration_started:
+            raise ForgeServeError(
+                "Streaming dataloader records were a one-shot iterator that is already "
+                "consumed. Pass a re-iterable collection to train for several epochs."
+            )
+        self._iteration_started = True
+        if isinstance(self._records, Sized):
+            return _iter_globally_bucketed_batches(self._records, self._options, self._random_seed)
+        return iter_token_batches(self._records, self._options, self._random_seed)
 
-class _TokenBatchDataset:
-    """Indexable dataset wrapper for precomputed token batches."""
 
-    def __init__(self, batches: list[list[list[int]]]) -> None:
-        self._batches = batches
+@cache
+def _streaming_dataset_type(iterable_dataset_base: type) -> type[_StreamingTokenBatches]:
+    """Return the torch IterableDataset flavor of the streaming batches, built once."""
+    return type("_StreamingTokenBatchDataset", (_StreamingTokenBatches, iterable_dataset_base), {})
 
-    def __len__(self) -> int:
-        return len(self._batches)
 
-    def __getitem__(self, index: int) -> list[list[int]]:
-        return self._batches[index]
+def _uses_length_buckets(options: DataLoaderOptions) -> bool:
+    return options.shuffle and options.length_bucket_count > 1
 
 
-def _shuffle_sequences(
-    token_sequences: list[list[int]],
+def _bucket_window_size(options: DataLoaderOptions) -> int:
+    """Rows bucketed together when streaming, enough to fill every bucket."""
+    return max(options.shuffle_buffer_size, options.batch_size * options.length_bucket_count)
+
+
+def _iter_globally_bucketed_batches(
+    records: Iterable[DataRecord],
     options: DataLoaderOptions,
     random_seed: int,
-) -> list[list[int]]:
-    """Shuffle token sequences with deterministic seed.
+) -> Iterator[list[list[int]]]:
+    """Yield batches with length buckets planned over every record."""
+    if not _uses_length_buckets(options):
+        yield from iter_token_batches(records, options, random_seed)
+        return
+    sequence_store = _encode_records(records, options)
+    for batch_plan in plan_length_bucketed_batches(
+        _shuffle_items(range(len(sequence_store)), options, random_seed),
+        sequence_store.sequence_length,
+        options.batch_size,
+        options.length_bucket_count,
+        random_seed,
+    ):
+        yield sequence_store.read_batch(batch_plan)
+
+
+def _encode_records(
+    records: Iterable[DataRecord],
+    options: DataLoaderOptions,
+) -> TokenSequenceStore:
+    """Tokenize records straight into compact ragged storage."""
+    tokenizer = WhitespaceTokenizer.create()
+    sequence_store = TokenSequenceStore()
+    for record in records:
+        sequence_store.append(tokenizer.encode(record.text, options.max_token_length))
+    return sequence_store
+
+
+def _shuffle_items(
+    items: Iterable[_ItemT],
+    options: DataLoaderOptions,
+    random_seed: int,
+) -> Iterator[_ItemT]:
+    """Shuffle items with a deterministic seeded buffer.
 
     Args:
-        token_sequences: Tokenized records.
+        items: Items in record order.
         options: Shuffle options.
         random_seed: Deterministic seed.
 
-    Returns:
-        Ordered token sequences.
+    Yields:
+        Items in shuffled order.
     """
     if not options.shuffle:
-        return token_sequences
+        yield from items
+        return
     randomizer = random.Random(random_seed)
     buffer_size = max(options.shuffle_buffer_size, 1)
-    buffer: list[list[int]] = []
-    shuffled: list[list[int]] = []
-    for sequence in token_sequences:
-        buffer.append(sequence)
+    buffer: list[_ItemT] = []
+    for item in items:
+        buffer.append(item)
         if len(buffer) >= buffer_size:
             randomizer.shuffle(buffer)
-            shuffled.append(buffer.pop())
+            yield buffer.pop()
     randomizer.shuffle(buffer)
-    shuffled.extend(buffer)
-    return shuffled
+    yield from buffer
 
 
-def _batch_sequences(
-    token_sequences: list[list[int]],
+def _batch_items(
+    items: Iterable[_ItemT],
     batch_size: int,
-) -> list[list[list[int]]]:
-    """Batch token sequences.
-
-    Args:
-        token_sequences: Ordered token sequences.
-        batch_size: Batch size.
-
-    Returns:
-        List of batches.
-    """
-    batches: list[list[list[int]]] = []
-    current_batch: list[list[int]] = []
-    for sequence in token_sequences:
-        current_batch.append(sequence)
+) -> Iterator[list[_ItemT]]:
+    """Group ordered items into batches; the last one may be partial."""
+    current_batch: list[_ItemT] = []
+    for item in items:
+        current_batch.append(item)
         if len(current_batch) == batch_size:
-            batches.append(current_batch)
+            yield current_batch
             current_batch = []
     if current_batch:
-        batches.append(current_batch)
-    return batches
+        yield current_batch
@@ -0,0 +1,161 @@
+"""Multi-process data-parallel setup for training runs.
+
+Launchers such as torchrun describe the process group through the
+WORLD_SIZE, RANK, and LOCAL_RANK environment variables. When more than
+one process is present, each rank trains a DistributedDataParallel
+replica on an equal-sized shard of the sequences, and DDP all-reduces
+gradients in buckets that overlap with the backward pass. Validation
+losses are averaged across ranks so every rank makes the same best-model
+decision, and the process group is destroyed when the run ends. Only the
+primary rank writes checkpoints, artifacts, and run lifecycle metadata.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence, TypeVar
+
+from core.constants import DDP_BUCKET_CAP_MB
+from core.errors import ForgeServeError
+
+_ItemT = TypeVar("_ItemT")
+
+
+@dataclass(frozen=True, slots=True)
+class DistributedRuntime:
+    """Process-group position of the current training process."""
+
+    rank: int = 0
+    local_rank: int = 0
+    world_size: int = 1
+
+    @property
+    def enabled(self) -> bool:
+        """Return true when training runs across several processes."""
+        return self.world_size > 1
+
+    @property
+    def is_primary(self) -> bool:
+        """Return true for the rank that owns persisted outputs."""
+        return self.rank == 0
+
+
+def read_distributed_runtime(environ: Mapping[str, str] | None = None) -> DistributedRuntime:
+    """Read rank and world size from launcher environment variables.
+
+    Raises:
+        ForgeServeError: If the variables are not integers or are inconsistent.
+    """
+    env = os.environ if environ is None else environ
+    try:
+        world_size = int(env.get("WORLD_SIZE", "1"))
+        rank = int(env.get("RANK", "0"))
+        local_rank = int(env.get("LOCAL_RANK", str(rank)))
+    except ValueError as error:
+        raise ForgeServeError(
+            f"Invalid distributed launch environment: {error}. "
+            "WORLD_SIZE, RANK, and LOCAL_RANK must be integers."
+        ) from error
+    if world_size < 1 or not 0 <= rank < world_size or local_rank < 0:
+        raise ForgeServeError(
+            f"Invalid distributed launch environment: rank={rank}, "
+            f"local_rank={local_rank}, world_size={world_size}."
+        )
+    return DistributedRuntime(rank=rank, local_rank=local_rank, world_size=world_size)
+
+
+def init_distributed_device(torch_module: Any, runtime: DistributedRuntime) -> Any:
+    """Join the default process group and return this rank's device.
+
+    CUDA ranks bind to their local GPU and use NCCL; CPU-only hosts use Gloo.
+
+    Raises:
+        ForgeServeError: If torch was built without distributed support.
+    """
+    distributed = torch_module.distributed
+    if not distributed.is_available():
+        raise ForgeServeError(
+            f"Distributed training was requested with world_size={runtime.world_size}, "
+            "but this torch build has no torch.distributed support."
+        )
+    use_cuda = bool(torch_module.cuda.is_available())
+    if use_cuda:
+        torch_module.cuda.set_device(runtime.local_rank)
+        device = torch_module.device("cuda", runtime.local_rank)
+    else:
+        device = torch_module.device("cpu")
+    if not distributed.is_initialized():
+        distributed.init_process_group(backend="nccl" if use_cuda else "gloo")
+    return device
+
+
+def destroy_distributed_process_group(runtime: DistributedRuntime) -> None:
+    """Leave the default process group when this run joined one."""
+    if not runtime.enabled:
+        return
+    try:
+        import torch
+    except ImportError:
+        # Without torch no process group can have been initialized.
+        return
+    distributed = torch.distributed
+    if distributed.is_available() and distributed.is_initialized():
+        distributed.destroy_process_group()
+
+
+def average_across_ranks(
+    torch_module: Any,
+    value: float,
+    device: Any,
+    runtime: DistributedRuntime,
+) -> float:
+    """Return the mean of one per-rank scalar over every rank.
+
+    Ranks hold equal-sized shards, so the mean of per-rank means is the
+    whole-dataset mean. Single-process runs return the value unchanged.
+    """
+    if not runtime.enabled:
+        return value
+    reduced = torch_module.tensor([value], dtype=torch_module.float64, device=device)
+    torch_module.distributed.all_reduce(reduced)
+    return float(reduced.item()) / runtime.world_size
+
+
+def shard_for_rank(items: Sequence[_ItemT], runtime: DistributedRuntime) -> list[_ItemT]:
+    """Return this rank's strided shard, trimmed so every rank gets the same count.
+
+    Equal shard sizes give every rank the same number of batches, which DDP
+    needs so no rank waits on a gradient all-reduce the others never start.
+
+    Raises:
+        ForgeServeError: If there are fewer items than processes.
+    """
+    if not runtime.enabled:
+        return list(items)
+    items_per_rank = len(items) // runtime.world_size
+    if items_per_rank == 0:
+        raise ForgeServeError(
+            f"Cannot shard {len(items)} training sequences across "
+            f"{runtime.world_size} processes. Add data or launch fewer processes."
+        )
+    shard_end = items_per_rank * runtime.world_size
+    return list(items[runtime.rank : shard_end : runtime.world_size])
+
+
+def wrap_distributed_model(
+    torch_module: Any,
+    model: Any,
+    device: Any,
+    runtime: DistributedRuntime,
+) -> Any | None:
+    """Wrap the model in DistributedDataParallel, or return None for one process."""
+    if not runtime.enabled:
+        return None
+    device_ids = [runtime.local_rank] if getattr(device, "type", None) == "cuda" else None
+    return torch_module.nn.parallel.DistributedDataParallel(
+        model,
+        device_ids=device_ids,
+        bucket_cap_mb=DDP_BUCKET_CAP_MB,
+        gradient_as_bucket_view=True,
+    )
@@ -6,13 +6,16 @@ structured batch-level progress updates.
 
 from __future__ import annotations
 
+from array import array
 from contextlib import nullcontext
-from typing import Any
+from itertools import islice
+from typing import Any, Iterator
 
-from core.types import BatchLossMetric
+from core.constants import PAD_TOKEN_ID
 from serve.tokenization import SequenceBatch
 from serve.training_context import TrainingRuntimeContext
 from serve.training_hooks import invoke_hook
+from serve.training_metric_log import BatchLossLog
 from serve.training_progress import TrainingProgressTracker
 
 
@@ -22,127 +25,245 @@ def run_epoch_pass(
     phase: str,
     epoch_index: int,
     global_step: int,
-    batch_rows: list[BatchLossMetric],
+    batch_loss_log: BatchLossLog,
     progress_tracker: TrainingProgressTracker,
 ) -> tuple[float, int]:
-    """Run one full pass over train or validation batches."""
+    """Run one full pass over train or validation batches.
+
+    Batch losses stay on the device during the pass and are copied to the
+    host once at the end, so the loop does not force a device sync per step.
+    Losses are only read early for batches that emit a progress event or
+    when an on_batch_end hook needs the value. The next batch is padded and
+    its device copy started before the current batch runs; padded host
+    tensors for the context's own batch lists are built in the first epoch
+    and reused by later ones. Training passes step the optimizer once per
+    ``gradient_accumulation_steps`` batches; global steps still count batches.
+    Per-pass lookups such as the forward model are resolved before the loop.
+    """
     if not batches:
         return 0.0, global_step
-    total_loss = 0.0
     training = phase == "train"
-    context.model.train(mode=training)
-    for batch_index, batch in enumerate(batches, start=1):
-        loss_value, global_step = _run_batch_step(
+    forward_model = _forward_model(context) if training else context.model
+    forward_model.train(mode=training)
+    if training:
+        context.optimizer.zero_grad(set_to_none=True)
+    total_batches = len(batches)
+    start_global_step = global_step
+    loss_tensors: list[Any] = []
+    append_loss_tensor = loss_tensors.append
+    should_log_batch = progress_tracker.should_log_batch
+    # Checked before reading a loss, so disabled logging never syncs the device.
+    logs_batch_progress = progress_tracker.batch_progress_enabled()
+    device_batches = _iter_device_batches(context, batches)
+    for batch_index, (inputs, targets) in enumerate(device_batches, start=1):
+        loss_tensor, global_step = _run_batch_step(
             context=context,
-            batch=batch,
+            forward_model=forward_model,
+            inputs=inputs,
+            targets=targets,
             training=training,
             epoch_index=epoch_index,
             batch_index=batch_index,
+            total_batches=total_batches,
             global_step=global_step,
-            batch_rows=batch_rows,
-        )
-        total_loss += loss_value
-        progress_tracker.log_batch_progress(
-            phase=phase,
-            epoch_index=epoch_index,
-            batch_index=batch_index,
-            total_batches=len(batches),
-            global_step=global_step,
-            loss=loss_value,
         )
-    return total_loss / len(batches), global_step
+        append_loss_tensor(loss_tensor)
+        if logs_batch_progress and should_log_batch(batch_index, total_batches):
+            progress_tracker.log_batch_progress(
+                phase=phase,
+                epoch_index=epoch_index,
+                batch_index=batch_index,
+                total_batches=total_batches,
+                global_step=global_step,
+                loss=float(loss_tensor.item()),
+            )
+    loss_values = _read_loss_values(context.torch_module, loss_tensors)
+    if training:
+        batch_loss_log.extend_epoch(epoch_index, start_global_step, loss_values)
+    return sum(loss_values) / total_batches, global_step
 
 
 def _run_batch_step(
     context: TrainingRuntimeContext,
-    batch: SequenceBatch,
+    forward_model: Any,
+    inputs: Any,
+    targets: Any,
     training: bool,
     epoch_index: int,
     batch_index: int,
+    total_batches: int,
     global_step: int,
-    batch_rows: list[BatchLossMetric],
-) -> tuple[float, int]:
-    """Run one batch step and return loss value and updated global step."""
-    inputs, targets = _tensorize_batch(context, batch)
-    with _autocast_context(context):
-        logits = context.model(inputs)
+) -> tuple[Any, int]:
+    """Run one batch step and return the detached loss tensor and global step.
+
+    Validation steps run under ``torch.inference_mode()`` so no autograd
+    graph is recorded. Their forward model is the plain model, so a DDP
+    wrapper does not prepare a gradient sync for a forward with no backward.
+    """
+    grad_mode = nullcontext() if training else context.torch_module.inference_mode()
+    with grad_mode, context.precision_runtime.autocast_factory():
+        logits = forward_model(inputs)
         loss = context.loss_function(
             logits.reshape(-1, logits.shape[-1]),
             targets.reshape(-1),
         )
-    loss_value = float(loss.item())
     if not training:
-        invoke_hook(
-            "on_batch_end",
-            context.hooks.on_batch_end,
-            context,
-            "validation",
-            epoch_index,
-            batch_index,
-            global_step,
-            loss_value,
-        )
-        return loss_value, global_step
-    context.optimizer.zero_grad()
-    if context.precision_runtime.scaler is not None:
-        context.precision_runtime.scaler.scale(loss).backward()
-        context.precision_runtime.scaler.step(context.optimizer)
-        context.precision_runtime.scaler.update()
+        _invoke_batch_end_hook(context, "validation", epoch_index, batch_index, global_step, loss)
+        return loss.detach(), global_step
+    _backward_micro_batch(context, loss, batch_index, total_batches)
+    next_global_step = global_step + 1
+    _invoke_batch_end_hook(context, "train", epoch_index, batch_index, next_global_step, loss)
+    return loss.detach(), next_global_step
+
+
+def _backward_micro_batch(
+    context: TrainingRuntimeContext,
+    loss: Any,
+    batch_index: int,
+    total_batches: int,
+) -> None:
+    """Accumulate one batch's gradients and step at the end of its group.
+
+    The loss is divided by the group size, so a short final group still
+    averages its gradients. Non-final batches run under the model's
+    ``no_sync()`` when it is a DDP-style wrapper, so gradients are
+    all-reduced once per optimizer step instead of once per batch.
+    """
+    accumulation_steps = context.options.gradient_accumulation_steps
+    group_start = (batch_index - 1) // accumulation_steps * accumulation_steps
+    group_size = min(accumulation_steps, total_batches - group_start)
+    step_optimizer = batch_index == group_start + group_size
+    scaled_loss = loss / group_size if group_size > 1 else loss
+    scaler = context.precision_runtime.scaler
+    no_sync = None if step_optimizer else getattr(_forward_model(context), "no_sync", None)
+    with no_sync() if no_sync is not None else nullcontext():
+        if scaler is not None:
+            scaler.scale(scaled_loss).backward()
+        else:
+            scaled_loss.backward()
+    if not step_optimizer:
+        return
+    if scaler is not None:
+        scaler.step(context.optimizer)
+        scaler.update()
     else:
-        loss.backward()
         context.optimizer.step()
-    next_global_step = global_step + 1
-    batch_rows.append(
-        BatchLossMetric(
-            epoch=epoch_index,
-            batch_index=batch_index,
-            global_step=next_global_step,
-            train_loss=round(loss_value, 6),
-        )
-    )
+    context.optimizer.zero_grad(set_to_none=True)
+
+
+def _forward_model(context: TrainingRuntimeContext) -> Any:
+    """Return the DDP wrapper in multi-process runs, else the plain model."""
+    return context.model if context.parallel_model is None else context.parallel_model
+
+
+def _invoke_batch_end_hook(
+    context: TrainingRuntimeContext,
+    phase: str,
+    epoch_index: int,
+    batch_index: int,
+    global_step: int,
+    loss: Any,
+) -> None:
+    """Invoke on_batch_end, reading the loss value only when a hook exists."""
+    if context.hooks.on_batch_end is None:
+        return
     invoke_hook(
         "on_batch_end",
         context.hooks.on_batch_end,
         context,
-        "train",
+        phase,
         epoch_index,
         batch_index,
-        next_global_step,
-        loss_value,
+        global_step,
+        float(loss.item()),
     )
-    return loss_value, next_global_step
+
+
+def _read_loss_values(torch_module: Any, loss_tensors: list[Any]) -> list[float]:
+    """Copy all batch losses to the host with one device sync."""
+    return [float(value) for value in torch_module.stack(loss_tensors).tolist()]
+
+
+def _iter_device_batches(
+    context: TrainingRuntimeContext,
+    batches: list[SequenceBatch],
+) -> Iterator[tuple[Any, Any]]:
+    """Yield device tensors per batch, starting the next copy one batch early.
+
+    The compute stream is ordered after a batch's copy before the next copy
+    is issued, so the current step never waits on the prefetched transfer.
+    """
+    host_cache = _host_batch_cache(context, batches)
+    pending = _tensorize_batch(context, batches[0], host_cache)
+    for batch in islice(batches, 1, None):
+        ready = _wait_batch_ready(context, pending)
+        pending = _tensorize_batch(context, batch, host_cache)
+        yield ready
+    yield _wait_batch_ready(context, pending)
+
+
+def _host_batch_cache(
+    context: TrainingRuntimeContext,
+    batches: list[SequenceBatch],
+) -> dict[int, tuple[Any, Any]] | None:
+    """Return the padded tensor cache when batches are one of the run's own lists.
+
+    Other lists, such as ones a custom loop builds per epoch, are padded on
+    every pass so the cache cannot grow with batches that are later freed.
+    """
+    if batches is context.train_batches or batches is context.validation_batches:
+        return context.host_batch_tensors
+    return None
 
 
 def _tensorize_batch(
     context: TrainingRuntimeContext,
     batch: SequenceBatch,
+    host_cache: dict[int, tuple[Any, Any]] | None,
+) -> tuple[Any, Any]:
+    """Pad batch lists into host tensors, or reuse them, and start device copies."""
+    host_tensors = None if host_cache is None else host_cache.get(id(batch))
+    if host_tensors is None:
+        host_tensors = _build_host_tensors(context.torch_module, batch)
+        if host_cache is not None:
+            host_cache[id(batch)] = host_tensors
+    input_tensor, target_tensor = host_tensors
+    batch_transfer = context.batch_transfer
+    if batch_transfer is None:
+        return input_tensor.to(context.device), target_tensor.to(context.device)
+    return batch_transfer.start_copy(input_tensor), batch_transfer.start_copy(target_tensor)
+
+
+def _wait_batch_ready(
+    context: TrainingRuntimeContext,
+    device_batch: tuple[Any, Any],
 ) -> tuple[Any, Any]:
-    """Convert batch lists into padded tensors on target device."""
-    torch_module = context.torch_module
+    """Order compute after a started batch copy, when copies run on a stream."""
+    batch_transfer = context.batch_transfer
+    if batch_transfer is None:
+        return device_batch
+    inputs, targets = device_batch
+    return batch_transfer.wait_ready(inputs), batch_transfer.wait_ready(targets)
+
+
+def _build_host_tensors(torch_module: Any, batch: SequenceBatch) -> tuple[Any, Any]:
+    """Pad one batch's inputs and targets to its longest sequence."""
     max_length = max(len(sequence) for sequence in batch.inputs)
-    padded_inputs = [_pad_sequence(sequence, max_length) for sequence in batch.inputs]
-    padded_targets = [_pad_sequence(sequence, max_length) for sequence in batch.targets]
-    input_tensor = torch_module.tensor(padded_inputs, dtype=torch_module.long).to(context.device)
-    target_tensor = torch_module.tensor(padded_targets, dtype=torch_module.long).to(context.device)
+    input_tensor = _build_padded_tensor(torch_module, batch.inputs, max_length)
+    target_tensor = _build_padded_tensor(torch_module, batch.targets, max_length)
     return input_tensor, target_tensor
 
 
-def _autocast_context(context: TrainingRuntimeContext) -> Any:
-    """Build autocast context for mixed precision forward pass."""
-    precision_runtime = context.precision_runtime
-    if not precision_runtime.autocast_enabled:
-        return nullcontext()
-    autocast_fn = getattr(context.torch_module, "autocast", None)
-    if autocast_fn is None:
-        return nullcontext()
-    return autocast_fn(
-        device_type=getattr(context.device, "type", str(context.device)),
-        dtype=precision_runtime.autocast_dtype,
-    )
-
+def _build_padded_tensor(torch_module: Any, sequences: list[list[int]], max_length: int) -> Any:
+    """Pack sequences into one (batch, max_length) tensor via a flat int64 buffer.
 
-def _pad_sequence(sequence: list[int], max_length: int) -> list[int]:
-    """Pad sequence with pad id 0 up to max length."""
-    if len(sequence) >= max_length:
-        return sequence
-    return sequence + ([0] * (max_length - len(sequence)))
+    The buffer is a typed array allocated once and pre-filled with the pad
+    id; each row is written with a slice assignment. The tensor wraps the
+    array's memory with frombuffer, so torch never unboxes Python ints.
+    """
+    flat_buffer = array("q", [PAD_TOKEN_ID]) * (len(sequences) * max_length)
+    for row_index, sequence in enumerate(sequences):
+        row_start = row_index * max_length
+        flat_buffer[row_start : row_start + len(sequence)] = array("q", sequence)
+    flat_tensor = torch_module.frombuffer(flat_buffer, dtype=torch_module.long)
+    return flat_tensor.view(len(sequences), max_length)
@@ -7,24 +7,24 @@ It isolates epoch execution, resume loading, and checkpoint persistence.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
 from core.errors import ForgeServeError
 from core.types import BatchLossMetric, EpochMetric
+from serve.checkpoint_writer import CheckpointWriter
 from serve.custom_loop_loader import load_custom_training_loop
-from serve.training_checkpoint import (
-    ensure_checkpoint_dir,
-    load_resume_checkpoint,
-    prune_epoch_checkpoints,
-    save_best_checkpoint,
-    save_epoch_checkpoint,
-)
+from serve.device_selection import cudnn_benchmark_scope
+from serve.tokenization import count_batch_shapes
+from serve.training_checkpoint import load_resume_checkpoint
+from serve.training_checkpoint_persistence import persist_checkpoint_state
 from serve.training_context import TrainingRuntimeContext
+from serve.training_distributed import average_across_ranks
 from serve.training_epoch_pass import run_epoch_pass
 from serve.training_hooks import invoke_hook
-from serve.training_progress import TrainingProgressTracker, read_optimizer_learning_rate
-from serve.training_run_types import TrainingRunState
+from serve.training_metric_log import BatchLossLog, EpochLossLog
+from serve.training_progress import TrainingProgressTracker, read_current_learning_rate
 
 
 @dataclass(frozen=True)
@@ -50,6 +50,13 @@ class ResumeTrainingState:
 
 def run_training_loop(context: TrainingRuntimeContext) -> TrainingLoopResult:
     """Run default or custom training loop for a prepared runtime context."""
+    batches = chain(context.train_batches, context.validation_batches)
+    with cudnn_benchmark_scope(context.torch_module, context.device, count_batch_shapes(batches)):
+        return _run_selected_training_loop(context)
+
+
+def _run_selected_training_loop(context: TrainingRuntimeContext) -> TrainingLoopResult:
+    """Resolve resume state, then run the custom loop or the built-in one."""
     resume_state = _resolve_resume_state(context)
     progress_tracker = _build_progress_tracker(context, resume_state)
     progress_tracker.log_training_started()
@@ -117,10 +124,26 @@ def _run_default_training_loop(
     context: TrainingRuntimeContext,
     resume_state: ResumeTrainingState,
     progress_tracker: TrainingProgressTracker,
+) -> TrainingLoopResult:
+    """Run built-in epoch loop and wait for checkpoint writes to finish."""
+    checkpoint_writer = CheckpointWriter(background=context.options.async_checkpoint)
+    try:
+        loop_result = _run_epochs(context, resume_state, progress_tracker, checkpoint_writer)
+        checkpoint_writer.wait()
+    finally:
+        checkpoint_writer.close()
+    return loop_result
+
+
+def _run_epochs(
+    context: TrainingRuntimeContext,
+    resume_state: ResumeTrainingState,
+    progress_tracker: TrainingProgressTracker,
+    checkpoint_writer: CheckpointWriter,
 ) -> TrainingLoopResult:
     """Run built-in epoch loop and persist periodic checkpoints."""
-    epoch_rows: list[EpochMetric] = []
-    batch_rows: list[BatchLossMetric] = []
+    epoch_loss_log = EpochLossLog()
+    batch_loss_log = BatchLossLog()
     global_step = resume_state.global_step
     best_validation_loss = resume_state.best_validation_loss
     checkpoint_dir: Path | None = None
@@ -132,21 +155,15 @@ def _run_default_training_loop(
             progress_tracker=progress_tracker,
             epoch_index=epoch_index,
             global_step=global_step,
-            batch_rows=batch_rows,
-        )
-        epoch_rows.append(
-            EpochMetric(
-                epoch=epoch_index,
-                train_loss=round(train_loss, 6),
-                validation_loss=round(validation_loss, 6),
-            )
+            batch_loss_log=batch_loss_log,
         )
+        epoch_loss_log.append(epoch_index, train_loss, validation_loss)
         _step_scheduler(context.scheduler)
         progress_tracker.log_epoch_completed(
             epoch_index=epoch_index,
             train_loss=train_loss,
             validation_loss=validation_loss,
-            learning_rate=read_optimizer_learning_rate(context.optimizer),
+            learning_rate=read_current_learning_rate(context.optimizer, context.scheduler),
         )
         invoke_hook(
             "on_epoch_end",
@@ -160,8 +177,9 @@ def _run_default_training_loop(
             checkpoint_dir,
             best_checkpoint_path,
             best_validation_loss,
-        ) = _persist_checkpoint_state(
+        ) = persist_checkpoint_state(
             context=context,
+            checkpoint_writer=checkpoint_writer,
             epoch_index=epoch_index,
             global_step=global_step,
             validation_loss=validation_loss,
@@ -170,8 +188,8 @@ def _run_default_training_loop(
             best_checkpoint_path=best_checkpoint_path,
         )
     return TrainingLoopResult(
-        epoch_metrics=epoch_rows,
-        batch_metrics=batch_rows,
+        epoch_metrics=epoch_loss_log.to_metrics(),
+        batch_metrics=batch_loss_log.to_metrics(),
         checkpoint_dir=checkpoint_dir,
         best_checkpoint_path=best_checkpoint_path,
         resumed_from_checkpoint=resume_state.resumed_from_checkpoint,
@@ -183,7 +201,7 @@ def _run_epoch_cycle(
     progress_tracker: TrainingProgressTracker,
     epoch_index: int,
     global_step: int,
-    batch_rows: list[BatchLossMetric],
+    batch_loss_log: BatchLossLog,
 ) -> tuple[float, float, int]:
     """Run train and validation passes for one epoch."""
     progress_tracker.log_epoch_started(epoch_index)
@@ -193,18 +211,24 @@ def _run_epoch_cycle(
         phase="train",
         epoch_index=epoch_index,
         global_step=global_step,
-        batch_rows=batch_rows,
+        batch_loss_log=batch_loss_log,
         progress_tracker=progress_tracker,
     )
+    if not context.validation_batches:
+        return train_loss, 0.0, next_global_step
     validation_loss, next_global_step = run_epoch_pass(
         context=context,
         batches=context.validation_batches,
         phase="validation",
         epoch_index=epoch_index,
         global_step=next_global_step,
-        batch_rows=batch_rows,
+        batch_loss_log=batch_loss_log,
         progress_tracker=progress_tracker,
     )
+    # Every rank must compare the same loss against the best checkpoint.
+    validation_loss = average_across_ranks(
+        context.torch_module, validation_loss, context.device, context.distributed
+    )
     return train_loss, validation_loss, next_global_step
 
 
@@ -215,79 +239,9 @@ def _step_scheduler(scheduler: Any | None) -> None:
     scheduler.step()
 
 
-def _persist_checkpoint_state(
-    context: TrainingRuntimeContext,
-    epoch_index: int,
-    global_step: int,
-    validation_loss: float,
-    best_validation_loss: float | None,
-    checkpoint_dir: Path | None,
-    best_checkpoint_path: Path | None,
-) -> tuple[Path | None, Path | None, float | None]:
-    """Persist periodic and best checkpoints for one finished epoch."""
-    should_save_epoch = epoch_index % context.options.checkpoint_every_epochs == 0
-    improved_best = best_validation_loss is None or validation_loss < best_validation_loss
-    should_save_best = context.options.save_best_checkpoint and improved_best
-    next_best_validation = validation_loss if improved_best else best_validation_loss
-    if not should_save_epoch and not should_save_best:
-        return checkpoint_dir, best_checkpoint_path, next_best_validation
-    _transition_run_state(context, "checkpointing")
-    resolved_checkpoint_dir = checkpoint_dir or ensure_checkpoint_dir(context.output_dir)
-    if should_save_epoch:
-        epoch_checkpoint_path = save_epoch_checkpoint(
-            checkpoint_dir=resolved_checkpoint_dir,
-            torch_module=context.torch_module,
-            model=context.model,
-            optimizer=context.optimizer,
-            scheduler=context.scheduler,
-            epoch=epoch_index,
-            global_step=global_step,
-            best_validation_loss=next_best_validation,
-        )
-        invoke_hook(
-            "on_checkpoint",
-            context.hooks.on_checkpoint,
-            context,
-            epoch_index,
-            str(epoch_checkpoint_path),
-        )
-        prune_epoch_checkpoints(
-            checkpoint_dir=resolved_checkpoint_dir,
-            max_files=context.options.max_checkpoint_files,
-        )
-    updated_best_path = best_checkpoint_path
-    if should_save_best:
-        updated_best_path = save_best_checkpoint(
-            checkpoint_dir=resolved_checkpoint_dir,
-            torch_module=context.torch_module,
-            model=context.model,
-            optimizer=context.optimizer,
-            scheduler=context.scheduler,
-            epoch=epoch_index,
-            global_step=global_step,
-            best_validation_loss=validation_loss,
-        )
-        invoke_hook(
-            "on_checkpoint",
-            context.hooks.on_checkpoint,
-            context,
-            epoch_index,
-            str(updated_best_path),
-        )
-    _transition_run_state(context, "running")
-    return resolved_checkpoint_dir, updated_best_path, next_best_validation
-
-
 def _validate_metric_rows(metrics: list[EpochMetric]) -> None:
     """Ensure custom loops return at least one epoch metric row."""
     if not metrics:
         raise ForgeServeError(
             "Custom loop returned no metrics. Return at least one EpochMetric row."
         )
-
-
-def _transition_run_state(context: TrainingRuntimeContext, state: TrainingRunState) -> None:
-    """Transition lifecycle state when registry context exists."""
-    if context.run_registry is None or context.run_id is None:
-        return
-    context.run_registry.transition(context.run_id, state)
@@ -7,10 +7,12 @@ without requiring users to replace the entire training loop implementation.
 from __future__ import annotations
 
 import importlib.util
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, cast
+from typing import Any, Callable, Mapping, cast
 
+from core.constants import PAD_TOKEN_ID
 from core.errors import ForgeServeError
 
 OnRunStartHook = Callable[[Any], None]
@@ -37,6 +39,10 @@ class TrainingHooks:
     build_loss_function: BuildLossFunctionHook | None = None
 
 
+# Hook module attribute names, one per TrainingHooks field.
+_HOOK_NAMES: tuple[str, ...] = tuple(hook_field.name for hook_field in fields(TrainingHooks))
+
+
 def load_training_hooks(hooks_path: str | None) -> TrainingHooks:
     """Load optional hook functions from a Python module path."""
     if hooks_path is None:
@@ -46,26 +52,18 @@ def load_training_hooks(hooks_path: str | None) -> TrainingHooks:
         raise ForgeServeError(
             f"Hooks file not found at {resolved_path}. Provide a valid --hooks-file path."
         )
-    module = _load_python_module(resolved_path)
-    return TrainingHooks(
-        on_run_start=cast(OnRunStartHook | None, _load_optional_hook(module, "on_run_start")),
-        on_epoch_start=cast(
-            OnEpochStartHook | None,
-            _load_optional_hook(module, "on_epoch_start"),
-        ),
-        on_batch_end=cast(OnBatchEndHook | None, _load_optional_hook(module, "on_batch_end")),
-        on_epoch_end=cast(OnEpochEndHook | None, _load_optional_hook(module, "on_epoch_end")),
-        on_checkpoint=cast(
-            OnCheckpointHook | None,
-            _load_optional_hook(module, "on_checkpoint"),
-        ),
-        on_run_end=cast(OnRunEndHook | None, _load_optional_hook(module, "on_run_end")),
-        on_run_error=cast(OnRunErrorHook | None, _load_optional_hook(module, "on_run_error")),
-        build_loss_function=cast(
-            BuildLossFunctionHook | None,
-            _load_optional_hook(module, "build_loss_function"),
-        ),
-    )
+    return _build_training_hooks(_load_python_module(resolved_path))
+
+
+def build_default_loss_function(torch_module: Any) -> Any:
+    """Build the default next-token criterion that skips pad positions.
+
+    Mean reduction with ignore_index already normalizes by the count of
+    non-pad targets, so padded positions add neither loss nor gradient.
+    The functional cross-entropy is bound directly, so each batch skips
+    the CrossEntropyLoss module's ``__call__`` hook dispatch.
+    """
+    return partial(torch_module.nn.functional.cross_entropy, ignore_index=PAD_TOKEN_ID)
 
 
 def build_loss_function_from_hooks(
@@ -75,7 +73,7 @@ def build_loss_function_from_hooks(
 ) -> Any:
     """Build loss function from hook module or use default cross-entropy."""
     if hooks.build_loss_function is None:
-        return torch_module.nn.CrossEntropyLoss(ignore_index=0)
+        return build_default_loss_function(torch_module)
     try:
         loss_function = hooks.build_loss_function(runtime_context, torch_module)
     except Exception as error:
@@ -106,8 +104,20 @@ def invoke_hook(
         ) from error
 
 
-def _load_optional_hook(module: Any, attribute_name: str) -> Callable[..., object] | None:
-    hook = getattr(module, attribute_name, None)
+def _build_training_hooks(module: Any) -> TrainingHooks:
+    """Collect optional hook callables from a loaded hooks module."""
+    # One namespace snapshot serves every lookup as a plain dict probe
+    # instead of a getattr round through module attribute access.
+    namespace = vars(module)
+    hooks_by_name = {name: _load_optional_hook(namespace, name) for name in _HOOK_NAMES}
+    return TrainingHooks(**cast(dict[str, Any], hooks_by_name))
+
+
+def _load_optional_hook(
+    namespace: Mapping[str, object],
+    attribute_name: str,
+) -> Callable[..., object] | None:
+    hook = namespace.get(attribute_name)
     if hook is None:
         return None
     if callable(hook):
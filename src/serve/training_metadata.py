@@ -7,7 +7,8 @@ runtime settings consistent across separate commands.
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from typing import cast
 
@@ -15,36 +16,41 @@ from core.chat_types import ChatTokenizer
 from core.constants import (
     DEFAULT_TOKENIZER_VOCAB_FILE_NAME,
     DEFAULT_TRAINING_CONFIG_FILE_NAME,
+    VOCABULARY_FORMAT_SNIFF_ENTRY_COUNT,
 )
 from core.errors import ForgeServeError
+from core.json_codec import dumps_pretty_json, load_json_file
 from core.types import TrainingOptions
 from serve.tokenization import VocabularyTokenizer
 
+_TOKEN_KEY_TYPES = frozenset({str})
+_TOKEN_ID_TYPES = frozenset({int})
+_MISSING_PAYLOAD = object()
+
 
 def save_training_config(output_dir: Path, options: TrainingOptions) -> Path:
     """Persist training options used to build the model architecture."""
     config_path = output_dir / DEFAULT_TRAINING_CONFIG_FILE_NAME
-    config_path.write_text(json.dumps(asdict(options), indent=2) + "\n", encoding="utf-8")
+    config_path.write_bytes(dumps_pretty_json(options.to_dict()))
     return config_path
 
 
 def save_tokenizer_vocabulary(output_dir: Path, tokenizer: VocabularyTokenizer) -> Path:
     """Persist fitted tokenizer vocabulary used during training."""
     vocabulary_path = output_dir / DEFAULT_TOKENIZER_VOCAB_FILE_NAME
-    payload = {
-        token: token_id
-        for token, token_id in sorted(tokenizer.vocabulary.items(), key=_sort_vocabulary_item)
-    }
-    vocabulary_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    payload = tokenizer.vocabulary
+    if not tokenizer.vocabulary_is_id_sorted:
+        payload = dict(sorted(tokenizer.vocabulary.items(), key=itemgetter(1)))
+    vocabulary_path.write_bytes(dumps_pretty_json(payload))
     return vocabulary_path
 
 
 def load_training_config(model_path: str) -> dict[str, object] | None:
     """Load persisted training config located beside model weights."""
     config_path = _artifact_dir(model_path) / DEFAULT_TRAINING_CONFIG_FILE_NAME
-    if not config_path.exists():
-        return None
     payload = _read_json_payload(config_path)
+    if payload is _MISSING_PAYLOAD:
+        return None
     if not isinstance(payload, dict):
         raise ForgeServeError(
             f"Invalid training config format at {config_path}: expected JSON object."
@@ -58,9 +64,10 @@ def load_tokenizer(model_path: str) -> ChatTokenizer | None:
     Returns None if no vocabulary file exists next to the model.
     """
     vocabulary_path = _artifact_dir(model_path) / DEFAULT_TOKENIZER_VOCAB_FILE_NAME
-    if not vocabulary_path.exists():
+    payload = _read_json_payload(vocabulary_path)
+    if payload is _MISSING_PAYLOAD:
         return None
-    return load_tokenizer_from_path(str(vocabulary_path))
+    return _build_tokenizer(payload, vocabulary_path)
 
 
 def load_tokenizer_from_path(vocabulary_path: str) -> ChatTokenizer:
@@ -81,12 +88,17 @@ def load_tokenizer_from_path(vocabulary_path: str) -> ChatTokenizer:
         ForgeServeError: If the file is missing, malformed, or has invalid entries.
     """
     resolved_path = Path(vocabulary_path).expanduser().resolve()
-    if not resolved_path.exists():
+    payload = _read_json_payload(resolved_path)
+    if payload is _MISSING_PAYLOAD:
         raise ForgeServeError(
             f"Tokenizer vocabulary file not found at {resolved_path}. "
             "Provide a valid --tokenizer-path or re-run training to generate vocab.json."
         )
-    payload = _read_json_payload(resolved_path)
+    return _build_tokenizer(payload, resolved_path)
+
+
+def _build_tokenizer(payload: object, resolved_path: Path) -> ChatTokenizer:
+    """Build a tokenizer from a decoded vocabulary or tokenizer.json payload."""
     if not isinstance(payload, dict):
         raise ForgeServeError(
             f"Invalid tokenizer vocabulary format at {resolved_path}: expected JSON object."
@@ -121,8 +133,11 @@ def _extract_vocabulary_mapping(
 
 
 def _looks_like_flat_vocabulary(payload: dict[str, object]) -> bool:
-    """Return True if the payload looks like a flat token-to-id mapping."""
-    for value in list(payload.values())[:5]:
+    """Return True if the payload looks like a flat token-to-id mapping.
+
+    Only the first few values are sniffed; full entry validation happens later.
+    """
+    for value in islice(payload.values(), VOCABULARY_FORMAT_SNIFF_ENTRY_COUNT):
         if not isinstance(value, int):
             return False
     return True
@@ -132,20 +147,27 @@ def _validate_vocabulary(
     raw_vocab: dict[str, object],
     source_path: Path,
 ) -> VocabularyTokenizer:
-    """Validate and build a VocabularyTokenizer from a raw mapping."""
-    vocabulary: dict[str, int] = {}
-    for raw_token, raw_token_id in raw_vocab.items():
-        if not isinstance(raw_token, str):
-            raise ForgeServeError(
-                f"Invalid tokenizer vocabulary at {source_path}: token keys must be strings."
-            )
-        if not isinstance(raw_token_id, int):
-            raise ForgeServeError(
-                f"Invalid tokenizer vocabulary at {source_path}: token id for "
-                f"{raw_token!r} must be an integer."
-            )
-        vocabulary[raw_token] = raw_token_id
-    return VocabularyTokenizer(vocabulary=vocabulary)
+    """Validate and build a VocabularyTokenizer from a raw mapping.
+
+    Entry types are checked with ``map(type, ...)`` scans that run without a
+    Python-level loop per token; the offending entry is only searched for
+    once validation has already failed.
+    """
+    if not _TOKEN_KEY_TYPES.issuperset(map(type, raw_vocab)):
+        raise ForgeServeError(
+            f"Invalid tokenizer vocabulary at {source_path}: token keys must be strings."
+        )
+    if not _TOKEN_ID_TYPES.issuperset(map(type, raw_vocab.values())):
+        invalid_token = next(
+            raw_token
+            for raw_token, raw_token_id in raw_vocab.items()
+            if type(raw_token_id) not in _TOKEN_ID_TYPES
+        )
+        raise ForgeServeError(
+            f"Invalid tokenizer vocabulary at {source_path}: token id for "
+            f"{invalid_token!r} must be an integer."
+        )
+    return VocabularyTokenizer(vocabulary=cast(dict[str, int], dict(raw_vocab)))
 
 
 def _artifact_dir(model_path: str) -> Path:
@@ -154,9 +176,15 @@ def _artifact_dir(model_path: str) -> Path:
 
 
 def _read_json_payload(payload_path: Path) -> object:
-    """Read JSON payload from disk with traceable errors."""
+    """Read JSON payload from disk with traceable errors.
+
+    Missing files return ``_MISSING_PAYLOAD`` instead of raising, so callers
+    skip a separate ``exists()`` stat before reading.
+    """
     try:
-        return json.loads(payload_path.read_text(encoding="utf-8"))
+        return load_json_file(payload_path)
+    except FileNotFoundError:
+        return _MISSING_PAYLOAD
     except json.JSONDecodeError as error:
         raise ForgeServeError(
             f"Failed to parse JSON artifact at {payload_path}: {error.msg}. "
@@ -167,9 +195,3 @@ def _read_json_payload(payload_path: Path) -> object:
             f"Failed to read artifact at {payload_path}: {error}. "
             "Verify file permissions and retry."
         ) from error
-
-
-def _sort_vocabulary_item(item: tuple[str, int]) -> tuple[int, str]:
-    """Sort vocabulary output by token id for deterministic storage."""
-    token, token_id = item
-    return token_id, token
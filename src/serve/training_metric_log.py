@@ -0,0 +1,95 @@
+"""Compact in-loop storage for training metric rows.
+
+This module records epoch and per-batch training losses in flat typed
+arrays while the loop runs and materializes rounded metric dataclasses
+once at the end. Each epoch adds one segment row plus one double per
+batch, instead of one frozen dataclass per batch held for the whole run.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Sequence
+
+from core.types import BatchLossMetric, EpochMetric
+
+
+class BatchLossLog:
+    """Per-batch training losses stored as one segment per epoch.
+
+    Batch indexes and global steps inside an epoch are contiguous, so a
+    segment only keeps its epoch, first global step, and batch count.
+    """
+
+    def __init__(self) -> None:
+        self._segment_epochs = array("q")
+        self._segment_start_steps = array("q")
+        self._segment_counts = array("q")
+        self._losses = array("d")
+
+    def __len__(self) -> int:
+        return len(self._losses)
+
+    def extend_epoch(
+        self,
+        epoch_index: int,
+        start_global_step: int,
+        loss_values: Sequence[float],
+    ) -> None:
+        """Record one epoch's training losses in batch order."""
+        if not loss_values:
+            return
+        self._segment_epochs.append(epoch_index)
+        self._segment_start_steps.append(start_global_step)
+        self._segment_counts.append(len(loss_values))
+        self._losses.extend(loss_values)
+
+    def to_metrics(self) -> list[BatchLossMetric]:
+        """Materialize recorded losses as rounded batch metric rows."""
+        metrics: list[BatchLossMetric] = []
+        loss_offset = 0
+        for epoch_index, start_global_step, batch_count in zip(
+            self._segment_epochs, self._segment_start_steps, self._segment_counts
+        ):
+            for batch_index in range(1, batch_count + 1):
+                metrics.append(
+                    BatchLossMetric(
+                        epoch=epoch_index,
+                        batch_index=batch_index,
+                        global_step=start_global_step + batch_index,
+                        train_loss=round(self._losses[loss_offset], 6),
+                    )
+                )
+                loss_offset += 1
+        return metrics
+
+
+class EpochLossLog:
+    """Raw epoch train/validation losses, rounded only when materialized."""
+
+    def __init__(self) -> None:
+        self._epochs = array("q")
+        self._train_losses = array("d")
+        self._validation_losses = array("d")
+
+    def __len__(self) -> int:
+        return len(self._epochs)
+
+    def append(self, epoch_index: int, train_loss: float, validation_loss: float) -> None:
+        """Record one finished epoch's mean losses."""
+        self._epochs.append(epoch_index)
+        self._train_losses.append(train_loss)
+        self._validation_losses.append(validation_loss)
+
+    def to_metrics(self) -> list[EpochMetric]:
+        """Materialize recorded losses as rounded epoch metric rows."""
+        return [
+            EpochMetric(
+                epoch=epoch_index,
+                train_loss=round(train_loss, 6),
+                validation_loss=round(validation_loss, 6),
+            )
+            for epoch_index, train_loss, validation_loss in zip(
+                self._epochs, self._train_losses, self._validation_losses
+            )
+        ]
@@ -7,7 +7,7 @@ instances so training behavior can be configured through CLI and YAML.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 from core.errors import ForgeServeError
 from core.types import TrainingOptions
@@ -34,50 +34,116 @@ def build_training_optimization(
 
 def _build_optimizer(torch_module: Any, model: Any, options: TrainingOptions) -> Any:
     """Build optimizer instance from configured optimizer type."""
-    parameters = model.parameters()
-    if options.optimizer_type == "adam":
-        return torch_module.optim.Adam(
-            parameters,
-            lr=options.learning_rate,
-            weight_decay=options.weight_decay,
+    optimizer_builder = _OPTIMIZER_BUILDERS.get(options.optimizer_type)
+    if optimizer_builder is None:
+        raise ForgeServeError(
+            f"Unsupported optimizer_type {options.optimizer_type!r}. "
+            "Use adam, adamw, or sgd."
         )
-    if options.optimizer_type == "adamw":
-        return torch_module.optim.AdamW(
-            parameters,
-            lr=options.learning_rate,
-            weight_decay=options.weight_decay,
-        )
-    if options.optimizer_type == "sgd":
-        return torch_module.optim.SGD(
-            parameters,
-            lr=options.learning_rate,
-            momentum=options.sgd_momentum,
-            weight_decay=options.weight_decay,
-        )
-    raise ForgeServeError(
-        f"Unsupported optimizer_type {options.optimizer_type!r}. "
-        "Use adam, adamw, or sgd."
-    )
+    return optimizer_builder(torch_module, list(model.parameters()), options)
 
 
 def _build_scheduler(torch_module: Any, optimizer: Any, options: TrainingOptions) -> Any | None:
     """Build optional scheduler instance from configured scheduler type."""
     if options.scheduler_type == "none":
         return None
-    if options.scheduler_type == "step":
-        return torch_module.optim.lr_scheduler.StepLR(
-            optimizer,
-            step_size=options.scheduler_step_size,
-            gamma=options.scheduler_gamma,
-        )
-    if options.scheduler_type == "cosine":
-        t_max_epochs = options.scheduler_t_max_epochs or options.epochs
-        return torch_module.optim.lr_scheduler.CosineAnnealingLR(
-            optimizer,
-            T_max=t_max_epochs,
-            eta_min=options.scheduler_eta_min,
+    scheduler_builder = _SCHEDULER_BUILDERS.get(options.scheduler_type)
+    if scheduler_builder is None:
+        raise ForgeServeError(
+            f"Unsupported scheduler_type {options.scheduler_type!r}. "
+            "Use none, step, or cosine."
         )
-    raise ForgeServeError(
-        f"Unsupported scheduler_type {options.scheduler_type!r}. "
-        "Use none, step, or cosine."
+    return scheduler_builder(torch_module, optimizer, options)
+
+
+def _build_adam(torch_module: Any, parameters: list[Any], options: TrainingOptions) -> Any:
+    return _construct_optimizer(
+        torch_module.optim.Adam,
+        parameters,
+        _kernel_options(parameters),
+        lr=options.learning_rate,
+        weight_decay=options.weight_decay,
+    )
+
+
+def _build_adamw(torch_module: Any, parameters: list[Any], options: TrainingOptions) -> Any:
+    return _construct_optimizer(
+        torch_module.optim.AdamW,
+        parameters,
+        _kernel_options(parameters),
+        lr=options.learning_rate,
+        weight_decay=options.weight_decay,
+    )
+
+
+def _build_sgd(torch_module: Any, parameters: list[Any], options: TrainingOptions) -> Any:
+    return _construct_optimizer(
+        torch_module.optim.SGD,
+        parameters,
+        _kernel_options(parameters),
+        lr=options.learning_rate,
+        momentum=options.sgd_momentum,
+        weight_decay=options.weight_decay,
+    )
+
+
+def _kernel_options(parameters: list[Any]) -> dict[str, bool]:
+    """Pick the fastest optimizer implementation for where parameters live.
+
+    With every parameter on CUDA the fused kernel updates all of them in one
+    launch per step; elsewhere the foreach multi-tensor path replaces the
+    per-parameter Python loop.
+    """
+    if parameters and all(getattr(parameter, "is_cuda", False) for parameter in parameters):
+        return {"fused": True}
+    return {"foreach": True}
+
+
+def _construct_optimizer(
+    optimizer_class: Any,
+    parameters: list[Any],
+    kernel_options: dict[str, bool],
+    **optimizer_kwargs: float,
+) -> Any:
+    """Construct an optimizer, stepping down kernel options the torch build rejects.
+
+    Builds without a fused kernel for this optimizer (SGD gained one after
+    Adam) fall back to foreach, and builds without foreach to the default.
+    """
+    attempts = [kernel_options]
+    if "fused" in kernel_options:
+        attempts.append({"foreach": True})
+    for attempt_options in attempts:
+        try:
+            return optimizer_class(parameters, **optimizer_kwargs, **attempt_options)
+        except TypeError:
+            continue
+    return optimizer_class(parameters, **optimizer_kwargs)
+
+
+def _build_step_scheduler(torch_module: Any, optimizer: Any, options: TrainingOptions) -> Any:
+    return torch_module.optim.lr_scheduler.StepLR(
+        optimizer,
+        step_size=options.scheduler_step_size,
+        gamma=options.scheduler_gamma,
+    )
+
+
+def _build_cosine_scheduler(torch_module: Any, optimizer: Any, options: TrainingOptions) -> Any:
+    t_max_epochs = options.scheduler_t_max_epochs or options.epochs
+    return torch_module.optim.lr_scheduler.CosineAnnealingLR(
+        optimizer,
+        T_max=t_max_epochs,
+        eta_min=options.scheduler_eta_min,
     )
+
+
+_OPTIMIZER_BUILDERS: dict[str, Callable[[Any, list[Any], TrainingOptions], Any]] = {
+    "adam": _build_adam,
+    "adamw": _build_adamw,
+    "sgd": _build_sgd,
+}
+_SCHEDULER_BUILDERS: dict[str, Callable[[Any, Any, TrainingOptions], Any]] = {
+    "step": _build_step_scheduler,
+    "cosine": _build_cosine_scheduler,
+}
@@ -0,0 +1,105 @@
+"""Training output persistence.
+
+This module writes model weights, config, tokenizer, history, plot,
+reproducibility bundle, and artifact contract files for a finished
+training loop and returns the run summary that references them.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.errors import ForgeDependencyError
+from core.training_types import TrainingRunResult
+from core.types import BatchLossMetric, EpochMetric
+from serve.training_artifact_contract import save_training_artifact_contract
+from serve.training_artifacts import (
+    save_model_weights,
+    save_training_history,
+    save_training_plot,
+)
+from serve.training_context import TrainingRuntimeContext
+from serve.training_execution import TrainingLoopResult
+from serve.training_metadata import save_tokenizer_vocabulary, save_training_config
+from serve.training_reproducibility_bundle import save_reproducibility_bundle
+
+
+def persist_training_outputs(
+    context: TrainingRuntimeContext,
+    loop_result: TrainingLoopResult,
+    run_id: str,
+    dataset_version_id: str,
+    config_hash: str,
+    random_seed: int,
+) -> TrainingRunResult:
+    """Persist model/history/plot outputs and return summary metadata."""
+    model_path = save_model_weights(context.output_dir, context.torch_module, context.model)
+    config_path = save_training_config(context.output_dir, context.options)
+    tokenizer_path = save_tokenizer_vocabulary(context.output_dir, context.tokenizer)
+    history_path = save_training_history(
+        context.output_dir,
+        loop_result.epoch_metrics,
+        loop_result.batch_metrics,
+    )
+    plot_path = _try_save_plot(
+        context.output_dir,
+        loop_result.epoch_metrics,
+        loop_result.batch_metrics,
+    )
+    reproducibility_bundle_path = save_reproducibility_bundle(
+        output_dir=context.output_dir,
+        run_id=run_id,
+        dataset_name=context.options.dataset_name,
+        dataset_version_id=dataset_version_id,
+        config_hash=config_hash,
+        random_seed=random_seed,
+        training_options=context.options.to_dict(),
+    )
+    base_result = TrainingRunResult(
+        model_path=str(model_path),
+        history_path=str(history_path),
+        plot_path=str(plot_path) if plot_path else None,
+        epochs_completed=len(loop_result.epoch_metrics),
+        checkpoint_dir=str(loop_result.checkpoint_dir) if loop_result.checkpoint_dir else None,
+        best_checkpoint_path=(
+            str(loop_result.best_checkpoint_path) if loop_result.best_checkpoint_path else None
+        ),
+        resumed_from_checkpoint=loop_result.resumed_from_checkpoint,
+        run_id=run_id,
+        artifact_contract_path=None,
+    )
+    contract_path = save_training_artifact_contract(
+        output_dir=context.output_dir,
+        run_id=run_id,
+        dataset_name=context.options.dataset_name,
+        dataset_version_id=dataset_version_id,
+        parent_model_path=context.options.initial_weights_path,
+        config_hash=config_hash,
+        result=base_result,
+        tokenizer_path=str(tokenizer_path),
+        training_config_path=str(config_path),
+        reproducibility_bundle_path=str(reproducibility_bundle_path),
+    )
+    return TrainingRunResult(
+        model_path=base_result.model_path,
+        history_path=base_result.history_path,
+        plot_path=base_result.plot_path,
+        epochs_completed=base_result.epochs_completed,
+        checkpoint_dir=base_result.checkpoint_dir,
+        best_checkpoint_path=base_result.best_checkpoint_path,
+        resumed_from_checkpoint=base_result.resumed_from_checkpoint,
+        run_id=run_id,
+        artifact_contract_path=str(contract_path),
+    )
+
+
+def _try_save_plot(
+    output_dir: Path,
+    epoch_metrics: list[EpochMetric],
+    batch_metrics: list[BatchLossMetric],
+) -> Path | None:
+    """Save training plot unless plotting dependency is unavailable."""
+    try:
+        return save_training_plot(output_dir, epoch_metrics, batch_metrics)
+    except ForgeDependencyError:
+        return None
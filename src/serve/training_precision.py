@@ -6,34 +6,59 @@ and exposes autocast/scaler runtime objects for batch execution.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
-
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Any, Callable
+
+from core.constants import (
+    AMPERE_CUDA_CAPABILITY_MAJOR,
+    PRECISION_PROBE_CACHE_SIZE,
+    TF32_FLOAT32_MATMUL_PRECISION,
+)
 from core.logging_config import get_logger
 from core.types import PrecisionMode
 
 _LOGGER = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TrainingPrecisionRuntime:
-    """Resolved mixed-precision runtime state."""
+    """Resolved mixed-precision runtime state.
+
+    ``autocast_factory`` is bound once with the resolved device type and
+    dtype, so each forward pass only calls it to open a fresh context.
+    """
 
     requested_mode: PrecisionMode
     resolved_mode: PrecisionMode
     autocast_enabled: bool
     autocast_dtype: Any | None
     scaler: Any | None
+    tf32_enabled: bool = False
+    autocast_factory: Callable[[], AbstractContextManager[Any]] = field(default=nullcontext)
 
 
 def build_training_precision_runtime(
     torch_module: Any,
     requested_mode: PrecisionMode,
     device: Any,
+    allow_tf32: bool = True,
 ) -> TrainingPrecisionRuntime:
-    """Resolve and construct mixed-precision runtime objects."""
+    """Resolve and construct mixed-precision runtime objects.
+
+    On Ampere or newer CUDA devices, auto and bf16 requests resolve to bf16
+    without a GradScaler, and fp32 runs switch float32 matmuls and cuDNN
+    convolutions to TF32 unless ``allow_tf32`` is False.
+    """
     device_type = _resolve_device_type(device)
-    resolved_mode = _resolve_precision_mode(torch_module, requested_mode, device_type)
+    ampere_or_newer = _is_ampere_or_newer(torch_module, device, device_type)
+    resolved_mode = _resolve_precision_mode(
+        torch_module, requested_mode, device_type, ampere_or_newer
+    )
+    tf32_enabled = allow_tf32 and resolved_mode == "fp32" and ampere_or_newer
+    if tf32_enabled:
+        _enable_tf32_matmul(torch_module)
     autocast_dtype = _resolve_autocast_dtype(torch_module, resolved_mode)
     scaler = _build_grad_scaler(torch_module, resolved_mode, device_type)
     runtime = TrainingPrecisionRuntime(
@@ -42,6 +67,8 @@ def build_training_precision_runtime(
         autocast_enabled=autocast_dtype is not None,
         autocast_dtype=autocast_dtype,
         scaler=scaler,
+        tf32_enabled=tf32_enabled,
+        autocast_factory=_build_autocast_factory(torch_module, device_type, autocast_dtype),
     )
     _LOGGER.info(
         "training_precision_resolved",
@@ -50,6 +77,7 @@ def build_training_precision_runtime(
         device_type=device_type,
         autocast_enabled=runtime.autocast_enabled,
         grad_scaler_enabled=runtime.scaler is not None,
+        tf32_enabled=runtime.tf32_enabled,
     )
     return runtime
 
@@ -65,6 +93,7 @@ def _resolve_precision_mode(
     torch_module: Any,
     requested_mode: PrecisionMode,
     device_type: str,
+    ampere_or_newer: bool,
 ) -> PrecisionMode:
     if requested_mode == "fp32":
         return "fp32"
@@ -78,7 +107,18 @@ def _resolve_precision_mode(
             )
         return "fp32"
     if requested_mode == "fp16":
+        if ampere_or_newer:
+            _LOGGER.warning(
+                "training_precision_suboptimal",
+                requested_mode=requested_mode,
+                recommended_mode="bf16",
+                reason="bf16_needs_no_grad_scaler",
+            )
         return "fp16"
+    # bf16 matches fp16 tensor-core throughput on Ampere+ with fp32 range,
+    # so no bf16 probe or loss scaling is needed there.
+    if ampere_or_newer:
+        return "bf16"
     if requested_mode == "bf16":
         if _is_bf16_supported(torch_module):
             return "bf16"
@@ -92,6 +132,9 @@ def _resolve_precision_mode(
     return "bf16" if _is_bf16_supported(torch_module) else "fp16"
 
 
+# Hardware capabilities do not change within a process, so the CUDA driver
+# queries behind these probes run once per torch module and device.
+@lru_cache(maxsize=PRECISION_PROBE_CACHE_SIZE)
 def _is_bf16_supported(torch_module: Any) -> bool:
     cuda_module = getattr(torch_module, "cuda", None)
     if cuda_module is None:
@@ -102,6 +145,23 @@ def _is_bf16_supported(torch_module: Any) -> bool:
     return False
 
 
+@lru_cache(maxsize=PRECISION_PROBE_CACHE_SIZE)
+def _is_ampere_or_newer(torch_module: Any, device: Any, device_type: str) -> bool:
+    if device_type != "cuda":
+        return False
+    capability_probe = getattr(getattr(torch_module, "cuda", None), "get_device_capability", None)
+    if not callable(capability_probe):
+        return False
+    major_version, _ = capability_probe(device)
+    return bool(major_version >= AMPERE_CUDA_CAPABILITY_MAJOR)
+
+
+def _enable_tf32_matmul(torch_module: Any) -> None:
+    torch_module.set_float32_matmul_precision(TF32_FLOAT32_MATMUL_PRECISION)
+    torch_module.backends.cuda.matmul.allow_tf32 = True
+    torch_module.backends.cudnn.allow_tf32 = True
+
+
 def _resolve_autocast_dtype(torch_module: Any, resolved_mode: PrecisionMode) -> Any | None:
     if resolved_mode == "fp16":
         return torch_module.float16
@@ -110,6 +170,17 @@ def _resolve_autocast_dtype(torch_module: Any, resolved_mode: PrecisionMode) ->
     return None
 
 
+def _build_autocast_factory(
+    torch_module: Any,
+    device_type: str,
+    autocast_dtype: Any | None,
+) -> Callable[[], AbstractContextManager[Any]]:
+    autocast_fn = getattr(torch_module, "autocast", None)
+    if autocast_dtype is None or autocast_fn is None:
+        return nullcontext
+    return partial(autocast_fn, device_type=device_type, dtype=autocast_dtype)
+
+
 def _build_grad_scaler(
     torch_module: Any,
     resolved_mode: PrecisionMode,
@@ -117,6 +188,11 @@ def _build_grad_scaler(
 ) -> Any | None:
     if resolved_mode != "fp16" or device_type != "cuda":
         return None
+    # torch.amp.GradScaler replaces the deprecated torch.cuda.amp.GradScaler,
+    # which warns on construction in recent releases.
+    device_grad_scaler_cls = getattr(getattr(torch_module, "amp", None), "GradScaler", None)
+    if device_grad_scaler_cls is not None:
+        return device_grad_scaler_cls(device_type, enabled=True)
     amp_module = getattr(getattr(torch_module, "cuda", None), "amp", None)
     if amp_module is None:
         return None
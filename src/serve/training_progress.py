@@ -10,12 +10,12 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
-from core.logging_config import get_logger
+from core.logging_config import get_logger, is_info_enabled
 
 _LOGGER = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TrainingProgressTracker:
     """Track and emit training progress events across epochs."""
 
@@ -27,6 +27,19 @@ class TrainingProgressTracker:
     batch_log_interval_steps: int
     run_started_at: float = field(default_factory=time.monotonic)
     current_epoch_started_at: float | None = None
+    _interval_mask: int | None = field(init=False, repr=False, default=None)
+    _epoch_log_fields: dict[str, object] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._epoch_log_fields = {
+            "dataset_name": self.dataset_name,
+            "total_epochs": self.total_epochs,
+        }
+        interval = self.batch_log_interval_steps
+        # Power-of-two intervals (the common 64/128/256 defaults) are checked
+        # with a bitmask instead of a modulo on every batch.
+        if interval > 0 and interval & (interval - 1) == 0:
+            self._interval_mask = interval - 1
 
     def log_training_started(self) -> None:
         """Log one event when a training run starts."""
@@ -49,6 +62,21 @@ class TrainingProgressTracker:
             total_epochs=self.total_epochs,
         )
 
+    def should_log_batch(self, batch_index: int, total_batches: int) -> bool:
+        """Return true when this batch is due for a progress event.
+
+        The first and last batches of an epoch always log.
+        """
+        if batch_index <= 1 or batch_index >= total_batches:
+            return True
+        if self._interval_mask is not None:
+            return not batch_index & self._interval_mask
+        return batch_index % self.batch_log_interval_steps == 0
+
+    def batch_progress_enabled(self) -> bool:
+        """Return whether batch progress events reach the logger at all."""
+        return is_info_enabled(_LOGGER)
+
     def log_batch_progress(
         self,
         phase: str,
@@ -58,8 +86,8 @@ class TrainingProgressTracker:
         global_step: int,
         loss: float,
     ) -> None:
-        """Log periodic batch progress updates during one epoch."""
-        if not _should_log_batch(batch_index, total_batches, self.batch_log_interval_steps):
+        """Log one batch progress update; callers pick batches with should_log_batch."""
+        if not is_info_enabled(_LOGGER):
             return
         progress_fraction = _progress_fraction(batch_index, total_batches)
         _LOGGER.info(
@@ -82,7 +110,10 @@ class TrainingProgressTracker:
         validation_loss: float,
         learning_rate: float,
     ) -> None:
-        """Log epoch completion summary with elapsed and ETA estimates."""
+        """Log epoch completion summary with elapsed and ETA estimates.
+
+        Validation loss is logged as None when the run has no validation batches.
+        """
         now = time.monotonic()
         epoch_elapsed_seconds = _elapsed_seconds(self.current_epoch_started_at, now)
         run_elapsed_seconds = now - self.run_started_at
@@ -91,11 +122,10 @@ class TrainingProgressTracker:
         eta_seconds = (run_elapsed_seconds / completed_epochs) * remaining_epochs
         _LOGGER.info(
             "training_epoch_completed",
-            dataset_name=self.dataset_name,
+            **self._epoch_log_fields,
             epoch=epoch_index,
-            total_epochs=self.total_epochs,
             train_loss=round(train_loss, 6),
-            validation_loss=round(validation_loss, 6),
+            validation_loss=round(validation_loss, 6) if self.validation_batch_count else None,
             learning_rate=round(learning_rate, 10),
             epoch_elapsed_seconds=round(epoch_elapsed_seconds, 3),
             run_elapsed_seconds=round(run_elapsed_seconds, 3),
@@ -103,13 +133,6 @@ class TrainingProgressTracker:
         )
 
 
-def _should_log_batch(batch_index: int, total_batches: int, interval: int) -> bool:
-    """Return true when the current batch should emit a progress event."""
-    if batch_index <= 1 or batch_index >= total_batches:
-        return True
-    return batch_index % interval == 0
-
-
 def _progress_fraction(batch_index: int, total_batches: int) -> float:
     """Compute bounded in-epoch progress fraction."""
     if total_batches <= 0:
@@ -136,3 +159,16 @@ def read_optimizer_learning_rate(optimizer: Any) -> float:
     if isinstance(learning_rate, (int, float)):
         return float(learning_rate)
     return 0.0
+
+
+def read_current_learning_rate(optimizer: Any, scheduler: Any | None) -> float:
+    """Read current learning rate, preferring the scheduler's last applied value.
+
+    A stepped scheduler already holds the rate it wrote into the param
+    groups, so reading it skips the param-group walk on the logging path.
+    """
+    if scheduler is not None:
+        last_learning_rates = scheduler.get_last_lr()
+        if last_learning_rates and isinstance(last_learning_rates[0], (int, float)):
+            return float(last_learning_rates[0])
+    return read_optimizer_learning_rate(optimizer)
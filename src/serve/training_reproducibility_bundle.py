@@ -6,14 +6,16 @@ training run deterministically in a future environment.
 
 from __future__ import annotations
 
-import json
 import platform
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Mapping
 
 from core.constants import DEFAULT_REPRODUCIBILITY_BUNDLE_FILE_NAME
 from core.errors import ForgeServeError
+from core.file_io import write_bytes_atomically
+from core.json_codec import dumps_pretty_json
 
 
 def save_reproducibility_bundle(
@@ -25,8 +27,13 @@ def save_reproducibility_bundle(
     random_seed: int,
     training_options: Mapping[str, object],
 ) -> Path:
-    """Persist one reproducibility bundle beside training artifacts."""
+    """Persist one reproducibility bundle beside training artifacts.
+
+    The bundle is written to a staging file and renamed into place, so a
+    failed write never leaves a truncated bundle behind.
+    """
     bundle_path = output_dir / DEFAULT_REPRODUCIBILITY_BUNDLE_FILE_NAME
+    python_version, platform_name = _platform_info()
     payload = {
         "run_id": run_id,
         "dataset_name": dataset_name,
@@ -34,15 +41,25 @@ def save_reproducibility_bundle(
         "config_hash": config_hash,
         "random_seed": random_seed,
         "created_at": datetime.now(timezone.utc).isoformat(),
-        "python_version": platform.python_version(),
-        "platform": platform.platform(),
+        "python_version": python_version,
+        "platform": platform_name,
         "training_options": dict(training_options),
     }
     try:
-        bundle_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        write_bytes_atomically(bundle_path, dumps_pretty_json(payload))
     except OSError as error:
         raise ForgeServeError(
             f"Failed to write reproducibility bundle at {bundle_path}: {error}. "
             "Check output directory permissions and retry."
         ) from error
     return bundle_path
+
+
+@lru_cache(maxsize=1)
+def _platform_info() -> tuple[str, str]:
+    """Return interpreter version and platform name, read once per process.
+
+    platform.platform() shells out to uname and reads OS release files, and
+    neither value can change while the process runs.
+    """
+    return platform.python_version(), platform.platform()
@@ -0,0 +1,59 @@
+"""Run index persistence for the training run registry.
+
+This module keeps the ordered list of run IDs in the registry index file.
+The parsed index is cached with the file's (mtime_ns, size) signature, so
+registering a run rewrites the file without re-reading and re-parsing it
+first, and duplicate checks use a set instead of scanning the list.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.errors import ForgeServeError
+from core.file_io import file_signature
+from serve.training_run_io import read_json_file, write_json_file
+
+
+class TrainingRunIndex:
+    """Ordered, de-duplicated run ID index backed by one JSON file."""
+
+    def __init__(self, index_path: Path) -> None:
+        self._index_path = index_path
+        self._cache: tuple[tuple[int, int], list[str], set[str]] | None = None
+
+    def run_ids(self) -> tuple[str, ...]:
+        """Return run IDs in insertion order."""
+        run_ids, _ = self._read()
+        return tuple(run_ids)
+
+    def append(self, run_id: str) -> None:
+        """Add one run ID unless it is already indexed."""
+        run_ids, known_run_ids = self._read()
+        if run_id in known_run_ids:
+            return
+        # The cached list is extended in place; drop the cache first so a
+        # failed write cannot leave an unpersisted ID behind a valid signature.
+        self._cache = None
+        run_ids.append(run_id)
+        known_run_ids.add(run_id)
+        write_json_file(self._index_path, {"runs": run_ids})
+        signature = file_signature(self._index_path)
+        if signature is not None:
+            self._cache = (signature, run_ids, known_run_ids)
+
+    def _read(self) -> tuple[list[str], set[str]]:
+        signature = file_signature(self._index_path)
+        if signature is None:
+            return [], set()
+        if self._cache is not None and self._cache[0] == signature:
+            return self._cache[1], self._cache[2]
+        payload = read_json_file(self._index_path)
+        if not isinstance(payload, dict) or not isinstance(payload.get("runs"), list):
+            raise ForgeServeError(
+                f"Invalid run index format at {self._index_path}: expected runs list."
+            )
+        run_ids = [str(item) for item in payload["runs"]]
+        known_run_ids = set(run_ids)
+        self._cache = (signature, run_ids, known_run_ids)
+        return run_ids, known_run_ids
@@ -6,15 +6,21 @@ import json
 from pathlib import Path
 
 from core.errors import ForgeServeError
+from core.file_io import write_bytes_atomically
+from core.json_codec import dumps_pretty_json, load_json_file
 
 
 def read_json_file(payload_path: Path, default_value: object | None = None) -> object:
-    """Read JSON payload from disk with optional default when missing."""
-    if default_value is not None and not payload_path.exists():
-        return default_value
+    """Read JSON payload from disk with optional default when missing.
+
+    Large lineage graphs are memory-mapped and decoded in place by the
+    shared JSON codec instead of being copied into a bytes object first.
+    """
     try:
-        return json.loads(payload_path.read_text(encoding="utf-8"))
+        return load_json_file(payload_path)
     except FileNotFoundError as error:
+        if default_value is not None:
+            return default_value
         raise ForgeServeError(
             f"Missing required run metadata at {payload_path}. Run may be incomplete."
         ) from error
@@ -25,8 +31,13 @@ def read_json_file(payload_path: Path, default_value: object | None = None) -> o
 
 
 def write_json_file(payload_path: Path, payload: object) -> None:
-    """Write one JSON payload to disk with traceable errors."""
+    """Write one JSON payload to disk atomically with traceable errors.
+
+    The payload goes to a per-process temporary file that then replaces the
+    target with one rename, so concurrent readers always see either the old
+    or the new complete document.
+    """
     try:
-        payload_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        write_bytes_atomically(payload_path, dumps_pretty_json(payload))
     except OSError as error:
         raise ForgeServeError(f"Failed to write metadata file {payload_path}: {error}.") from error
@@ -6,10 +6,12 @@ configured data-root so training runs remain inspectable and reproducible.
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import copy
+import secrets
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from uuid import uuid4
 
 from core.constants import (
     LINEAGE_DIR_NAME,
@@ -19,18 +21,60 @@ from core.constants import (
     RUNS_DIR_NAME,
 )
 from core.errors import ForgeServeError
+from core.file_io import file_signature
+from serve.training_run_index import TrainingRunIndex
 from serve.training_run_io import read_json_file, write_json_file
 from serve.training_run_types import (
     TrainingRunEvent,
     TrainingRunRecord,
     TrainingRunState,
     run_record_from_payload,
+    run_record_to_payload,
     validate_transition,
 )
 
+_EDGE_FIELDS = frozenset({"from", "to", "type"})
+
+
+@dataclass
+class _LineageGraph:
+    """Parsed lineage graph with a hash index over its edges."""
+
+    runs: dict[str, dict[str, object]]
+    edges: list[object]
+    edge_keys: set[tuple[str, str, str]]
+
+    @classmethod
+    def from_payload(cls, runs: dict[str, dict[str, object]], edges: list[object]) -> _LineageGraph:
+        edge_keys = {
+            (edge["from"], edge["to"], edge["type"])
+            for edge in edges
+            if isinstance(edge, dict)
+            and edge.keys() == _EDGE_FIELDS
+            and all(isinstance(value, str) for value in edge.values())
+        }
+        return cls(runs=runs, edges=edges, edge_keys=edge_keys)
+
+    def append_unique_edge(self, from_node: str, to_node: str, edge_type: str) -> None:
+        """Append one edge unless an identical edge exists, in O(1)."""
+        edge_key = (from_node, to_node, edge_type)
+        if edge_key in self.edge_keys:
+            return
+        self.edge_keys.add(edge_key)
+        self.edges.append({"from": from_node, "to": to_node, "type": edge_type})
+
 
 class TrainingRunRegistry:
-    """Persistent lifecycle and lineage registry for training runs."""
+    """Persistent lifecycle and lineage registry for training runs.
+
+    The parsed lineage graph is kept in memory with the (mtime_ns, size)
+    signature of the file it came from, so lineage updates skip re-reading
+    and re-parsing model_lineage.json unless another writer changed it.
+    Run records are cached the same way, keyed by run ID, so a transition
+    does not re-decode and re-validate the lifecycle file it just wrote.
+    The file itself stays a full JSON snapshot because the studio app
+    reads it directly.
+    """
 
     def __init__(self, data_root: Path) -> None:
         self._data_root = data_root.expanduser().resolve()
@@ -38,6 +82,9 @@ class TrainingRunRegistry:
         self._lineage_root = self._data_root / LINEAGE_DIR_NAME
         self._runs_root.mkdir(parents=True, exist_ok=True)
         self._lineage_root.mkdir(parents=True, exist_ok=True)
+        self._lineage_cache: tuple[tuple[int, int], _LineageGraph] | None = None
+        self._record_cache: dict[str, tuple[tuple[int, int], TrainingRunRecord]] = {}
+        self._run_index = TrainingRunIndex(self._runs_root / RUN_INDEX_FILE_NAME)
 
     def start_run(
         self,
@@ -48,8 +95,10 @@ class TrainingRunRegistry:
         config_hash: str,
     ) -> TrainingRunRecord:
         """Create a new queued run record and register lineage inputs."""
-        run_id = _build_run_id()
-        timestamp = _utc_now_iso()
+        # One clock read keeps the run ID and its created_at timestamp in step.
+        now = datetime.now(timezone.utc)
+        run_id = _build_run_id(now)
+        timestamp = now.isoformat()
         record = TrainingRunRecord(
             run_id=run_id,
             dataset_name=dataset_name,
@@ -63,7 +112,7 @@ class TrainingRunRegistry:
             events=(TrainingRunEvent(state="queued", timestamp=timestamp, message=None),),
         )
         self._write_run_record(record)
-        self._append_index_row(run_id)
+        self._run_index.append(run_id)
         self._append_lineage_inputs(record)
         return record
 
@@ -113,44 +162,41 @@ class TrainingRunRegistry:
 
     def list_runs(self) -> tuple[str, ...]:
         """List run IDs from lifecycle index in insertion order."""
-        index_path = self._runs_root / RUN_INDEX_FILE_NAME
-        payload = read_json_file(index_path, default_value={"runs": []})
-        if not isinstance(payload, dict) or not isinstance(payload.get("runs"), list):
-            raise ForgeServeError(f"Invalid run index format at {index_path}: expected runs list.")
-        return tuple(str(item) for item in payload["runs"])
+        return self._run_index.run_ids()
 
     def load_lineage_graph(self) -> dict[str, object]:
         """Load current lineage graph payload."""
-        runs_payload, edges_payload = self._read_lineage_graph()
-        return {"runs": runs_payload, "edges": edges_payload}
+        lineage_graph = self._read_lineage_graph()
+        return copy.deepcopy({"runs": lineage_graph.runs, "edges": lineage_graph.edges})
 
     def _write_run_record(self, record: TrainingRunRecord) -> None:
         run_dir = self._runs_root / record.run_id
         run_dir.mkdir(parents=True, exist_ok=True)
-        payload = asdict(record)
-        payload["events"] = [asdict(event) for event in record.events]
-        write_json_file(run_dir / RUN_STATE_FILE_NAME, payload)
+        state_path = run_dir / RUN_STATE_FILE_NAME
+        self._record_cache.pop(record.run_id, None)
+        write_json_file(state_path, run_record_to_payload(record))
+        signature = file_signature(state_path)
+        if signature is not None:
+            self._record_cache[record.run_id] = (signature, record)
 
     def _load_run_record(self, run_id: str) -> TrainingRunRecord:
         state_path = self._runs_root / run_id / RUN_STATE_FILE_NAME
+        signature = file_signature(state_path)
+        cached = self._record_cache.get(run_id)
+        # Records are frozen, so a cached instance can be shared safely.
+        if cached is not None and cached[0] == signature:
+            return cached[1]
         payload = read_json_file(state_path)
         if not isinstance(payload, dict):
             raise ForgeServeError(f"Invalid run state payload at {state_path}: expected object.")
-        return run_record_from_payload(payload, state_path)
-
-    def _append_index_row(self, run_id: str) -> None:
-        index_path = self._runs_root / RUN_INDEX_FILE_NAME
-        payload = read_json_file(index_path, default_value={"runs": []})
-        if not isinstance(payload, dict) or not isinstance(payload.get("runs"), list):
-            raise ForgeServeError(f"Invalid run index format at {index_path}: expected runs list.")
-        run_ids = payload["runs"]
-        if run_id not in run_ids:
-            run_ids.append(run_id)
-            write_json_file(index_path, payload)
+        record = run_record_from_payload(payload, state_path)
+        if signature is not None:
+            self._record_cache[run_id] = (signature, record)
+        return record
 
     def _append_lineage_inputs(self, record: TrainingRunRecord) -> None:
-        runs_payload, edges_payload = self._read_lineage_graph()
-        runs_payload[record.run_id] = {
+        lineage_graph = self._read_lineage_graph()
+        lineage_graph.runs[record.run_id] = {
             "dataset_name": record.dataset_name,
             "dataset_version_id": record.dataset_version_id,
             "output_dir": record.output_dir,
@@ -159,20 +205,18 @@ class TrainingRunRegistry:
             "created_at": record.created_at,
             "artifact_contract_path": record.artifact_contract_path,
         }
-        _append_unique_edge(
-            edges_payload,
+        lineage_graph.append_unique_edge(
             from_node=f"dataset:{record.dataset_name}:{record.dataset_version_id}",
             to_node=f"run:{record.run_id}",
             edge_type="trained_on",
         )
         if record.parent_model_path:
-            _append_unique_edge(
-                edges_payload,
+            lineage_graph.append_unique_edge(
                 from_node=f"model:{record.parent_model_path}",
                 to_node=f"run:{record.run_id}",
                 edge_type="initialized_from",
             )
-        self._write_lineage_graph(runs_payload, edges_payload)
+        self._write_lineage_graph(lineage_graph)
 
     def _update_lineage_outputs(
         self,
@@ -180,25 +224,29 @@ class TrainingRunRegistry:
         artifact_contract_path: str | None,
         model_path: str | None,
     ) -> None:
-        runs_payload, edges_payload = self._read_lineage_graph()
-        run_payload = runs_payload.get(run_id)
+        lineage_graph = self._read_lineage_graph()
+        run_payload = lineage_graph.runs.get(run_id)
         if isinstance(run_payload, dict):
             if artifact_contract_path:
                 run_payload["artifact_contract_path"] = artifact_contract_path
             if model_path:
                 run_payload["model_path"] = model_path
         if model_path:
-            _append_unique_edge(
-                edges_payload,
+            lineage_graph.append_unique_edge(
                 from_node=f"run:{run_id}",
                 to_node=f"model:{model_path}",
                 edge_type="produced",
             )
-        self._write_lineage_graph(runs_payload, edges_payload)
+        self._write_lineage_graph(lineage_graph)
 
-    def _read_lineage_graph(self) -> tuple[dict[str, dict[str, object]], list[object]]:
+    def _read_lineage_graph(self) -> _LineageGraph:
         graph_path = self._lineage_root / LINEAGE_GRAPH_FILE_NAME
-        payload = read_json_file(graph_path, default_value={"runs": {}, "edges": []})
+        signature = file_signature(graph_path)
+        if signature is None:
+            return _LineageGraph.from_payload({}, [])
+        if self._lineage_cache is not None and self._lineage_cache[0] == signature:
+            return self._lineage_cache[1]
+        payload = read_json_file(graph_path)
         if not isinstance(payload, dict):
             raise ForgeServeError(f"Invalid lineage graph at {graph_path}: expected object.")
         runs_payload = payload.get("runs")
@@ -209,34 +257,28 @@ class TrainingRunRegistry:
         for run_id, run_payload in runs_payload.items():
             if isinstance(run_id, str) and isinstance(run_payload, dict):
                 normalized_runs[run_id] = run_payload
-        return normalized_runs, edges_payload
+        lineage_graph = _LineageGraph.from_payload(normalized_runs, edges_payload)
+        self._lineage_cache = (signature, lineage_graph)
+        return lineage_graph
 
-    def _write_lineage_graph(
-        self,
-        runs_payload: dict[str, dict[str, object]],
-        edges_payload: list[object],
-    ) -> None:
-        write_json_file(
-            self._lineage_root / LINEAGE_GRAPH_FILE_NAME,
-            {"runs": runs_payload, "edges": edges_payload},
-        )
+    def _write_lineage_graph(self, lineage_graph: _LineageGraph) -> None:
+        graph_path = self._lineage_root / LINEAGE_GRAPH_FILE_NAME
+        # Callers mutate the cached graph in place; drop it first so a failed
+        # write cannot leave unpersisted edits behind a still-valid signature.
+        self._lineage_cache = None
+        write_json_file(graph_path, {"runs": lineage_graph.runs, "edges": lineage_graph.edges})
+        signature = file_signature(graph_path)
+        if signature is not None:
+            self._lineage_cache = (signature, lineage_graph)
 
 
-def _build_run_id() -> str:
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
-    return f"run-{timestamp}-{uuid4().hex[:8]}"
+def _build_run_id(now: datetime) -> str:
+    timestamp = now.strftime("%Y%m%dT%H%M%S%fZ")
+    return f"run-{timestamp}-{secrets.token_hex(4)}"
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
-
-
-def _append_unique_edge(
-    edges_payload: list[object],
-    from_node: str,
-    to_node: str,
-    edge_type: str,
-) -> None:
-    candidate = {"from": from_node, "to": to_node, "type": edge_type}
-    if candidate not in edges_payload:
-        edges_payload.append(candidate)
+    # Formats the wall clock directly instead of building a datetime per
+    # transition; the output matches datetime.isoformat() for UTC times.
+    seconds, microseconds = divmod(time.time_ns() // 1_000, 1_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{microseconds:06d}+00:00"
@@ -6,9 +6,10 @@ and SDK calls that inspect persisted training execution metadata.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, cast
+from typing import Literal
 
 from core.errors import ForgeServeError
 
@@ -28,9 +29,14 @@ ALLOWED_STATE_TRANSITIONS: dict[TrainingRunState, tuple[TrainingRunState, ...]]
     "failed": (),
     "cancelled": (),
 }
+# Maps parsed state strings onto the module's own interned literals, so
+# every loaded event shares one string object per state.
+_CANONICAL_STATES: dict[str, TrainingRunState] = {
+    state: state for state in ALLOWED_STATE_TRANSITIONS
+}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrainingRunEvent:
     """One lifecycle state transition event."""
 
@@ -39,7 +45,7 @@ class TrainingRunEvent:
     message: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrainingRunRecord:
     """Persisted training lifecycle metadata."""
 
@@ -67,17 +73,42 @@ def validate_transition(current: TrainingRunState, next_state: TrainingRunState)
         )
 
 
+def run_record_to_payload(record: TrainingRunRecord) -> dict[str, object]:
+    """Serialize a lifecycle record into a JSON-friendly payload.
+
+    Fields are listed directly, in declaration order, instead of going
+    through ``asdict``, which deep-copies every event before it is dumped.
+    """
+    return {
+        "run_id": record.run_id,
+        "dataset_name": record.dataset_name,
+        "dataset_version_id": record.dataset_version_id,
+        "output_dir": record.output_dir,
+        "parent_model_path": record.parent_model_path,
+        "config_hash": record.config_hash,
+        "state": record.state,
+        "created_at": record.created_at,
+        "updated_at": record.updated_at,
+        "events": [
+            {"state": event.state, "timestamp": event.timestamp, "message": event.message}
+            for event in record.events
+        ],
+        "artifact_contract_path": record.artifact_contract_path,
+        "error_message": record.error_message,
+    }
+
+
 def run_record_from_payload(payload: dict[str, object], payload_path: Path) -> TrainingRunRecord:
     """Deserialize a lifecycle record payload from JSON."""
     raw_events = payload.get("events")
     if not isinstance(raw_events, list):
         raise ForgeServeError(f"Invalid run state at {payload_path}: events must be a list.")
-    events = tuple(run_event_from_payload(item, payload_path) for item in raw_events)
+    events = tuple([run_event_from_payload(item, payload_path) for item in raw_events])
     state = parse_state(payload.get("state"), payload_path)
     try:
         return TrainingRunRecord(
             run_id=str(payload["run_id"]),
-            dataset_name=str(payload["dataset_name"]),
+            dataset_name=sys.intern(str(payload["dataset_name"])),
             dataset_version_id=str(payload["dataset_version_id"]),
             output_dir=str(payload["output_dir"]),
             parent_model_path=optional_string(payload.get("parent_model_path")),
@@ -96,20 +127,30 @@ def run_record_from_payload(payload: dict[str, object], payload_path: Path) -> T
 
 
 def run_event_from_payload(payload: object, payload_path: Path) -> TrainingRunEvent:
-    """Deserialize one run event payload from JSON."""
+    """Deserialize one run event payload from JSON.
+
+    Records can hold many events, so string fields are passed through
+    without a conversion call and the event is built positionally.
+    """
     if not isinstance(payload, dict):
         raise ForgeServeError(f"Invalid run event at {payload_path}: expected object entries.")
+    raw_state = payload.get("state")
+    state = _CANONICAL_STATES.get(raw_state) if type(raw_state) is str else None
+    if state is None:
+        state = parse_state(raw_state, payload_path)
+    timestamp = payload.get("timestamp", "")
+    message = payload.get("message")
     return TrainingRunEvent(
-        state=parse_state(payload.get("state"), payload_path),
-        timestamp=str(payload.get("timestamp", "")),
-        message=optional_string(payload.get("message")),
+        state,
+        timestamp if type(timestamp) is str else str(timestamp),
+        message if message is None or type(message) is str else str(message),
     )
 
 
 def parse_state(raw_state: object, payload_path: Path) -> TrainingRunState:
     """Parse one training state value from persisted payload."""
-    if isinstance(raw_state, str) and raw_state in ALLOWED_STATE_TRANSITIONS:
-        return cast(TrainingRunState, raw_state)
+    if isinstance(raw_state, str) and raw_state in _CANONICAL_STATES:
+        return _CANONICAL_STATES[raw_state]
     allowed = ", ".join(ALLOWED_STATE_TRANSITIONS.keys())
     raise ForgeServeError(f"Invalid run state at {payload_path}: expected one of {allowed}.")
 
@@ -7,42 +7,47 @@ artifacts, lifecycle metadata, and lineage links for each training run.
 from __future__ import annotations
 
 import random
-from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
 from core.errors import ForgeDependencyError, ForgeServeError
-from core.types import BatchLossMetric, DataRecord, EpochMetric, TrainingOptions, TrainingRunResult
+from core.training_types import TrainingRunResult
+from core.types import DataRecord, TrainingOptions
 from serve.architecture_loader import load_training_model
 from serve.device_selection import resolve_execution_device
+from serve.gradient_checkpointing import apply_gradient_checkpointing
+from serve.model_compilation import compile_training_model
 from serve.model_weights import load_initial_weights
 from serve.tokenization import (
     SequenceBatch,
-    build_sequence_batches,
+    build_length_bucketed_batches,
     build_training_sequences,
     split_sequences,
 )
-from serve.training_artifact_contract import save_training_artifact_contract
-from serve.training_artifacts import (
-    ensure_training_output_dir,
-    save_model_weights,
-    save_training_history,
-    save_training_plot,
-)
+from serve.tokenizer_cache import load_or_fit_training_tokenizer
+from serve.training_artifacts import ensure_training_output_dir
+from serve.training_batch_transfer import build_batch_transfer
 from serve.training_config_hash import compute_training_config_hash
 from serve.training_context import TrainingRuntimeContext
-from serve.training_execution import TrainingLoopResult, run_training_loop
+from serve.training_distributed import (
+    DistributedRuntime,
+    destroy_distributed_process_group,
+    init_distributed_device,
+    read_distributed_runtime,
+    shard_for_rank,
+    wrap_distributed_model,
+)
+from serve.training_execution import run_training_loop
 from serve.training_hooks import (
     build_loss_function_from_hooks,
     invoke_hook,
     load_training_hooks,
 )
-from serve.training_metadata import save_tokenizer_vocabulary, save_training_config
 from serve.training_optimization import build_training_optimization
+from serve.training_outputs import persist_training_outputs
 from serve.training_precision import build_training_precision_runtime
-from serve.training_reproducibility_bundle import save_reproducibility_bundle
 from serve.training_run_registry import TrainingRunRegistry
-from serve.training_setup import fit_training_tokenizer, validate_training_options
+from serve.training_setup import validate_training_options
 
 
 def run_training(
@@ -52,8 +57,34 @@ def run_training(
     data_root: Path,
     dataset_version_id: str,
 ) -> TrainingRunResult:
-    """Run a full training workflow and persist run lifecycle metadata."""
+    """Run a full training workflow and persist run lifecycle metadata.
+
+    Under a multi-process launcher only the primary rank records the run
+    and writes artifacts; other ranks train their data shard and return a
+    result without artifact paths. Every rank leaves the process group when
+    its run ends, whether it succeeded or failed.
+    """
     config_hash = compute_training_config_hash(options)
+    distributed = read_distributed_runtime()
+    run_rank = _run_primary_rank if distributed.is_primary else _run_secondary_rank
+    try:
+        return run_rank(
+            records, options, random_seed, data_root, dataset_version_id, config_hash, distributed
+        )
+    finally:
+        destroy_distributed_process_group(distributed)
+
+
+def _run_primary_rank(
+    records: list[DataRecord],
+    options: TrainingOptions,
+    random_seed: int,
+    data_root: Path,
+    dataset_version_id: str,
+    config_hash: str,
+    distributed: DistributedRuntime,
+) -> TrainingRunResult:
+    """Train the primary rank and record the run lifecycle in the registry."""
     run_registry = TrainingRunRegistry(data_root)
     run_record = run_registry.start_run(
         dataset_name=options.dataset_name,
@@ -68,15 +99,17 @@ def run_training(
             records=records,
             options=options,
             random_seed=random_seed,
+            data_root=data_root,
             run_id=run_record.run_id,
             dataset_version_id=dataset_version_id,
             config_hash=config_hash,
             run_registry=run_registry,
+            distributed=distributed,
         )
         run_registry.transition(run_record.run_id, "running")
         invoke_hook("on_run_start", context.hooks.on_run_start, context)
         loop_result = run_training_loop(context)
-        result = _persist_training_outputs(
+        result = persist_training_outputs(
             context=context,
             loop_result=loop_result,
             run_id=run_record.run_id,
@@ -99,20 +132,53 @@ def run_training(
         raise
 
 
+def _run_secondary_rank(
+    records: list[DataRecord],
+    options: TrainingOptions,
+    random_seed: int,
+    data_root: Path,
+    dataset_version_id: str,
+    config_hash: str,
+    distributed: DistributedRuntime,
+) -> TrainingRunResult:
+    """Train one non-primary rank's shard without registry or artifact writes."""
+    context = _build_runtime_context(
+        records=records,
+        options=options,
+        random_seed=random_seed,
+        data_root=data_root,
+        run_id=None,
+        dataset_version_id=dataset_version_id,
+        config_hash=config_hash,
+        run_registry=None,
+        distributed=distributed,
+    )
+    loop_result = run_training_loop(context)
+    return TrainingRunResult(
+        model_path="",
+        history_path="",
+        plot_path=None,
+        epochs_completed=len(loop_result.epoch_metrics),
+        resumed_from_checkpoint=loop_result.resumed_from_checkpoint,
+    )
+
+
 def _build_runtime_context(
     records: list[DataRecord],
     options: TrainingOptions,
     random_seed: int,
-    run_id: str,
+    data_root: Path,
+    run_id: str | None,
     dataset_version_id: str,
     config_hash: str,
-    run_registry: TrainingRunRegistry,
+    run_registry: TrainingRunRegistry | None,
+    distributed: DistributedRuntime,
 ) -> TrainingRuntimeContext:
     """Build an initialized runtime context from records and options."""
     torch_module = _import_torch()
     validate_training_options(options)
     output_dir = ensure_training_output_dir(options.output_dir)
-    tokenizer = fit_training_tokenizer(records, options)
+    tokenizer = load_or_fit_training_tokenizer(records, options, data_root, dataset_version_id)
     sequences = build_training_sequences(records, tokenizer, options.max_token_length)
     if not sequences:
         raise ForgeServeError(
@@ -120,9 +186,10 @@ def _build_runtime_context(
             "Check dataset content and max token length."
         )
     random.Random(random_seed).shuffle(sequences)
-    train_batches, validation_batches = _build_batches(sequences, options)
+    sequences = shard_for_rank(sequences, distributed)
+    train_batches, validation_batches = _build_batches(sequences, options, random_seed)
     model = load_training_model(torch_module, options, len(tokenizer.vocabulary))
-    device = _resolve_training_device(torch_module)
+    device = _resolve_training_device(torch_module, distributed)
     model = model.to(device)
     load_initial_weights(
         torch_module=torch_module,
@@ -130,10 +197,13 @@ def _build_runtime_context(
         initial_weights_path=options.initial_weights_path,
         device=device,
     )
+    apply_gradient_checkpointing(torch_module, model, options)
+    compile_training_model(model, options)
     precision_runtime = build_training_precision_runtime(
         torch_module=torch_module,
         requested_mode=options.precision_mode,
         device=device,
+        allow_tf32=options.allow_tf32,
     )
     optimization = build_training_optimization(torch_module, model, options)
     hooks = load_training_hooks(options.hooks_path)
@@ -143,7 +213,7 @@ def _build_runtime_context(
         optimizer=optimization.optimizer,
         scheduler=optimization.scheduler,
         precision_runtime=precision_runtime,
-        loss_function=torch_module.nn.CrossEntropyLoss(ignore_index=0),
+        loss_function=None,
         train_batches=train_batches,
         validation_batches=validation_batches,
         tokenizer=tokenizer,
@@ -155,7 +225,12 @@ def _build_runtime_context(
         config_hash=config_hash,
         hooks=hooks,
         run_registry=run_registry,
+        batch_transfer=build_batch_transfer(torch_module, device),
+        distributed=distributed,
+        parallel_model=wrap_distributed_model(torch_module, model, device, distributed),
     )
+    # The criterion is resolved after construction because hook-provided
+    # builders receive the runtime context itself.
     context.loss_function = build_loss_function_from_hooks(
         torch_module=torch_module,
         hooks=hooks,
@@ -164,75 +239,6 @@ def _build_runtime_context(
     return context
 
 
-def _persist_training_outputs(
-    context: TrainingRuntimeContext,
-    loop_result: TrainingLoopResult,
-    run_id: str,
-    dataset_version_id: str,
-    config_hash: str,
-    random_seed: int,
-) -> TrainingRunResult:
-    """Persist model/history/plot outputs and return summary metadata."""
-    model_path = save_model_weights(context.output_dir, context.torch_module, context.model)
-    config_path = save_training_config(context.output_dir, context.options)
-    tokenizer_path = save_tokenizer_vocabulary(context.output_dir, context.tokenizer)
-    history_path = save_training_history(
-        context.output_dir,
-        loop_result.epoch_metrics,
-        loop_result.batch_metrics,
-    )
-    plot_path = _try_save_plot(
-        context.output_dir,
-        loop_result.epoch_metrics,
-        loop_result.batch_metrics,
-    )
-    reproducibility_bundle_path = save_reproducibility_bundle(
-        output_dir=context.output_dir,
-        run_id=run_id,
-        dataset_name=context.options.dataset_name,
-        dataset_version_id=dataset_version_id,
-        config_hash=config_hash,
-        random_seed=random_seed,
-        training_options=asdict(context.options),
-    )
-    base_result = TrainingRunResult(
-        model_path=str(model_path),
-        history_path=str(history_path),
-        plot_path=str(plot_path) if plot_path else None,
-        epochs_completed=len(loop_result.epoch_metrics),
-        checkpoint_dir=str(loop_result.checkpoint_dir) if loop_result.checkpoint_dir else None,
-        best_checkpoint_path=(
-            str(loop_result.best_checkpoint_path) if loop_result.best_checkpoint_path else None
-        ),
-        resumed_from_checkpoint=loop_result.resumed_from_checkpoint,
-        run_id=run_id,
-        artifact_contract_path=None,
-    )
-    contract_path = save_training_artifact_contract(
-        output_dir=context.output_dir,
-        run_id=run_id,
-        dataset_name=context.options.dataset_name,
-        dataset_version_id=dataset_version_id,
-        parent_model_path=context.options.initial_weights_path,
-        config_hash=config_hash,
-        result=base_result,
-        tokenizer_path=str(tokenizer_path),
-        training_config_path=str(config_path),
-        reproducibility_bundle_path=str(reproducibility_bundle_path),
-    )
-    return TrainingRunResult(
-        model_path=base_result.model_path,
-        history_path=base_result.history_path,
-        plot_path=base_result.plot_path,
-        epochs_completed=base_result.epochs_completed,
-        checkpoint_dir=base_result.checkpoint_dir,
-        best_checkpoint_path=base_result.best_checkpoint_path,
-        resumed_from_checkpoint=base_result.resumed_from_checkpoint,
-        run_id=run_id,
-        artifact_contract_path=str(contract_path),
-    )
-
-
 def _import_torch() -> Any:
     """Import torch dependency used by training workflows."""
     try:
@@ -247,34 +253,35 @@ def _import_torch() -> Any:
 def _build_batches(
     sequences: list[list[int]],
     options: TrainingOptions,
+    random_seed: int,
 ) -> tuple[list[SequenceBatch], list[SequenceBatch]]:
-    """Build train and validation sequence batches from tokenized sequences."""
+    """Build length-bucketed train and validation batches from tokenized sequences."""
     train_sequences, validation_sequences = split_sequences(
         sequences,
         options.validation_split,
     )
-    train_batches = build_sequence_batches(train_sequences, options.batch_size)
-    validation_batches = build_sequence_batches(validation_sequences, options.batch_size)
+    train_batches = build_length_bucketed_batches(
+        train_sequences,
+        options.batch_size,
+        options.length_bucket_count,
+        random_seed,
+    )
+    validation_batches = build_length_bucketed_batches(
+        validation_sequences,
+        options.batch_size,
+        options.length_bucket_count,
+        random_seed,
+    )
     return train_batches, validation_batches
 
 
-def _resolve_training_device(torch_module: Any) -> Any:
-    """Resolve device preference for training execution."""
+def _resolve_training_device(torch_module: Any, distributed: DistributedRuntime) -> Any:
+    """Resolve device preference, joining the process group for multi-process runs."""
+    if distributed.enabled:
+        return init_distributed_device(torch_module, distributed)
     return resolve_execution_device(torch_module)
 
 
-def _try_save_plot(
-    output_dir: Path,
-    epoch_metrics: list[EpochMetric],
-    batch_metrics: list[BatchLossMetric],
-) -> Path | None:
-    """Save training plot unless plotting dependency is unavailable."""
-    try:
-        return save_training_plot(output_dir, epoch_metrics, batch_metrics)
-    except ForgeDependencyError:
-        return None
-
-
 def _invoke_error_hook(context: TrainingRuntimeContext, error: Exception) -> None:
     """Invoke run-error hook without replacing the original training failure."""
     try:
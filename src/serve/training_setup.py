@@ -7,6 +7,9 @@ It keeps validation and tokenizer fitting isolated from loop execution.
 from __future__ import annotations
 
 from core.constants import (
+    SUPPORTED_POSITION_EMBEDDING_TYPES,
+    SUPPORTED_TRAIN_CHECKPOINT_FORMATS,
+    SUPPORTED_TRAIN_COMPILE_MODES,
     SUPPORTED_TRAIN_OPTIMIZER_TYPES,
     SUPPORTED_TRAIN_PRECISION_MODES,
     SUPPORTED_TRAIN_SCHEDULER_TYPES,
@@ -23,132 +26,101 @@ def fit_training_tokenizer(
     """Build tokenizer vocabulary from record texts."""
     tokenizer = VocabularyTokenizer.create()
     tokenizer.fit(
-        (record.text for record in records),
+        [record.text for record in records],
         max_vocabulary_size=options.vocabulary_size,
     )
     return tokenizer
 
 
 def validate_training_options(options: TrainingOptions) -> None:
-    """Validate training options before loop execution."""
-    _validate_core_options(options)
-    _validate_optimizer_options(options)
-    _validate_scheduler_options(options)
-    _validate_architecture_options(options)
-    _validate_checkpoint_options(options)
-
-
-def _validate_core_options(options: TrainingOptions) -> None:
-    if options.epochs < 1:
-        raise ForgeServeError(f"Invalid epochs value {options.epochs}: expected value >= 1.")
-    if options.batch_size < 1:
-        raise ForgeServeError(f"Invalid batch_size {options.batch_size}: expected value >= 1.")
-    if options.max_token_length < 4:
-        raise ForgeServeError(
-            f"Invalid max_token_length {options.max_token_length}: expected value >= 4."
-        )
+    """Validate training options before loop execution.
+
+    Lower bounds, [0, 1) fractions, and enumerated choices are checked from
+    the rule tables below, so messages are only formatted on failure; rules
+    that relate several fields stay explicit.
+    """
+    for field_name, minimum in _MINIMUM_VALUES:
+        _require_minimum(field_name, getattr(options, field_name), minimum)
+    for field_name, minimum in _OPTIONAL_MINIMUM_VALUES:
+        value = getattr(options, field_name)
+        if value is not None:
+            _require_minimum(field_name, value, minimum)
+    for field_name in _UNIT_INTERVAL_FIELDS:
+        value = getattr(options, field_name)
+        if not 0 <= value < 1:
+            raise ForgeServeError(f"Invalid {field_name} {value}: expected value in [0, 1).")
+    for field_name, supported_values in _SUPPORTED_VALUES:
+        value = getattr(options, field_name)
+        if value not in supported_values:
+            raise ForgeServeError(
+                f"Invalid {field_name} {value!r}: expected one of {', '.join(supported_values)}."
+            )
     if options.learning_rate <= 0:
         raise ForgeServeError(
             f"Invalid learning_rate {options.learning_rate}: expected positive value."
         )
-    if options.precision_mode not in SUPPORTED_TRAIN_PRECISION_MODES:
-        raise ForgeServeError(
-            f"Invalid precision_mode {options.precision_mode!r}: expected one of "
-            f"{', '.join(SUPPORTED_TRAIN_PRECISION_MODES)}."
-        )
-    if not 0 <= options.validation_split < 1:
-        raise ForgeServeError("Invalid validation_split: expected value in [0, 1).")
+    _validate_scheduler_options(options)
+    _validate_field_combinations(options)
 
 
-def _validate_optimizer_options(options: TrainingOptions) -> None:
-    if options.optimizer_type not in SUPPORTED_TRAIN_OPTIMIZER_TYPES:
-        raise ForgeServeError(
-            f"Invalid optimizer_type {options.optimizer_type!r}: expected one of "
-            f"{', '.join(SUPPORTED_TRAIN_OPTIMIZER_TYPES)}."
-        )
-    if options.weight_decay < 0:
-        raise ForgeServeError(f"Invalid weight_decay {options.weight_decay}: expected value >= 0.")
-    if options.sgd_momentum < 0:
-        raise ForgeServeError(f"Invalid sgd_momentum {options.sgd_momentum}: expected value >= 0.")
+def _require_minimum(field_name: str, value: float, minimum: float) -> None:
+    if value < minimum:
+        raise ForgeServeError(f"Invalid {field_name} {value}: expected value >= {minimum}.")
 
 
 def _validate_scheduler_options(options: TrainingOptions) -> None:
-    if options.scheduler_type not in SUPPORTED_TRAIN_SCHEDULER_TYPES:
-        raise ForgeServeError(
-            f"Invalid scheduler_type {options.scheduler_type!r}: expected one of "
-            f"{', '.join(SUPPORTED_TRAIN_SCHEDULER_TYPES)}."
-        )
     if options.scheduler_type == "step":
-        if options.scheduler_step_size < 1:
-            raise ForgeServeError(
-                f"Invalid scheduler_step_size {options.scheduler_step_size}: expected value >= 1."
-            )
+        _require_minimum("scheduler_step_size", options.scheduler_step_size, 1)
         if not 0 < options.scheduler_gamma < 1:
             raise ForgeServeError(
                 f"Invalid scheduler_gamma {options.scheduler_gamma}: expected value in (0, 1)."
             )
     if options.scheduler_type == "cosine":
-        if options.scheduler_t_max_epochs is not None and options.scheduler_t_max_epochs < 1:
-            raise ForgeServeError(
-                f"Invalid scheduler_t_max_epochs {options.scheduler_t_max_epochs}: expected >= 1."
-            )
-        if options.scheduler_eta_min < 0:
-            raise ForgeServeError(
-                f"Invalid scheduler_eta_min {options.scheduler_eta_min}: expected value >= 0."
-            )
+        if options.scheduler_t_max_epochs is not None:
+            _require_minimum("scheduler_t_max_epochs", options.scheduler_t_max_epochs, 1)
+        _require_minimum("scheduler_eta_min", options.scheduler_eta_min, 0)
 
 
-def _validate_architecture_options(options: TrainingOptions) -> None:
-    if options.hidden_dim < 1:
-        raise ForgeServeError(f"Invalid hidden_dim {options.hidden_dim}: expected value >= 1.")
-    if options.num_layers < 1:
-        raise ForgeServeError(f"Invalid num_layers {options.num_layers}: expected value >= 1.")
-    if options.attention_heads < 1:
-        raise ForgeServeError(
-            f"Invalid attention_heads {options.attention_heads}: expected value >= 1."
-        )
+def _validate_field_combinations(options: TrainingOptions) -> None:
     if options.hidden_dim % options.attention_heads != 0:
         raise ForgeServeError(
             f"Invalid configuration: hidden_dim {options.hidden_dim} must be divisible by "
             f"attention_heads {options.attention_heads}."
         )
-    if options.mlp_hidden_dim < 1:
-        raise ForgeServeError(
-            f"Invalid mlp_hidden_dim {options.mlp_hidden_dim}: expected value >= 1."
-        )
-    if options.mlp_layers < 1:
-        raise ForgeServeError(f"Invalid mlp_layers {options.mlp_layers}: expected value >= 1.")
-    if not 0 <= options.dropout < 1:
-        raise ForgeServeError(f"Invalid dropout {options.dropout}: expected value in [0, 1).")
-    if options.position_embedding_type not in {"learned", "sinusoidal"}:
-        raise ForgeServeError(
-            "Invalid position_embedding_type "
-            f"{options.position_embedding_type!r}: expected 'learned' or 'sinusoidal'."
-        )
-    if options.vocabulary_size is not None and options.vocabulary_size < 2:
-        raise ForgeServeError(
-            f"Invalid vocabulary_size {options.vocabulary_size}: expected value >= 2."
-        )
-
-
-def _validate_checkpoint_options(options: TrainingOptions) -> None:
-    if options.checkpoint_every_epochs < 1:
-        raise ForgeServeError(
-            "Invalid checkpoint_every_epochs "
-            f"{options.checkpoint_every_epochs}: expected value >= 1."
-        )
-    if options.max_checkpoint_files is not None and options.max_checkpoint_files < 1:
-        raise ForgeServeError(
-            f"Invalid max_checkpoint_files {options.max_checkpoint_files}: expected >= 1."
-        )
-    if options.progress_log_interval_steps < 1:
-        raise ForgeServeError(
-            "Invalid progress_log_interval_steps "
-            f"{options.progress_log_interval_steps}: expected value >= 1."
-        )
     if options.initial_weights_path and options.resume_checkpoint_path:
         raise ForgeServeError(
             "Invalid configuration: initial_weights_path and resume_checkpoint_path are "
             "mutually exclusive. Use resume_checkpoint_path to continue a prior run or "
             "initial_weights_path to start fine-tuning from model weights."
         )
+
+
+_MINIMUM_VALUES: tuple[tuple[str, int], ...] = (
+    ("epochs", 1),
+    ("batch_size", 1),
+    ("gradient_accumulation_steps", 1),
+    ("length_bucket_count", 1),
+    ("max_token_length", 4),
+    ("weight_decay", 0),
+    ("sgd_momentum", 0),
+    ("hidden_dim", 1),
+    ("num_layers", 1),
+    ("attention_heads", 1),
+    ("mlp_hidden_dim", 1),
+    ("mlp_layers", 1),
+    ("checkpoint_every_epochs", 1),
+    ("progress_log_interval_steps", 1),
+)
+_OPTIONAL_MINIMUM_VALUES: tuple[tuple[str, int], ...] = (
+    ("vocabulary_size", 2),
+    ("max_checkpoint_files", 1),
+)
+_UNIT_INTERVAL_FIELDS: tuple[str, ...] = ("validation_split", "dropout")
+_SUPPORTED_VALUES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("precision_mode", SUPPORTED_TRAIN_PRECISION_MODES),
+    ("compile_mode", SUPPORTED_TRAIN_COMPILE_MODES),
+    ("optimizer_type", SUPPORTED_TRAIN_OPTIMIZER_TYPES),
+    ("scheduler_type", SUPPORTED_TRAIN_SCHEDULER_TYPES),
+    ("position_embedding_type", SUPPORTED_POSITION_EMBEDDING_TYPES),
+    ("checkpoint_format", SUPPORTED_TRAIN_CHECKPOINT_FORMATS),
+)
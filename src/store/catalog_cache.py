@@ -0,0 +1,50 @@
+"""Parsed dataset catalogs owned by one snapshot store.
+
+Entries are keyed by catalog path and carry the file's (mtime_ns, size)
+signature, so an edited catalog is re-read while an unchanged one is
+reused. Each entry also holds the catalog's sorted manifest view once it
+has been built. The cache lives on the store instance; discarding the store
+discards its parsed catalogs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.types import SnapshotManifest
+
+
+@dataclass(slots=True)
+class CatalogCacheEntry:
+    """Parsed catalog payload, the file signature it was read at, and its manifests."""
+
+    signature: tuple[int, int]
+    payload: dict[str, Any]
+    manifests: tuple[SnapshotManifest, ...] | None = None
+
+
+class CatalogCache:
+    """Signature-checked catalog payloads for one snapshot store."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._entries: dict[Path, CatalogCacheEntry] = {}
+
+    def get(self, catalog_path: Path, signature: tuple[int, int]) -> CatalogCacheEntry | None:
+        """Return the cached entry when it was read at the given signature."""
+        entry = self._entries.get(catalog_path)
+        if entry is None or entry.signature != signature:
+            return None
+        return entry
+
+    def put(self, catalog_path: Path, entry: CatalogCacheEntry) -> None:
+        """Store the entry for a catalog, replacing any previous one."""
+        self._entries[catalog_path] = entry
+
+    def discard(self, catalog_path: Path) -> CatalogCacheEntry | None:
+        """Drop and return the entry for a catalog, if any."""
+        return self._entries.pop(catalog_path, None)
@@ -2,25 +2,41 @@
 
 This module isolates JSON catalog IO and version id generation.
 It keeps snapshot store orchestration focused on business flow.
+Parsed catalogs are kept in the caller's ``CatalogCache`` with the file's
+(mtime_ns, size) signature, so a catalog is parsed at most once per change
+and appending a version reuses the cached payload instead of re-reading it.
+The sorted manifest view is kept on the same cache entry as its payload
+and is extended in place of a rebuild when a newer version is appended.
+Files are encoded and decoded through the shared JSON codec, which uses
+orjson when it is installed, and are replaced atomically so a crash never
+leaves a torn manifest or catalog behind.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import asdict
 from datetime import datetime, timezone
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, cast
 
-from core.constants import MANIFEST_FILE_NAME
+from core.constants import MANIFEST_FILE_NAME, RECORD_ID_HASH_CHUNK_SIZE
 from core.errors import ForgeStoreError
+from core.file_io import file_signature, write_bytes_atomically
+from core.json_codec import dumps_pretty_json, load_json_file
 from core.types import DataRecord, SnapshotManifest
+from store.catalog_cache import CatalogCache, CatalogCacheEntry
 
 
 def build_version_id(dataset_name: str, records: tuple[DataRecord, ...]) -> str:
     """Build deterministic version id from dataset and records.
 
+    Record ids are joined with ``|`` in fixed-size chunks and each chunk is
+    fed to SHA-256, which hashes the same bytes as the fully joined id
+    string while keeping only one chunk in memory at a time.
+
     Args:
         dataset_name: Dataset identifier.
         records: Snapshot records.
@@ -29,11 +45,25 @@ def build_version_id(dataset_name: str, records: tuple[DataRecord, ...]) -> str:
         Version id string.
     """
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
-    digest_seed = "|".join(record.record_id for record in records)
-    digest = hashlib.sha256(digest_seed.encode("utf-8")).hexdigest()[:10]
+    digest = _hash_record_ids(records)[:10]
     return f"{dataset_name}-{timestamp}-{digest}"
 
 
+def _hash_record_ids(records: tuple[DataRecord, ...]) -> str:
+    # map/attrgetter and str.join run the per-record work in C, so the
+    # Python loop only runs once per chunk instead of once per record.
+    record_ids = map(attrgetter("record_id"), records)
+    record_hash = hashlib.sha256()
+    separator = b""
+    while True:
+        chunk = list(islice(record_ids, RECORD_ID_HASH_CHUNK_SIZE))
+        if not chunk:
+            return record_hash.hexdigest()
+        record_hash.update(separator)
+        record_hash.update("|".join(chunk).encode("utf-8"))
+        separator = b"|"
+
+
 def write_manifest_file(
     version_dir: Path,
     manifest: SnapshotManifest,
@@ -46,51 +76,125 @@ def write_manifest_file(
         manifest: Manifest payload.
         lance_written: Whether Lance dataset was created.
     """
-    manifest_dict = asdict(manifest)
-    manifest_dict["created_at"] = manifest.created_at.isoformat()
+    manifest_dict = _manifest_to_payload(manifest)
     manifest_dict["lance_written"] = lance_written
     manifest_path = version_dir / MANIFEST_FILE_NAME
-    manifest_path.write_text(json.dumps(manifest_dict, indent=2) + "\n", encoding="utf-8")
+    _write_bytes_atomically(manifest_path, dumps_pretty_json(manifest_dict))
+
 
+def _manifest_to_payload(manifest: SnapshotManifest) -> dict[str, Any]:
+    """Serialize a manifest into the JSON shape stored in manifests and catalogs.
 
-def update_catalog(catalog_path: Path, manifest: SnapshotManifest) -> None:
+    Fields are listed directly instead of going through ``asdict``, which
+    deep-copies every value before it is dumped. Recipe steps become a list
+    so cached catalog entries match what a later read decodes.
+    """
+    return {
+        "dataset_name": manifest.dataset_name,
+        "version_id": manifest.version_id,
+        "created_at": manifest.created_at.isoformat(),
+        "parent_version": manifest.parent_version,
+        "recipe_steps": list(manifest.recipe_steps),
+        "record_count": manifest.record_count,
+    }
+
+
+def update_catalog(catalog_path: Path, manifest: SnapshotManifest, cache: CatalogCache) -> None:
     """Append manifest entry to dataset catalog.
 
     Args:
         catalog_path: Catalog JSON path.
         manifest: Manifest to append.
+        cache: Catalog cache to read from and refresh with the new payload.
     """
-    if catalog_path.exists():
-        catalog = read_catalog_file(catalog_path)
+    previous_entry = _read_catalog_entry(catalog_path, cache) if catalog_path.exists() else None
+    if previous_entry is not None:
+        catalog = previous_entry.payload
     else:
         catalog = {"latest_version": None, "versions": []}
-    manifest_dict = asdict(manifest)
-    manifest_dict["created_at"] = manifest.created_at.isoformat()
+    manifest_dict = _manifest_to_payload(manifest)
     versions = cast(list[dict[str, Any]], catalog["versions"])
-    versions.append(manifest_dict)
-    catalog["latest_version"] = manifest.version_id
-    catalog_path.write_text(json.dumps(catalog, indent=2) + "\n", encoding="utf-8")
+    # The cached payload is shared with readers, so build a new catalog
+    # rather than appending to the cached versions list in place.
+    updated_catalog = {
+        **catalog,
+        "versions": [*versions, manifest_dict],
+        "latest_version": manifest.version_id,
+    }
+    cache.discard(catalog_path)
+    _write_bytes_atomically(catalog_path, dumps_pretty_json(updated_catalog))
+    signature = file_signature(catalog_path)
+    if signature is not None:
+        manifests = _extended_manifests(previous_entry, manifest)
+        cache.put(catalog_path, CatalogCacheEntry(signature, updated_catalog, manifests))
+
+
+def _extended_manifests(
+    previous_entry: CatalogCacheEntry | None,
+    manifest: SnapshotManifest,
+) -> tuple[SnapshotManifest, ...] | None:
+    """Append a manifest to the previous sorted view when it still sorts last."""
+    if previous_entry is None:
+        return (manifest,)
+    manifests = previous_entry.manifests
+    if manifests is None or (manifests and manifest.created_at < manifests[-1].created_at):
+        return None
+    return (*manifests, manifest)
 
 
-def read_catalog_file(catalog_path: Path) -> dict[str, Any]:
+def read_catalog_manifests(catalog_path: Path, cache: CatalogCache) -> tuple[SnapshotManifest, ...]:
+    """Read catalog manifests sorted by creation time.
+
+    Args:
+        catalog_path: Catalog JSON path.
+        cache: Catalog cache holding parsed payloads.
+
+    Returns:
+        Manifests in ascending ``created_at`` order, parsed once per catalog
+        payload.
+
+    Raises:
+        ForgeStoreError: If catalog is missing or invalid.
+    """
+    entry = _read_catalog_entry(catalog_path, cache)
+    if entry.manifests is None:
+        version_payloads = cast(list[dict[str, Any]], entry.payload["versions"])
+        entry.manifests = tuple(
+            sorted(map(manifest_from_dict, version_payloads), key=attrgetter("created_at"))
+        )
+    return entry.manifests
+
+
+def read_catalog_file(catalog_path: Path, cache: CatalogCache) -> dict[str, Any]:
     """Read and validate dataset catalog payload.
 
     Args:
         catalog_path: Catalog JSON path.
+        cache: Catalog cache holding parsed payloads.
 
     Returns:
-        Parsed catalog object.
+        Parsed catalog object. It is shared with later callers until the
+        file changes, so treat it as read-only.
 
     Raises:
         ForgeStoreError: If catalog is missing or invalid.
     """
-    if not catalog_path.exists():
+    return _read_catalog_entry(catalog_path, cache).payload
+
+
+def _read_catalog_entry(catalog_path: Path, cache: CatalogCache) -> CatalogCacheEntry:
+    """Return the cache entry for a catalog, parsing the file when it changed."""
+    signature = file_signature(catalog_path)
+    if signature is None:
         raise ForgeStoreError(
             f"Dataset catalog not found at {catalog_path}. "
             "Ingest data before requesting versions."
         )
+    cached_entry = cache.get(catalog_path, signature)
+    if cached_entry is not None:
+        return cached_entry
     try:
-        payload = json.loads(catalog_path.read_text(encoding="utf-8"))
+        payload = load_json_file(catalog_path)
     except json.JSONDecodeError as error:
         raise ForgeStoreError(
             f"Failed to parse dataset catalog at {catalog_path}: {error.msg}. "
@@ -101,12 +205,33 @@ def read_catalog_file(catalog_path: Path) -> dict[str, Any]:
             f"Failed to parse dataset catalog at {catalog_path}: "
             "expected JSON object at top level. Recreate the catalog."
         )
-    return payload
+    entry = CatalogCacheEntry(signature, payload)
+    cache.put(catalog_path, entry)
+    return entry
+
+
+def _write_bytes_atomically(target_path: Path, payload: bytes) -> None:
+    """Replace one store file atomically with store-level error reporting.
+
+    Raises:
+        ForgeStoreError: If the file cannot be written.
+    """
+    try:
+        write_bytes_atomically(target_path, payload)
+    except OSError as error:
+        raise ForgeStoreError(
+            f"Failed to write {target_path}: {error}. "
+            "Check available disk space and directory permissions."
+        ) from error
 
 
 def manifest_from_dict(payload: dict[str, Any]) -> SnapshotManifest:
     """Deserialize manifest payload from dictionary.
 
+    Payloads come from files written by ``_manifest_to_payload``, and the
+    JSON decoder already returns native strings, lists, and integers, so
+    fields are used as decoded instead of being re-coerced one by one.
+
     Args:
         payload: Manifest dictionary.
 
@@ -114,10 +239,10 @@ def manifest_from_dict(payload: dict[str, Any]) -> SnapshotManifest:
         Typed snapshot manifest.
     """
     return SnapshotManifest(
-        dataset_name=str(payload["dataset_name"]),
-        version_id=str(payload["version_id"]),
-        created_at=datetime.fromisoformat(str(payload["created_at"])),
-        parent_version=str(payload["parent_version"]) if payload["parent_version"] else None,
-        recipe_steps=tuple(str(step) for step in payload["recipe_steps"]),
-        record_count=int(payload["record_count"]),
+        dataset_name=payload["dataset_name"],
+        version_id=payload["version_id"],
+        created_at=datetime.fromisoformat(payload["created_at"]),
+        parent_version=payload["parent_version"] or None,
+        recipe_steps=tuple(payload["recipe_steps"]),
+        record_count=payload["record_count"],
     )
@@ -0,0 +1,169 @@
+"""SDK dataset handle for versioned records.
+
+This module backs the Dataset handle returned by ForgeClient.dataset with
+loading, filtering, export, training, and chat calls on one dataset. The
+training and chat runners are imported inside the methods that use them,
+so reading records does not load the model runtime stack.
+"""
+
+from __future__ import annotations
+
+from core.chat_types import ChatOptions, ChatResult
+from core.errors import ForgeServeError
+from core.training_types import TrainingRunResult
+from core.types import (
+    DataRecord,
+    MetadataFilter,
+    SnapshotManifest,
+    TrainingExportRequest,
+    TrainingOptions,
+    VersionExportRequest,
+)
+from store.snapshot_store import SnapshotStore
+
+
+class Dataset:
+    """SDK dataset handle for versioned records."""
+
+    __slots__ = ("_dataset_name", "_store")
+
+    def __init__(self, dataset_name: str, store: SnapshotStore) -> None:
+        """Create dataset handle.
+
+        Args:
+            dataset_name: Dataset identifier.
+            store: Snapshot store backend.
+        """
+        self._dataset_name = dataset_name
+        self._store = store
+
+    @property
+    def name(self) -> str:
+        """Return dataset identifier."""
+        return self._dataset_name
+
+    def list_versions(self) -> list[SnapshotManifest]:
+        """List all dataset versions.
+
+        Returns:
+            Ordered list of snapshot manifests.
+        """
+        return self._store.list_versions(self._dataset_name)
+
+    def load_records(
+        self,
+        version_id: str | None = None,
+    ) -> tuple[SnapshotManifest, list[DataRecord]]:
+        """Load records for latest or target version.
+
+        Args:
+            version_id: Optional specific snapshot id.
+
+        Returns:
+            Pair of manifest and data records.
+        """
+        return self._store.load_records(self._dataset_name, version_id)
+
+    def filter(self, filter_spec: MetadataFilter) -> str:
+        """Create a filtered snapshot from the latest version.
+
+        Args:
+            filter_spec: Metadata constraints.
+
+        Returns:
+            Newly created snapshot version id.
+        """
+        manifest = self._store.filter_records(self._dataset_name, filter_spec)
+        return manifest.version_id
+
+    def export(self, version_id: str, output_uri: str) -> None:
+        """Export a snapshot version to an S3 destination.
+
+        Args:
+            version_id: Snapshot version id.
+            output_uri: Destination URI.
+        """
+        request = VersionExportRequest(
+            dataset_name=self._dataset_name,
+            version_id=version_id,
+            output_uri=output_uri,
+        )
+        self._store.export_version_to_s3(request)
+
+    def export_training(
+        self,
+        output_dir: str,
+        version_id: str | None = None,
+        shard_size: int = 1000,
+        include_metadata: bool = False,
+    ) -> str:
+        """Export snapshot into local sharded training files.
+
+        Args:
+            output_dir: Local output directory for exported shards.
+            version_id: Optional version id, latest when omitted.
+            shard_size: Number of records per shard file.
+            include_metadata: Include metadata per exported row.
+
+        Returns:
+            Path to generated training manifest.
+        """
+        request = TrainingExportRequest(
+            dataset_name=self._dataset_name,
+            output_dir=output_dir,
+            version_id=version_id,
+            shard_size=shard_size,
+            include_metadata=include_metadata,
+        )
+        manifest_path = self._store.export_training_data(request)
+        return str(manifest_path)
+
+    def train(self, options: TrainingOptions) -> TrainingRunResult:
+        """Train a model on this dataset with default/custom loop.
+
+        Args:
+            options: Training options.
+
+        Returns:
+            Training run artifact summary.
+
+        Raises:
+            ForgeServeError: If dataset names mismatch.
+        """
+        if options.dataset_name != self._dataset_name:
+            raise ForgeServeError(
+                f"Training options dataset '{options.dataset_name}' does not match handle "
+                f"'{self._dataset_name}'."
+            )
+        from serve.training_runner import run_training
+
+        manifest, records = self.load_records(options.version_id)
+        return run_training(
+            records=records,
+            options=options,
+            random_seed=self._store.random_seed,
+            data_root=self._store.data_root,
+            dataset_version_id=manifest.version_id,
+        )
+
+    def chat(self, options: ChatOptions) -> ChatResult:
+        """Run one chat completion on this dataset.
+
+        Args:
+            options: Chat inference options.
+
+        Returns:
+            Generated response payload.
+
+        Raises:
+            ForgeServeError: If dataset names mismatch.
+        """
+        if options.dataset_name != self._dataset_name:
+            raise ForgeServeError(
+                f"Chat options dataset '{options.dataset_name}' does not match handle "
+                f"'{self._dataset_name}'."
+            )
+        from serve.chat_runner import run_chat
+
+        _, records = self.load_records(options.version_id)
+        return run_chat(records, options)
@@ -2,6 +2,9 @@
 
 This module writes snapshot records to Apache Lance when available.
 It also maintains JSONL mirror files for lightweight compatibility.
+Snapshots with a Lance dataset are read back column by column from
+Arrow, so loading skips per-row JSON parsing; the JSONL mirror is read
+only when Lance is not installed or the snapshot has no Lance dataset.
 """
 
 from __future__ import annotations
@@ -11,9 +14,20 @@ from pathlib import Path
 
 from core.constants import LANCE_DIR_NAME, RECORDS_FILE_NAME
 from core.errors import ForgeStoreError
-from core.types import DataRecord
+from core.json_codec import loads_json
+from core.types import DataRecord, RecordMetadata
 from store.record_payload import read_data_records_jsonl, write_data_records_jsonl
 
+_LANCE_COLUMNS = (
+    "record_id",
+    "text",
+    "source_uri",
+    "language",
+    "quality_score",
+    "perplexity",
+    "extra_fields",
+)
+
 
 def write_version_payload(version_dir: Path, records: list[DataRecord]) -> bool:
     """Persist snapshot records and attempt Lance conversion.
@@ -33,7 +47,7 @@ def write_version_payload(version_dir: Path, records: list[DataRecord]) -> bool:
 
 
 def read_version_payload(version_dir: Path) -> list[DataRecord]:
-    """Load snapshot records from JSONL mirror file.
+    """Load snapshot records from Lance, or from the JSONL mirror file.
 
     Args:
         version_dir: Snapshot version directory.
@@ -44,6 +58,9 @@ def read_version_payload(version_dir: Path) -> list[DataRecord]:
     Raises:
         ForgeStoreError: If records file is missing or invalid.
     """
+    lance_records = _try_read_lance_dataset(version_dir)
+    if lance_records is not None:
+        return lance_records
     records_path = version_dir / RECORDS_FILE_NAME
     if not records_path.exists():
         raise ForgeStoreError(
@@ -119,3 +136,60 @@ def _try_write_lance_dataset(version_dir: Path, records: list[DataRecord]) -> bo
             "Validate lance/pyarrow compatibility and retry ingest."
         ) from error
     return True
+
+
+def _try_read_lance_dataset(version_dir: Path) -> list[DataRecord] | None:
+    """Attempt to read records from the version's Lance dataset.
+
+    Args:
+        version_dir: Snapshot version directory.
+
+    Returns:
+        Records in persisted order, or ``None`` when Lance is unavailable.
+
+    Raises:
+        ForgeStoreError: If the Lance dataset cannot be read.
+    """
+    lance_path = version_dir / LANCE_DIR_NAME
+    if not lance_path.exists():
+        return None
+    try:
+        import lance
+    except ImportError:
+        return None
+    try:
+        table = lance.dataset(str(lance_path)).to_table(columns=list(_LANCE_COLUMNS))
+        return _records_from_columns(*(table.column(name).to_pylist() for name in _LANCE_COLUMNS))
+    except Exception as error:
+        raise ForgeStoreError(
+            f"Failed to read Lance dataset at {lance_path}: {error}. "
+            "Validate lance/pyarrow compatibility or recreate the dataset snapshot."
+        ) from error
+
+
+def _records_from_columns(
+    record_ids: list[str],
+    texts: list[str],
+    source_uris: list[str],
+    languages: list[str],
+    quality_scores: list[float],
+    perplexities: list[float],
+    extra_fields_json: list[str],
+) -> list[DataRecord]:
+    """Zip Lance columns into records, decoding only non-empty extra fields."""
+    metadata = [
+        RecordMetadata(
+            source_uri=source_uri,
+            language=language,
+            quality_score=quality_score,
+            perplexity=perplexity,
+            extra_fields={} if extra_fields == "{}" else loads_json(extra_fields),
+        )
+        for source_uri, language, quality_score, perplexity, extra_fields in zip(
+            source_uris, languages, quality_scores, perplexities, extra_fields_json
+        )
+    ]
+    return [
+        DataRecord(record_id=record_id, text=text, metadata=record_metadata)
+        for record_id, text, record_metadata in zip(record_ids, texts, metadata)
+    ]
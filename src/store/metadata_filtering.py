@@ -6,15 +6,20 @@ It keeps filtering logic reusable across store and export flows.
 
 from __future__ import annotations
 
+from typing import Sequence
+
 from core.types import DataRecord, MetadataFilter
 
 
 def filter_records(
-    records: list[DataRecord],
+    records: Sequence[DataRecord],
     filter_spec: MetadataFilter,
 ) -> list[DataRecord]:
     """Filter records using metadata constraints.
 
+    Constraint values are read from the filter spec once per call rather
+    than once per record, so the loop body only touches record metadata.
+
     Args:
         records: Input records to filter.
         filter_spec: Filter constraints.
@@ -22,16 +27,17 @@ def filter_records(
     Returns:
         Filtered records list.
     """
+    language = filter_spec.language
+    min_quality_score = filter_spec.min_quality_score
+    source_prefix = filter_spec.source_prefix
     filtered: list[DataRecord] = []
     for record in records:
         metadata = record.metadata
-        if filter_spec.language and metadata.language != filter_spec.language:
+        if language and metadata.language != language:
+            continue
+        if min_quality_score is not None and metadata.quality_score < min_quality_score:
+            continue
+        if source_prefix and not metadata.source_uri.startswith(source_prefix):
             continue
-        if filter_spec.min_quality_score is not None:
-            if metadata.quality_score < filter_spec.min_quality_score:
-                continue
-        if filter_spec.source_prefix:
-            if not metadata.source_uri.startswith(filter_spec.source_prefix):
-                continue
         filtered.append(record)
     return filtered
@@ -10,6 +10,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from core.constants import JSONL_WRITE_BUFFER_BYTES
+from core.json_codec import dumps_json_line, loads_json
 from core.types import DataRecord, RecordMetadata
 
 
@@ -67,12 +69,19 @@ def data_record_from_payload(payload: dict[str, Any]) -> DataRecord:
 def write_data_records_jsonl(records_path: Path, records: list[DataRecord]) -> None:
     """Write DataRecord list to JSONL file.
 
+    Rows are encoded straight to bytes by the shared JSON codec, which
+    uses orjson when it is installed, and streamed through a large write
+    buffer one record at a time, so peak memory does not grow with a list
+    of encoded lines plus their joined copy.
+
     Args:
         records_path: Output JSONL file path.
         records: Records to serialize.
     """
-    lines = [json.dumps(data_record_to_payload(record), sort_keys=True) for record in records]
-    records_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with records_path.open("wb", buffering=JSONL_WRITE_BUFFER_BYTES) as records_file:
+        write = records_file.write
+        for record in records:
+            write(dumps_json_line(data_record_to_payload(record)))
 
 
 def read_data_records_jsonl(records_path: Path) -> list[DataRecord]:
@@ -87,8 +96,10 @@ def read_data_records_jsonl(records_path: Path) -> list[DataRecord]:
     Raises:
         ValueError: If JSONL rows are invalid.
     """
+    # Lines are split as bytes: str.splitlines would also break rows on
+    # unescaped U+2028 and similar separators inside record text.
     parsed_records: list[DataRecord] = []
-    for line_number, line in enumerate(records_path.read_text(encoding="utf-8").splitlines(), 1):
+    for line_number, line in enumerate(records_path.read_bytes().splitlines(), 1):
         if not line.strip():
             continue
         payload = _parse_payload_line(line, line_number)
@@ -96,7 +107,7 @@ def read_data_records_jsonl(records_path: Path) -> list[DataRecord]:
     return parsed_records
 
 
-def _parse_payload_line(line: str, line_number: int) -> dict[str, Any]:
+def _parse_payload_line(line: bytes, line_number: int) -> dict[str, Any]:
     """Parse and validate one JSONL payload row.
 
     Args:
@@ -110,7 +121,7 @@ def _parse_payload_line(line: str, line_number: int) -> dict[str, Any]:
         ValueError: If JSON row is invalid.
     """
     try:
-        payload = json.loads(line)
+        payload = loads_json(line)
     except json.JSONDecodeError as error:
         raise ValueError(
             f"Invalid JSON at line {line_number}: {error.msg}"
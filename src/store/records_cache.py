@@ -0,0 +1,51 @@
+"""Loaded snapshot records owned by one snapshot store.
+
+Snapshot versions are immutable, so cached records never go stale. The
+cache is a least-recently-used map bounded by the total number of cached
+records rather than by snapshot count, so a few large snapshots cannot
+pin unbounded memory; a snapshot larger than the whole bound is not cached.
+Cached DataRecord objects, including their metadata ``extra_fields``
+dicts, are shared by every caller that loads the same version.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from core.constants import SNAPSHOT_RECORDS_CACHE_MAX_RECORDS
+from core.types import DataRecord
+
+RecordsCacheKey = tuple[str, str]
+
+
+class SnapshotRecordsCache:
+    """Record-count bounded LRU of loaded snapshot versions."""
+
+    __slots__ = ("_entries", "_max_records", "_record_count")
+
+    def __init__(self, max_records: int = SNAPSHOT_RECORDS_CACHE_MAX_RECORDS) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_records: Total records the cache may hold across snapshots.
+        """
+        self._entries: OrderedDict[RecordsCacheKey, tuple[DataRecord, ...]] = OrderedDict()
+        self._max_records = max_records
+        self._record_count = 0
+
+    def get(self, cache_key: RecordsCacheKey) -> tuple[DataRecord, ...] | None:
+        """Return cached records for a (dataset, version) key and mark them recent."""
+        records = self._entries.get(cache_key)
+        if records is not None:
+            self._entries.move_to_end(cache_key)
+        return records
+
+    def put(self, cache_key: RecordsCacheKey, records: tuple[DataRecord, ...]) -> None:
+        """Cache records, evicting least recently used versions past the bound."""
+        if len(records) > self._max_records or cache_key in self._entries:
+            return
+        self._entries[cache_key] = records
+        self._record_count += len(records)
+        while self._record_count > self._max_records:
+            _, evicted = self._entries.popitem(last=False)
+            self._record_count -= len(evicted)
@@ -0,0 +1,62 @@
+"""Lazily created runtime helpers for one SDK client.
+
+The training run registry and the detected hardware profile are created on
+first use and then reused by the client. Their serve modules are imported
+inside the accessors, so clients that only read datasets never load them.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from serve.hardware_profile import HardwareProfile
+    from serve.training_run_registry import TrainingRunRegistry
+
+
+class SdkRuntimeCache:
+    """Per-client run registry and hardware profile, created on first use."""
+
+    __slots__ = ("_data_root", "_hardware_profile", "_run_registry")
+
+    def __init__(self, data_root: Path) -> None:
+        """Create an empty cache.
+
+        Args:
+            data_root: Data root holding the client's training runs.
+        """
+        self._data_root = data_root
+        self._run_registry: TrainingRunRegistry | None = None
+        self._hardware_profile: HardwareProfile | None = None
+
+    def run_registry(self) -> TrainingRunRegistry:
+        """Return the client's run registry, creating it on first use.
+
+        Reusing one registry keeps its signature-checked record, index, and
+        lineage caches warm across polling calls; runs written by other
+        processes change the file signatures and are re-read.
+        """
+        if self._run_registry is None:
+            from serve.training_run_registry import TrainingRunRegistry
+
+            self._run_registry = TrainingRunRegistry(self._data_root)
+        return self._run_registry
+
+    def hardware_profile(self, refresh: bool = False) -> HardwareProfile:
+        """Return the local hardware profile, detecting it once per client.
+
+        Attached hardware does not change while the process runs, so later
+        calls reuse the first detection unless a refresh is requested.
+
+        Args:
+            refresh: Re-detect the profile and replace the cached one.
+
+        Returns:
+            Detected hardware profile.
+        """
+        if refresh or self._hardware_profile is None:
+            from serve.hardware_profile import detect_hardware_profile
+
+            self._hardware_profile = detect_hardware_profile()
+        return self._hardware_profile
@@ -8,7 +8,6 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, cast
 
 from core.config import ForgeConfig
 from core.constants import (
@@ -27,15 +26,16 @@ from core.types import (
     TrainingExportRequest,
     VersionExportRequest,
 )
+from store.catalog_cache import CatalogCache
 from store.catalog_io import (
     build_version_id,
-    manifest_from_dict,
-    read_catalog_file,
+    read_catalog_manifests,
     update_catalog,
     write_manifest_file,
 )
 from store.lance_dataset import read_version_payload, write_version_payload
 from store.metadata_filtering import filter_records
+from store.records_cache import SnapshotRecordsCache
 from store.s3_export import create_s3_client, upload_directory
 from store.training_export import export_training_shards
 
@@ -46,7 +46,10 @@ class SnapshotStore:
     """Immutable snapshot store implementation.
 
     This class owns dataset directories, version manifests,
-    and metadata catalog updates for phase-one operations.
+    and metadata catalog updates for phase-one operations. Loaded
+    records are kept in a record-count bounded LRU keyed by dataset and
+    version id, and parsed catalogs in a signature-checked catalog cache;
+    both are owned by the store instance.
     """
 
     def __init__(self, config: ForgeConfig) -> None:
@@ -58,6 +61,8 @@ class SnapshotStore:
         self._config = config
         self._datasets_root = config.data_root / DATASETS_DIR_NAME
         self._datasets_root.mkdir(parents=True, exist_ok=True)
+        self._records_cache = SnapshotRecordsCache()
+        self._catalog_cache = CatalogCache()
 
     @property
     def random_seed(self) -> int:
@@ -95,7 +100,7 @@ class SnapshotStore:
             record_count=len(request.records),
         )
         write_manifest_file(version_dir, manifest, lance_written)
-        update_catalog(dataset_root / CATALOG_FILE_NAME, manifest)
+        update_catalog(dataset_root / CATALOG_FILE_NAME, manifest, self._catalog_cache)
         _LOGGER.info(
             "snapshot_created",
             dataset_name=request.dataset_name,
@@ -119,10 +124,7 @@ class SnapshotStore:
             ForgeStoreError: If dataset catalog does not exist.
         """
         catalog_path = self._dataset_root(dataset_name) / CATALOG_FILE_NAME
-        catalog = read_catalog_file(catalog_path)
-        version_payloads = cast(list[dict[str, Any]], catalog["versions"])
-        versions = [manifest_from_dict(item) for item in version_payloads]
-        return sorted(versions, key=lambda item: item.created_at)
+        return list(read_catalog_manifests(catalog_path, self._catalog_cache))
 
     def load_records(
         self,
@@ -136,15 +138,17 @@ class SnapshotStore:
             version_id: Optional snapshot version; latest when omitted.
 
         Returns:
-            Pair of manifest and loaded records.
+            Pair of manifest and loaded records. The list is a fresh shallow
+            copy, so callers may mutate it without touching cached records,
+            but the DataRecord objects and their metadata ``extra_fields``
+            dicts are shared with other loads of the version; treat them as
+            read-only.
 
         Raises:
             ForgeStoreError: If dataset/version is missing.
         """
         manifest = self._resolve_manifest(dataset_name, version_id)
-        version_dir = self._version_dir(dataset_name, manifest.version_id)
-        records = read_version_payload(version_dir)
-        return manifest, records
+        return manifest, list(self._cached_records(dataset_name, manifest.version_id))
 
     def filter_records(
         self,
@@ -160,7 +164,8 @@ class SnapshotStore:
         Returns:
             New filtered snapshot manifest.
         """
-        parent_manifest, records = self.load_records(dataset_name)
+        parent_manifest = self._resolve_manifest(dataset_name, None)
+        records = self._cached_records(dataset_name, parent_manifest.version_id)
         filtered_records = filter_records(records, filter_spec)
         recipe_steps = parent_manifest.recipe_steps + ("metadata_filter",)
         request = SnapshotWriteRequest(
@@ -225,6 +230,15 @@ class SnapshotStore:
         (dataset_root / VERSIONS_DIR_NAME).mkdir(parents=True, exist_ok=True)
         return dataset_root
 
+    def _cached_records(self, dataset_name: str, version_id: str) -> tuple[DataRecord, ...]:
+        """Return one version's records from the LRU, reading them on a miss."""
+        cache_key = (dataset_name, version_id)
+        records = self._records_cache.get(cache_key)
+        if records is None:
+            records = tuple(read_version_payload(self._version_dir(dataset_name, version_id)))
+            self._records_cache.put(cache_key, records)
+        return records
+
     def _resolve_manifest(self, dataset_name: str, version_id: str | None) -> SnapshotManifest:
         """Resolve a target manifest.
 
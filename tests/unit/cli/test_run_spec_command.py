@@ -6,7 +6,8 @@ import pytest
 
 from cli.main import main
 from core.errors import ForgeRunSpecError
-from core.types import IngestOptions, MetadataFilter, TrainingRunResult
+from core.training_types import TrainingRunResult
+from core.types import IngestOptions, MetadataFilter
 from store.dataset_sdk import ForgeClient
 from tests.fixture_paths import fixture_path
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from cli.main import main
-from core.types import TrainingRunResult
+from core.training_types import TrainingRunResult
 from store.dataset_sdk import ForgeClient
 
 
@@ -0,0 +1,33 @@
+"""Unit tests for shared filesystem helpers."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from core.file_io import write_bytes_atomically
+
+
+def test_write_bytes_atomically_replaces_target_without_staging_leftovers(tmp_path) -> None:
+    """Atomic writes should replace the target and leave only the target behind."""
+    target_path = tmp_path / "catalog.json"
+    target_path.write_bytes(b"old")
+
+    write_bytes_atomically(target_path, b"new")
+
+    assert (target_path.read_bytes(), os.listdir(tmp_path)) == (b"new", ["catalog.json"])
+
+
+def test_write_bytes_atomically_removes_staging_file_on_failure(tmp_path, monkeypatch) -> None:
+    """A failed rename should propagate OSError and clean up the staging file."""
+
+    def _fail_replace(source, target) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _fail_replace)
+
+    with pytest.raises(OSError):
+        write_bytes_atomically(tmp_path / "catalog.json", b"new")
+
+    assert os.listdir(tmp_path) == []
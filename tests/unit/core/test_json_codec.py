@@ -0,0 +1,75 @@
+"""Unit tests for JSON codec helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import core.json_codec as json_codec
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_pretty_json_round_trips_with_either_backend(use_orjson, monkeypatch) -> None:
+    """Encoding should match the stdlib layout and decode back with both backends."""
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "_ORJSON", None)
+    elif json_codec._ORJSON is None:
+        pytest.skip("orjson is not installed")
+    payload = {"b": [1, 2], "a": {"nested": None}}
+
+    encoded = json_codec.dumps_pretty_json(payload)
+
+    assert (encoded, json_codec.loads_json(encoded)) == (
+        (json.dumps(payload, indent=2) + "\n").encode("utf-8"),
+        payload,
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_pretty_json_is_identical_with_either_backend(use_orjson, monkeypatch) -> None:
+    """Pretty JSON should leave non-ASCII text unescaped on both backends."""
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "_ORJSON", None)
+    elif json_codec._ORJSON is None:
+        pytest.skip("orjson is not installed")
+    payload = {"name": "caf\u00e9", "steps": ["na\u00efve"]}
+
+    encoded = json_codec.dumps_pretty_json(payload)
+
+    assert encoded == (
+        '{\n  "name": "caf\u00e9",\n  "steps": [\n    "na\u00efve"\n  ]\n}\n'.encode("utf-8")
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_line_is_identical_with_either_backend(use_orjson, monkeypatch) -> None:
+    """JSON lines should be compact, key-sorted, and unescaped on both backends."""
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "_ORJSON", None)
+    elif json_codec._ORJSON is None:
+        pytest.skip("orjson is not installed")
+    payload = {"b": "caf\u00e9", "a": [1, None]}
+
+    encoded = json_codec.dumps_json_line(payload)
+
+    assert encoded == '{"a":[1,null],"b":"caf\u00e9"}\n'.encode("utf-8")
+
+
+def test_loads_json_raises_stdlib_decode_error_for_invalid_payload() -> None:
+    """Invalid JSON should raise json.JSONDecodeError regardless of backend."""
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads_json(b"{broken")
+
+
+def test_load_json_file_decodes_memory_mapped_file(tmp_path, monkeypatch) -> None:
+    """Files above the mapping threshold should decode through the orjson mmap path."""
+    if json_codec._ORJSON is None:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(json_codec, "JSON_MMAP_MIN_BYTES", 1)
+    json_path = tmp_path / "vocab.json"
+    json_path.write_bytes(b'{"<pad>": 0, "hello": 1}')
+
+    payload = json_codec.load_json_file(json_path)
+
+    assert payload == {"<pad>": 0, "hello": 1}
@@ -0,0 +1,30 @@
+"""Unit tests for structured logging helpers."""
+
+from __future__ import annotations
+
+import logging
+
+from core.logging_config import is_info_enabled
+
+
+class _LevelLogger:
+    def __init__(self, level: int) -> None:
+        self._level = level
+
+    def isEnabledFor(self, level: int) -> bool:
+        return level >= self._level
+
+
+class _PlainLogger:
+    def info(self, event: str, **fields: object) -> None:
+        return None
+
+
+def test_is_info_enabled_respects_logger_level() -> None:
+    """Info check should report disabled when the logger level is above info."""
+    assert is_info_enabled(_LevelLogger(logging.WARNING)) is False
+
+
+def test_is_info_enabled_without_level_check_returns_true() -> None:
+    """Loggers without a level check should be treated as always emitting."""
+    assert is_info_enabled(_PlainLogger()) is True
@@ -0,0 +1,14 @@
+"""Unit tests for core dataclass helpers."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from core.types import TrainingOptions
+
+
+def test_training_options_to_dict_matches_asdict() -> None:
+    """Options mapping should match the dataclasses asdict payload."""
+    options = TrainingOptions(dataset_name="demo", output_dir="./out", vocabulary_size=64)
+
+    assert options.to_dict() == asdict(options)
@@ -8,7 +8,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from core.chat_types import ChatOptions, ChatResult
-from core.types import IngestOptions, MetadataFilter, TrainingOptions, TrainingRunResult
+from core.training_types import TrainingRunResult
+from core.types import IngestOptions, MetadataFilter, TrainingOptions
 from core.verification import (
     VerificationOptions,
     render_verification_report,
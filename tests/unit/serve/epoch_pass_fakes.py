@@ -0,0 +1,162 @@
+"""Fake torch, model, and optimizer objects for epoch-pass unit tests."""
+
+from __future__ import annotations
+
+from array import array
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+from serve.tokenization import SequenceBatch
+from serve.training_hooks import TrainingHooks
+from serve.training_progress import TrainingProgressTracker
+
+
+class FakeTensor:
+    def __init__(self, value: object) -> None:
+        self.value = value
+        self.shape = (1, 1, 4)
+        self.item_calls = 0
+
+    def to(self, device: object) -> "FakeTensor":
+        _ = device
+        return self
+
+    def reshape(self, *shape: int) -> "FakeTensor":
+        _ = shape
+        return self
+
+    def view(self, *shape: int) -> "FakeTensor":
+        return FakeTensor(_split_rows(self.value, shape[1]))
+
+    def __truediv__(self, divisor: int) -> "FakeTensor":
+        return FakeTensor(self.value / divisor)
+
+    def detach(self) -> "FakeTensor":
+        return self
+
+    def backward(self) -> None:
+        return None
+
+    def item(self) -> object:
+        self.item_calls += 1
+        return self.value
+
+
+def _split_rows(flat_values: object, row_length: int) -> list[list[int]]:
+    assert isinstance(flat_values, list)
+    row_starts = range(0, len(flat_values), row_length)
+    return [flat_values[start : start + row_length] for start in row_starts]
+
+
+class FakeTorch:
+    long = "long"
+
+    def __init__(self) -> None:
+        self.stack_calls = 0
+        self.frombuffer_calls = 0
+        self.inference_mode_entries = 0
+
+    def inference_mode(self) -> nullcontext[None]:
+        self.inference_mode_entries += 1
+        return nullcontext()
+
+    def frombuffer(self, buffer: object, dtype: object) -> FakeTensor:
+        _ = dtype
+        self.frombuffer_calls += 1
+        assert isinstance(buffer, array) and buffer.typecode == "q"
+        return FakeTensor(buffer.tolist())
+
+    def stack(self, tensors: list[FakeTensor]) -> SimpleNamespace:
+        self.stack_calls += 1
+        return SimpleNamespace(tolist=lambda: [tensor.value for tensor in tensors])
+
+
+class FakeModel:
+    def __init__(self) -> None:
+        self.seen_inputs: list[object] = []
+
+    def train(self, mode: bool) -> None:
+        self.mode = mode
+
+    def __call__(self, inputs: FakeTensor) -> FakeTensor:
+        self.seen_inputs.append(inputs.value)
+        return inputs
+
+
+class TensorCountingModel(FakeModel):
+    def __init__(self, torch_module: FakeTorch) -> None:
+        super().__init__()
+        self._torch_module = torch_module
+        self.tensors_built_at_forward: list[int] = []
+
+    def __call__(self, inputs: FakeTensor) -> FakeTensor:
+        self.tensors_built_at_forward.append(self._torch_module.frombuffer_calls)
+        return inputs
+
+
+class NoSyncModel(FakeModel):
+    def __init__(self) -> None:
+        super().__init__()
+        self.no_sync_entries = 0
+
+    def no_sync(self) -> nullcontext[None]:
+        self.no_sync_entries += 1
+        return nullcontext()
+
+
+class FakeOptimizer:
+    def __init__(self) -> None:
+        self.steps = 0
+
+    def zero_grad(self, set_to_none: bool = False) -> None:
+        _ = set_to_none
+
+    def step(self) -> None:
+        self.steps += 1
+
+
+class SequenceLoss:
+    def __init__(self, values: list[float]) -> None:
+        self._values = list(values)
+        self.tensors: list[FakeTensor] = []
+
+    def __call__(self, logits: object, targets: object) -> FakeTensor:
+        _ = logits, targets
+        tensor = FakeTensor(self._values.pop(0))
+        self.tensors.append(tensor)
+        return tensor
+
+
+def build_context(loss_values: list[float]) -> SimpleNamespace:
+    return SimpleNamespace(
+        torch_module=FakeTorch(),
+        model=FakeModel(),
+        optimizer=FakeOptimizer(),
+        loss_function=SequenceLoss(loss_values),
+        precision_runtime=SimpleNamespace(
+            autocast_enabled=False, scaler=None, autocast_factory=nullcontext
+        ),
+        hooks=TrainingHooks(),
+        options=SimpleNamespace(gradient_accumulation_steps=1),
+        device="cpu",
+        batch_transfer=None,
+        parallel_model=None,
+        train_batches=[],
+        validation_batches=[],
+        host_batch_tensors={},
+    )
+
+
+def build_tracker(interval: int) -> TrainingProgressTracker:
+    return TrainingProgressTracker(
+        dataset_name="demo",
+        total_epochs=1,
+        start_epoch=1,
+        train_batch_count=4,
+        validation_batch_count=0,
+        batch_log_interval_steps=interval,
+    )
+
+
+def build_batches(count: int) -> list[SequenceBatch]:
+    return [SequenceBatch(inputs=[[1, 2, 3]], targets=[[2, 3, 4]]) for _ in range(count)]
@@ -0,0 +1,45 @@
+"""Unit tests for epoch checkpoint retention pruning."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from core.errors import ForgeServeError
+from serve.checkpoint_retention import prune_epoch_checkpoints
+from serve.training_checkpoint import ensure_checkpoint_dir
+
+
+def test_prune_epoch_checkpoints_raises_when_unlink_fails(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Pruning should surface unlink failures from worker threads as ForgeServeError."""
+    checkpoint_dir = ensure_checkpoint_dir(tmp_path)
+    for epoch in [1, 2, 3]:
+        (checkpoint_dir / f"epoch-{epoch:04d}.pt").write_bytes(b"checkpoint")
+
+    def _failing_unlink(self: Path, missing_ok: bool = False) -> None:
+        raise PermissionError(f"read-only: {self}")
+
+    monkeypatch.setattr(Path, "unlink", _failing_unlink)
+
+    with pytest.raises(ForgeServeError):
+        prune_epoch_checkpoints(checkpoint_dir, max_files=1)
+
+
+def test_prune_epoch_checkpoints_ignores_unrelated_files(tmp_path: Path) -> None:
+    """Pruning should only count and remove files named epoch-<digits>.pt."""
+    checkpoint_dir = ensure_checkpoint_dir(tmp_path)
+    for file_name in ["epoch-0001.pt", "epoch-0010.pt", "epoch-abc.pt", "best.pt", "notes.txt"]:
+        (checkpoint_dir / file_name).write_bytes(b"data")
+
+    prune_epoch_checkpoints(checkpoint_dir, max_files=1)
+
+    assert sorted(path.name for path in checkpoint_dir.iterdir()) == [
+        "best.pt",
+        "epoch-0010.pt",
+        "epoch-abc.pt",
+        "notes.txt",
+    ]
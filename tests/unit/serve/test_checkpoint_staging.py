@@ -0,0 +1,64 @@
+"""Unit tests for pinned checkpoint staging buffers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from serve.checkpoint_staging import PinnedStagingBuffers
+
+
+class _FakeCudaTensor:
+    is_cuda = True
+    dtype = "float32"
+
+    def __init__(self, address: int, values: list[float]) -> None:
+        self.address = address
+        self.values = values
+        self.shape = (len(values),)
+
+    def data_ptr(self) -> int:
+        return self.address
+
+
+class _FakeHostTensor:
+    dtype = "float32"
+
+    def __init__(self, shape: tuple[int, ...]) -> None:
+        self.shape = shape
+        self.values: list[float] = []
+
+    def copy_(self, source: _FakeCudaTensor, non_blocking: bool) -> None:
+        _ = non_blocking
+        self.values = list(source.values)
+
+
+class _FakeTorch:
+    def __init__(self) -> None:
+        self.allocations = 0
+        self.cuda = SimpleNamespace(
+            current_stream=lambda: SimpleNamespace(synchronize=lambda: None)
+        )
+
+    def empty(self, shape: tuple[int, ...], dtype: str, pin_memory: bool) -> _FakeHostTensor:
+        _ = dtype, pin_memory
+        self.allocations += 1
+        return _FakeHostTensor(shape)
+
+
+def test_pinned_staging_reuses_host_tensors_and_shares_tied_entries() -> None:
+    """Repeated stages should reuse allocations and stage tied entries once."""
+    torch_module = _FakeTorch()
+    staging = PinnedStagingBuffers()
+    embedding = _FakeCudaTensor(address=100, values=[1.0, 2.0])
+    state = {"embed.weight": embedding, "head.weight": embedding, "step": 3}
+
+    staging.stage(torch_module, state)
+    embedding.values = [5.0, 6.0]
+    staged = staging.stage(torch_module, state)
+
+    assert (
+        torch_module.allocations == 1
+        and staged["embed.weight"] is staged["head.weight"]
+        and staged["head.weight"].values == [5.0, 6.0]
+        and staged["step"] == 3
+    )
@@ -0,0 +1,138 @@
+"""Unit tests for the ordered checkpoint writer."""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from core.errors import ForgeServeError
+from serve.checkpoint_writer import CheckpointWriter, link_checkpoint_file, write_checkpoint_bytes
+
+
+def test_checkpoint_writer_runs_background_writes_in_submission_order() -> None:
+    """Background writes should complete in the order they were submitted."""
+    completed: list[int] = []
+    writer = CheckpointWriter(background=True)
+
+    for index in range(5):
+        writer.submit(lambda index=index: completed.append(index))
+    writer.wait()
+    writer.close()
+
+    assert completed == [0, 1, 2, 3, 4]
+
+
+def test_checkpoint_writer_wait_reraises_background_failure() -> None:
+    """Waiting should surface errors raised by queued background writes."""
+
+    def _failing_write() -> None:
+        raise ForgeServeError("disk full")
+
+    writer = CheckpointWriter(background=True)
+    writer.submit(_failing_write)
+
+    with pytest.raises(ForgeServeError):
+        writer.wait()
+    writer.close()
+
+    assert True
+
+
+def test_checkpoint_writer_skips_jobs_queued_after_failure() -> None:
+    """Jobs queued behind a failed write should not run."""
+    completed: list[str] = []
+    write_released = threading.Event()
+
+    def _failing_write() -> None:
+        write_released.wait(timeout=5)
+        raise ForgeServeError("disk full")
+
+    writer = CheckpointWriter(background=True)
+    writer.submit(_failing_write)
+    writer.submit(lambda: completed.append("prune"))
+    write_released.set()
+
+    with pytest.raises(ForgeServeError):
+        writer.wait()
+    writer.close()
+
+    assert completed == []
+
+
+def test_checkpoint_writer_submit_raises_after_background_failure() -> None:
+    """A failed background write should stop the next submit instead of being skipped."""
+
+    def _failing_write() -> None:
+        raise ForgeServeError("disk full")
+
+    writer = CheckpointWriter(background=True)
+    writer.submit(_failing_write).exception()
+
+    with pytest.raises(ForgeServeError):
+        writer.submit(lambda: None)
+    writer.close()
+
+    assert True
+
+
+def test_checkpoint_writer_close_logs_unawaited_failure(monkeypatch) -> None:
+    """Closing on an error path should log write failures nobody waited for."""
+    logged: list[str] = []
+    monkeypatch.setattr(
+        "serve.checkpoint_writer._LOGGER",
+        SimpleNamespace(error=lambda event, **fields: logged.append(event)),
+    )
+
+    def _failing_write() -> None:
+        raise ForgeServeError("disk full")
+
+    writer = CheckpointWriter(background=True)
+    writer.submit(_failing_write)
+    writer.close()
+
+    assert logged == ["checkpoint_write_failed"]
+
+
+def test_checkpoint_writer_runs_notifications_on_calling_thread() -> None:
+    """Deferred notifications should run on the flushing thread after their writes."""
+    events: list[tuple[str, bool]] = []
+    writer = CheckpointWriter(background=True)
+
+    writer.submit(lambda: events.append(("write", _on_main_thread())))
+    writer.notify_after_writes(lambda: events.append(("notify", _on_main_thread())))
+    writer.wait()
+    writer.close()
+
+    assert events == [("write", False), ("notify", True)]
+
+
+def _on_main_thread() -> bool:
+    return threading.current_thread() is threading.main_thread()
+
+
+def test_write_checkpoint_bytes_fsyncs_when_requested(tmp_path: Path, monkeypatch) -> None:
+    """Checkpoint bytes should be written in full and fsynced when enabled."""
+    synced_descriptors: list[int] = []
+    monkeypatch.setattr(os, "fsync", synced_descriptors.append)
+    checkpoint_path = tmp_path / "epoch-0001.pt"
+
+    write_checkpoint_bytes(checkpoint_path, io.BytesIO(b"payload"), fsync=True)
+
+    assert (checkpoint_path.read_bytes(), len(synced_descriptors)) == (b"payload", 1)
+
+
+def test_link_checkpoint_file_survives_rewriting_linked_name(tmp_path: Path) -> None:
+    """Rewriting a linked best checkpoint should leave the epoch file intact."""
+    epoch_path = tmp_path / "epoch-0001.pt"
+    best_path = tmp_path / "best.pt"
+    write_checkpoint_bytes(epoch_path, io.BytesIO(b"epoch-one"), fsync=False)
+    link_checkpoint_file(epoch_path, best_path)
+
+    write_checkpoint_bytes(best_path, io.BytesIO(b"epoch-two"), fsync=False)
+
+    assert (epoch_path.read_bytes(), best_path.read_bytes()) == (b"epoch-one", b"epoch-two")
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from serve.device_selection import resolve_execution_device
+from types import SimpleNamespace
+
+from serve.device_selection import cudnn_benchmark_scope, resolve_execution_device
 
 
 class _FakeCuda:
@@ -54,3 +56,33 @@ def test_resolve_execution_device_uses_cpu_when_no_accelerator_is_available() ->
     device = resolve_execution_device(_FakeTorch(cuda_available=False, mps_available=False))
 
     assert device == "cpu"
+
+
+def test_cudnn_benchmark_scope_turns_on_for_few_cuda_shapes() -> None:
+    """CUDA runs with repeating input shapes should enable the cuDNN autotuner."""
+    torch_module = SimpleNamespace(backends=SimpleNamespace(cudnn=SimpleNamespace(benchmark=False)))
+
+    with cudnn_benchmark_scope(torch_module, SimpleNamespace(type="cuda"), 3) as enabled:
+        benchmark_in_scope = torch_module.backends.cudnn.benchmark
+
+    assert (enabled, benchmark_in_scope) == (True, True)
+
+
+def test_cudnn_benchmark_scope_restores_previous_flag_on_exit() -> None:
+    """Leaving the scope should restore the flag the run started with."""
+    torch_module = SimpleNamespace(backends=SimpleNamespace(cudnn=SimpleNamespace(benchmark=False)))
+
+    with cudnn_benchmark_scope(torch_module, SimpleNamespace(type="cuda"), 3):
+        pass
+
+    assert torch_module.backends.cudnn.benchmark is False
+
+
+def test_cudnn_benchmark_scope_skips_many_shapes() -> None:
+    """Runs with many input shapes should keep default cuDNN heuristics."""
+    torch_module = SimpleNamespace(backends=SimpleNamespace(cudnn=SimpleNamespace(benchmark=False)))
+
+    with cudnn_benchmark_scope(torch_module, SimpleNamespace(type="cuda"), 500):
+        benchmark_in_scope = torch_module.backends.cudnn.benchmark
+
+    assert benchmark_in_scope is False
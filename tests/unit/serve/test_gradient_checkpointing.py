@@ -0,0 +1,90 @@
+"""Unit tests for optional activation checkpointing."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from core.types import TrainingOptions
+from serve.gradient_checkpointing import apply_gradient_checkpointing
+
+
+class _FakeModule:
+    def __init__(self, *children: Any) -> None:
+        self._children = list(children)
+        self.training = True
+
+    def children(self) -> list[Any]:
+        return list(self._children)
+
+    def forward(self, value: int) -> int:
+        return value + 1
+
+
+class _FakeModuleList(_FakeModule):
+    def __iter__(self):
+        return iter(self._children)
+
+
+class _FakeTorch:
+    def __init__(self) -> None:
+        self.grad_enabled = True
+        self.checkpoint_calls: list[bool] = []
+        self.nn = SimpleNamespace(ModuleList=_FakeModuleList)
+        self.utils = SimpleNamespace(checkpoint=SimpleNamespace(checkpoint=self._checkpoint))
+
+    def is_grad_enabled(self) -> bool:
+        return self.grad_enabled
+
+    def _checkpoint(self, function: Any, *args: Any, use_reentrant: bool, **kwargs: Any) -> Any:
+        self.checkpoint_calls.append(use_reentrant)
+        return function(*args, **kwargs)
+
+
+class _SelfCheckpointingModel(_FakeModule):
+    def __init__(self) -> None:
+        super().__init__()
+        self.enabled = False
+
+    def gradient_checkpointing_enable(self) -> None:
+        self.enabled = True
+
+
+def _options(enabled: bool) -> TrainingOptions:
+    return TrainingOptions(dataset_name="demo", output_dir="out", gradient_checkpointing=enabled)
+
+
+def test_apply_gradient_checkpointing_skips_when_disabled() -> None:
+    """Blocks should keep their own forward unless the flag is enabled."""
+    torch_module = _FakeTorch()
+    model = _FakeModule(_FakeModuleList(_FakeModule()))
+
+    apply_gradient_checkpointing(torch_module, model, _options(False))
+    model.children()[0].children()[0].forward(1)
+
+    assert torch_module.checkpoint_calls == []
+
+
+def test_apply_gradient_checkpointing_prefers_model_method() -> None:
+    """Models with their own checkpointing switch should use it."""
+    model = _SelfCheckpointingModel()
+
+    apply_gradient_checkpointing(_FakeTorch(), model, _options(True))
+
+    assert model.enabled
+
+
+def test_apply_gradient_checkpointing_wraps_outermost_blocks_in_training() -> None:
+    """Each outer block should recompute in training and skip checkpointing in eval."""
+    torch_module = _FakeTorch()
+    inner_block = _FakeModule()
+    outer_block = _FakeModule(_FakeModuleList(inner_block))
+    model = _FakeModule(_FakeModule(_FakeModuleList(outer_block)))
+
+    apply_gradient_checkpointing(torch_module, model, _options(True))
+    training_output = outer_block.forward(1)
+    inner_block.forward(1)
+    outer_block.training = False
+    outer_block.forward(1)
+
+    assert (training_output, torch_module.checkpoint_calls) == (2, [False])
@@ -0,0 +1,15 @@
+"""Unit tests for shared length-bucketed batch planning."""
+
+from __future__ import annotations
+
+from serve.length_buckets import plan_length_bucketed_batches
+
+
+def test_plan_length_bucketed_batches_keeps_each_batch_within_one_bucket() -> None:
+    """Every row should be planned once, in batches drawn from one length bucket."""
+    lengths = [7, 1, 5, 3, 8, 2, 6, 4]
+
+    batches = plan_length_bucketed_batches(range(8), lengths.__getitem__, 2, 4, random_seed=3)
+
+    spans = sorted(sorted(lengths[row] for row in batch) for batch in batches)
+    assert spans == [[1, 2], [3, 4], [5, 6], [7, 8]]
@@ -0,0 +1,62 @@
+"""Unit tests for optional training model compilation."""
+
+from __future__ import annotations
+
+from core.types import TrainingOptions
+from serve.model_compilation import compile_training_model
+
+
+class _FakeCompilableModel:
+    def __init__(self) -> None:
+        self.compile_modes: list[str] = []
+
+    def compile(self, mode: str) -> None:
+        self.compile_modes.append(mode)
+
+
+class _FailingCompileModel:
+    def compile(self, mode: str) -> None:
+        raise RuntimeError(f"compile unsupported for mode {mode}")
+
+
+def test_compile_training_model_skips_when_disabled() -> None:
+    """Models should stay eager unless compile_model is enabled."""
+    model = _FakeCompilableModel()
+
+    compile_training_model(model, TrainingOptions(dataset_name="demo", output_dir="out"))
+
+    assert model.compile_modes == []
+
+
+def test_compile_training_model_compiles_in_place_when_enabled() -> None:
+    """Enabled compilation should call Module.compile on the model itself."""
+    model = _FakeCompilableModel()
+    options = TrainingOptions(dataset_name="demo", output_dir="out", compile_model=True)
+
+    compile_training_model(model, options)
+
+    assert model.compile_modes == ["default"]
+
+
+def test_compile_training_model_uses_configured_mode() -> None:
+    """Compilation should pass the configured compile mode to Module.compile."""
+    model = _FakeCompilableModel()
+    options = TrainingOptions(
+        dataset_name="demo",
+        output_dir="out",
+        compile_model=True,
+        compile_mode="reduce-overhead",
+    )
+
+    compile_training_model(model, options)
+
+    assert model.compile_modes == ["reduce-overhead"]
+
+
+def test_compile_training_model_falls_back_to_eager_on_failure() -> None:
+    """Compile failures should leave training running in eager mode."""
+    options = TrainingOptions(dataset_name="demo", output_dir="out", compile_model=True)
+
+    compile_training_model(_FailingCompileModel(), options)
+
+    assert True
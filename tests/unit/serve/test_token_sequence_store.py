@@ -0,0 +1,17 @@
+"""Unit tests for compact token sequence storage."""
+
+from __future__ import annotations
+
+from serve.token_sequence_store import TokenSequenceStore
+
+
+def test_token_sequence_store_reads_ragged_rows_in_requested_order() -> None:
+    """Stored rows should round-trip with their lengths in any read order."""
+    store = TokenSequenceStore()
+    store.append([4, 5, 6])
+    store.append([])
+    store.append([7])
+
+    lengths = [store.sequence_length(row_index) for row_index in range(len(store))]
+
+    assert (lengths, store.read_batch([2, 0, 1])) == ([3, 0, 1], [[7], [4, 5, 6], []])
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from serve.tokenization import VocabularyTokenizer
+from serve.tokenization import (
+    SequenceBatch,
+    VocabularyTokenizer,
+    build_length_bucketed_batches,
+    build_sequence_batches,
+    count_batch_shapes,
+)
 
 
 def test_vocabulary_tokenizer_respects_max_vocabulary_size() -> None:
@@ -20,3 +26,38 @@ def test_vocabulary_tokenizer_encodes_omitted_tokens_as_unknown() -> None:
     encoded = tokenizer.encode("one three", max_token_length=10)
 
     assert encoded == [2, 1]
+
+
+def test_build_length_bucketed_batches_groups_similar_lengths() -> None:
+    """Bucketed batches should each hold sequences from one length bucket."""
+    sequences = [[1] * length for length in (2, 9, 3, 8, 2, 9, 3, 8)]
+    batches = build_length_bucketed_batches(sequences, 2, bucket_count=4, random_seed=7)
+    widths = sorted(sorted({len(row) for row in batch.inputs}) for batch in batches)
+
+    assert widths == [[1], [2], [7], [8]]
+
+
+def test_build_length_bucketed_batches_single_bucket_keeps_order() -> None:
+    """A single bucket should match plain in-order batching."""
+    sequences = [[1, 2, 3], [4, 5], [6, 7, 8, 9]]
+    batches = build_length_bucketed_batches(sequences, 2, bucket_count=1, random_seed=7)
+
+    assert batches == build_sequence_batches(sequences, 2)
+
+
+def test_vocabulary_tokenizer_fit_assigns_ids_in_first_occurrence_order() -> None:
+    """Repeated tokens should keep the id from their first appearance."""
+    tokenizer = VocabularyTokenizer.create()
+    tokenizer.fit(["b a b c", "c d a"])
+
+    assert list(tokenizer.vocabulary.items())[2:] == [("b", 2), ("a", 3), ("c", 4), ("d", 5)]
+
+
+def test_count_batch_shapes_counts_partial_batches_as_distinct_shapes() -> None:
+    """A partial batch with a repeated width should still count as a new shape."""
+    batches = [
+        SequenceBatch(inputs=[[1, 2], [3, 4]], targets=[[2, 0], [4, 0]]),
+        SequenceBatch(inputs=[[5, 6]], targets=[[6, 0]]),
+    ]
+
+    assert count_batch_shapes(batches) == 2
@@ -0,0 +1,59 @@
+"""Unit tests for the fitted tokenizer cache."""
+
+from __future__ import annotations
+
+from core.types import DataRecord, RecordMetadata, TrainingOptions
+from serve.tokenizer_cache import (
+    hash_record_texts,
+    load_or_fit_training_tokenizer,
+    tokenizer_cache_path,
+)
+
+
+def _build_records(text: str) -> list[DataRecord]:
+    metadata = RecordMetadata(
+        source_uri="input.txt",
+        language="en",
+        quality_score=0.8,
+        perplexity=2.1,
+    )
+    return [DataRecord(record_id="rid", text=text, metadata=metadata)]
+
+
+def test_load_or_fit_training_tokenizer_reuses_cached_vocabulary(tmp_path, monkeypatch) -> None:
+    """A second run on the same records should load the first run's vocabulary."""
+    options = TrainingOptions(dataset_name="demo", output_dir=str(tmp_path / "out"))
+    load_or_fit_training_tokenizer(_build_records("alpha beta"), options, tmp_path, "v1")
+
+    def _unexpected_fit(*args, **kwargs):
+        raise AssertionError("tokenizer should come from the cache")
+
+    monkeypatch.setattr("serve.tokenizer_cache.fit_training_tokenizer", _unexpected_fit)
+    tokenizer = load_or_fit_training_tokenizer(
+        _build_records("alpha beta"), options, tmp_path, "v1"
+    )
+
+    assert list(tokenizer.vocabulary) == ["<pad>", "<unk>", "alpha", "beta"]
+
+
+def test_load_or_fit_training_tokenizer_refits_other_records_under_same_id(tmp_path) -> None:
+    """Different records passed under one version id should not share a vocabulary."""
+    options = TrainingOptions(dataset_name="demo", output_dir=str(tmp_path / "out"))
+    load_or_fit_training_tokenizer(_build_records("alpha beta"), options, tmp_path, "v1")
+    tokenizer = load_or_fit_training_tokenizer(_build_records("gamma"), options, tmp_path, "v1")
+
+    assert list(tokenizer.vocabulary) == ["<pad>", "<unk>", "gamma"]
+
+
+def test_load_or_fit_training_tokenizer_refits_invalid_cache_file(tmp_path) -> None:
+    """A malformed cache file should be refit from the records."""
+    options = TrainingOptions(dataset_name="demo", output_dir=str(tmp_path / "out"))
+    records = _build_records("gamma")
+    cache_path = tokenizer_cache_path(
+        tmp_path, "v1", options.vocabulary_size, hash_record_texts(records)
+    )
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text('{"<pad>": 3}')
+    tokenizer = load_or_fit_training_tokenizer(records, options, tmp_path, "v1")
+
+    assert list(tokenizer.vocabulary) == ["<pad>", "<unk>", "gamma"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from core.types import TrainingRunResult
+from core.training_types import TrainingRunResult
 from serve.training_artifact_contract import (
     load_training_artifact_contract,
     save_training_artifact_contract,
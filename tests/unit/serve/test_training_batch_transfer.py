@@ -0,0 +1,148 @@
+"""Unit tests for host-to-device batch transfer."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Iterator
+
+from core.constants import BATCH_STAGING_BUFFER_COUNT
+from serve.training_batch_transfer import build_batch_transfer
+
+
+class _FakeStream:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.waited_on: list[str] = []
+
+    def wait_stream(self, stream: "_FakeStream") -> None:
+        self.waited_on.append(stream.name)
+
+
+class _FakeEvent:
+    def __init__(self, calls: list[str]) -> None:
+        self._calls = calls
+
+    def record(self, stream: _FakeStream) -> None:
+        self._calls.append(f"event:{stream.name}")
+
+    def synchronize(self) -> None:
+        self._calls.append("event_sync")
+
+
+class _FakeCuda:
+    def __init__(self, calls: list[str]) -> None:
+        self._calls = calls
+        self.compute_stream = _FakeStream("compute")
+        self.active_stream = "compute"
+
+    def Stream(self, device: object) -> _FakeStream:
+        _ = device
+        return _FakeStream("copy")
+
+    def Event(self) -> _FakeEvent:
+        return _FakeEvent(self._calls)
+
+    def current_stream(self) -> _FakeStream:
+        return self.compute_stream
+
+    @contextmanager
+    def stream(self, stream: _FakeStream) -> Iterator[None]:
+        self.active_stream = stream.name
+        yield
+        self.active_stream = "compute"
+
+
+class _FakeTensor:
+    dtype = "long"
+    shape = (1, 6)
+
+    def __init__(self, calls: list[str], cuda: _FakeCuda | None = None, size: int = 6) -> None:
+        self._calls = calls
+        self._cuda = cuda
+        self._size = size
+
+    def numel(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: slice) -> "_FakeTensor":
+        return _FakeTensor(self._calls, self._cuda, index.stop)
+
+    def view(self, shape: tuple[int, int]) -> "_FakeTensor":
+        _ = shape
+        return self
+
+    def copy_(self, source: "_FakeTensor") -> None:
+        self._calls.append(f"stage:{source.numel()}")
+
+    def to(self, device: object, non_blocking: bool = False) -> "_FakeTensor":
+        stream_name = self._cuda.active_stream if self._cuda is not None else "none"
+        self._calls.append(f"to:{device}:{non_blocking}:{stream_name}")
+        return self
+
+    def record_stream(self, stream: _FakeStream) -> None:
+        self._calls.append(f"record:{stream.name}")
+
+
+class _FakeTorch:
+    def __init__(self, calls: list[str]) -> None:
+        self._calls = calls
+        self.cuda = _FakeCuda(calls)
+
+    def empty(self, size: int, dtype: str, pin_memory: bool) -> _FakeTensor:
+        self._calls.append(f"pinned_alloc:{size}:{dtype}:{pin_memory}")
+        return _FakeTensor(self._calls, self.cuda, size)
+
+
+def test_batch_transfer_on_cpu_uses_plain_copy() -> None:
+    """CPU devices should get a blocking copy without pinning or streams."""
+    calls: list[str] = []
+    transfer = build_batch_transfer(SimpleNamespace(), "cpu")
+
+    transfer.wait_ready(transfer.start_copy(_FakeTensor(calls)))
+
+    assert (transfer.copy_stream, calls) == (None, ["to:cpu:False:none"])
+
+
+def test_batch_transfer_on_cuda_stages_and_copies_on_copy_stream() -> None:
+    """CUDA copies should stage into pinned memory and run non-blocking on the copy stream."""
+    calls: list[str] = []
+    torch_module = _FakeTorch(calls)
+    transfer = build_batch_transfer(torch_module, "cuda")
+
+    transfer.wait_ready(transfer.start_copy(_FakeTensor(calls, torch_module.cuda)))
+
+    assert (calls, torch_module.cuda.compute_stream.waited_on) == (
+        [
+            "pinned_alloc:6:long:True",
+            "stage:6",
+            "to:cuda:True:copy",
+            "event:copy",
+            "record:compute",
+        ],
+        ["copy"],
+    )
+
+
+def test_batch_transfer_start_copy_defers_compute_stream_wait() -> None:
+    """Starting a copy should not make the compute stream wait until it is used."""
+    calls: list[str] = []
+    torch_module = _FakeTorch(calls)
+    transfer = build_batch_transfer(torch_module, "cuda")
+
+    transfer.start_copy(_FakeTensor(calls, torch_module.cuda))
+
+    assert torch_module.cuda.compute_stream.waited_on == []
+
+
+def test_batch_transfer_reuses_staging_buffers_after_their_copy_finishes() -> None:
+    """Later batches should reuse ring slots, waiting on each slot's previous copy."""
+    calls: list[str] = []
+    torch_module = _FakeTorch(calls)
+    transfer = build_batch_transfer(torch_module, "cuda")
+
+    for _ in range(BATCH_STAGING_BUFFER_COUNT + 1):
+        transfer.start_copy(_FakeTensor(calls, torch_module.cuda, size=4))
+
+    allocations = [call for call in calls if call.startswith("pinned_alloc")]
+    assert (len(allocations), calls.count("event_sync")) == (BATCH_STAGING_BUFFER_COUNT, 1)
@@ -4,23 +4,29 @@ from __future__ import annotations
 
 import pickle
 from pathlib import Path
-from typing import Mapping
+from typing import BinaryIO, Mapping
 
 import pytest
 
 from core.errors import ForgeServeError
+from serve.checkpoint_retention import prune_epoch_checkpoints
+from serve.checkpoint_writer import CheckpointWriter
 from serve.training_checkpoint import (
     ensure_checkpoint_dir,
     load_resume_checkpoint,
-    prune_epoch_checkpoints,
     save_best_checkpoint,
+    save_epoch_and_best_checkpoints,
     save_epoch_checkpoint,
 )
 
 
 class _FakeTorch:
-    def save(self, payload: object, path: str) -> None:
-        Path(path).write_bytes(pickle.dumps(payload))
+    def __init__(self) -> None:
+        self.save_calls = 0
+
+    def save(self, payload: object, destination: BinaryIO) -> None:
+        self.save_calls += 1
+        destination.write(pickle.dumps(payload))
 
     def load(self, path: str, map_location: object) -> object:
         _ = map_location
@@ -143,7 +149,7 @@ def test_load_resume_checkpoint_raises_for_missing_file(tmp_path: Path) -> None:
 def test_load_resume_checkpoint_raises_for_invalid_payload(tmp_path: Path) -> None:
     """Resume loading should reject checkpoint payloads without required keys."""
     checkpoint_path = tmp_path / "invalid.pt"
-    _FakeTorch().save(payload={"epoch": "bad"}, path=str(checkpoint_path))
+    checkpoint_path.write_bytes(pickle.dumps({"epoch": "bad"}))
 
     with pytest.raises(ForgeServeError):
         load_resume_checkpoint(
@@ -156,3 +162,92 @@ def test_load_resume_checkpoint_raises_for_invalid_payload(tmp_path: Path) -> No
         )
 
     assert True
+
+
+def test_load_resume_checkpoint_reads_safetensors_model_sidecar(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Safetensors checkpoints should restore model weights from the sidecar file."""
+    monkeypatch.setattr(
+        "serve.training_checkpoint.save_model_tensors",
+        lambda model, tensors_path: tensors_path.write_bytes(pickle.dumps(model.state_dict())),
+    )
+    monkeypatch.setattr(
+        "serve.training_checkpoint.load_model_tensors",
+        lambda model, tensors_path, device: model.load_state_dict(
+            pickle.loads(tensors_path.read_bytes())
+        ),
+    )
+    checkpoint_dir = ensure_checkpoint_dir(tmp_path)
+    checkpoint_path = save_epoch_checkpoint(
+        checkpoint_dir=checkpoint_dir,
+        torch_module=_FakeTorch(),
+        model=_FakeModel(state={"weight": 7}),
+        optimizer=_FakeOptimizer(state={"step": 1}),
+        scheduler=None,
+        epoch=1,
+        global_step=3,
+        best_validation_loss=None,
+        checkpoint_format="safetensors",
+    )
+    model = _FakeModel(state={"weight": 0})
+
+    load_resume_checkpoint(
+        checkpoint_path=str(checkpoint_path),
+        torch_module=_FakeTorch(),
+        model=model,
+        optimizer=_FakeOptimizer(state={}),
+        scheduler=None,
+        device="cpu",
+    )
+
+    assert model.loaded_state == {"weight": 7}
+
+
+def test_save_epoch_checkpoint_with_background_writer_snapshots_state(tmp_path: Path) -> None:
+    """Background saves should persist state as of the save call, not later mutations."""
+    checkpoint_dir = ensure_checkpoint_dir(tmp_path)
+    optimizer = _FakeOptimizer(state={"step": {"count": 1}})
+    writer = CheckpointWriter(background=True)
+
+    checkpoint_path = save_epoch_checkpoint(
+        checkpoint_dir=checkpoint_dir,
+        torch_module=_FakeTorch(),
+        model=_FakeModel(state={"weight": 1}),
+        optimizer=optimizer,
+        scheduler=None,
+        epoch=1,
+        global_step=10,
+        best_validation_loss=None,
+        checkpoint_writer=writer,
+    )
+    optimizer.state_dict()["step"]["count"] = 2
+    writer.wait()
+    writer.close()
+
+    assert pickle.loads(checkpoint_path.read_bytes())["optimizer_state_dict"] == {
+        "step": {"count": 1}
+    }
+
+
+def test_save_epoch_and_best_checkpoints_serializes_once(tmp_path: Path) -> None:
+    """Shared epoch/best saves should serialize once and write identical files."""
+    torch_module = _FakeTorch()
+
+    epoch_path, best_path = save_epoch_and_best_checkpoints(
+        checkpoint_dir=ensure_checkpoint_dir(tmp_path),
+        torch_module=torch_module,
+        model=_FakeModel(state={"weight": 3}),
+        optimizer=_FakeOptimizer(state={"step": 2}),
+        scheduler=None,
+        epoch=2,
+        global_step=20,
+        best_validation_loss=0.5,
+    )
+
+    assert (
+        torch_module.save_calls == 1
+        and epoch_path.name == "epoch-0002.pt"
+        and epoch_path.read_bytes() == best_path.read_bytes()
+    )
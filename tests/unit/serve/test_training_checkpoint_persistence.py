@@ -0,0 +1,69 @@
+"""Unit tests for per-epoch checkpoint persistence."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import serve.training_checkpoint_persistence as persistence
+from serve.checkpoint_writer import CheckpointWriter
+
+
+def test_persist_checkpoint_state_runs_hook_and_transition_after_async_write(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """Async checkpoints should run hooks on the training thread after the write lands."""
+    events: list[str] = []
+    write_released = threading.Event()
+
+    def _save_epoch_checkpoint(**kwargs) -> Path:
+        def _write() -> None:
+            write_released.wait(timeout=5)
+            events.append("write")
+
+        kwargs["checkpoint_writer"].submit(_write)
+        return tmp_path / "epoch-1.pt"
+
+    monkeypatch.setattr(persistence, "save_epoch_checkpoint", _save_epoch_checkpoint)
+    monkeypatch.setattr(persistence, "prune_epoch_checkpoints", lambda **kwargs: None)
+    registry = SimpleNamespace(transition=lambda run_id, state: events.append(state))
+    context = SimpleNamespace(
+        options=SimpleNamespace(
+            checkpoint_every_epochs=1,
+            save_best_checkpoint=False,
+            checkpoint_format="torch",
+            checkpoint_fsync=False,
+            max_checkpoint_files=None,
+        ),
+        validation_batches=[],
+        distributed=SimpleNamespace(is_primary=True),
+        hooks=SimpleNamespace(on_checkpoint=_record_hook_thread(events)),
+        run_registry=registry,
+        run_id="run-1",
+        output_dir=tmp_path,
+        torch_module=None,
+        model=None,
+        optimizer=None,
+        scheduler=None,
+    )
+    writer = CheckpointWriter(background=True)
+
+    persistence.persist_checkpoint_state(context, writer, 1, 10, 0.0, None, tmp_path, None)
+    events_before_write = list(events)
+    write_released.set()
+    writer.wait()
+    writer.close()
+
+    assert (events_before_write, events) == (
+        ["checkpointing"],
+        ["checkpointing", "write", "hook-on-main-thread", "running"],
+    )
+
+
+def _record_hook_thread(events: list[str]):
+    def _on_checkpoint(*args) -> None:
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        events.append("hook-on-main-thread" if on_main_thread else "hook-on-worker")
+
+    return _on_checkpoint
@@ -0,0 +1,24 @@
+"""Unit tests for training config hashing."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from core.types import TrainingOptions
+from serve.training_config_hash import compute_training_config_hash
+
+
+def test_compute_training_config_hash_equal_options_share_hash() -> None:
+    """Equal option values should hash identically across instances."""
+    first = TrainingOptions(dataset_name="demo", output_dir="/tmp/out")
+    second = TrainingOptions(dataset_name="demo", output_dir="/tmp/out")
+
+    assert compute_training_config_hash(first) == compute_training_config_hash(second)
+
+
+def test_compute_training_config_hash_changes_with_options() -> None:
+    """Changing one option field should change the config hash."""
+    options = TrainingOptions(dataset_name="demo", output_dir="/tmp/out")
+    updated = replace(options, epochs=options.epochs + 1)
+
+    assert compute_training_config_hash(options) != compute_training_config_hash(updated)
@@ -4,9 +4,15 @@ from __future__ import annotations
 
 import pytest
 
-from core.errors import ForgeDependencyError
-from core.types import DataLoaderOptions, DataRecord, RecordMetadata
-from serve.training_dataloader import create_pytorch_dataloader, create_token_batches
+from core.errors import ForgeDependencyError, ForgeServeError
+from core.training_types import DataLoaderOptions
+from core.types import DataRecord, RecordMetadata
+from serve.training_dataloader import (
+    _StreamingTokenBatches,
+    create_pytorch_dataloader,
+    create_token_batches,
+    iter_token_batches,
+)
 
 
 def _build_records() -> list[DataRecord]:
@@ -53,3 +59,107 @@ def test_create_pytorch_dataloader_raises_without_torch(monkeypatch) -> None:
         create_pytorch_dataloader(_build_records(), options, random_seed=7)
 
     assert options.batch_size == 1
+
+
+def test_create_token_batches_groups_similar_lengths_when_bucketing() -> None:
+    """Length bucketing should keep each batch within one length band."""
+    metadata = _build_records()[0].metadata
+    records = [
+        DataRecord(record_id=str(length), text=" ".join(["t"] * length), metadata=metadata)
+        for length in [1, 9, 2, 8, 1, 9, 2, 8]
+    ]
+    options = DataLoaderOptions(
+        batch_size=2,
+        shuffle=True,
+        shuffle_buffer_size=4,
+        max_token_length=16,
+        length_bucket_count=4,
+    )
+
+    batches = create_token_batches(records, options, random_seed=3)
+
+    assert sorted(sorted(len(sequence) for sequence in batch) for batch in batches) == [
+        [1, 1],
+        [2, 2],
+        [8, 8],
+        [9, 9],
+    ]
+
+
+def test_iter_token_batches_yields_before_consuming_all_records() -> None:
+    """Streaming batches should be emitted while later records are still unread."""
+    consumed: list[str] = []
+
+    def _record_stream():
+        for record in _build_records() * 3:
+            consumed.append(record.record_id)
+            yield record
+
+    options = DataLoaderOptions(
+        batch_size=1,
+        shuffle=True,
+        shuffle_buffer_size=2,
+        max_token_length=10,
+        length_bucket_count=1,
+    )
+
+    next(iter_token_batches(_record_stream(), options, random_seed=7))
+
+    assert len(consumed) == 2
+
+
+def test_streaming_dataset_repeats_batches_for_second_epoch() -> None:
+    """Sized records should give a length and identical batches on every epoch."""
+    options = DataLoaderOptions(1, True, 2, 10, length_bucket_count=1)
+    dataset = _StreamingTokenBatches(_build_records(), options, random_seed=7)
+
+    first_epoch = list(dataset)
+    second_epoch = list(dataset)
+
+    assert (len(dataset), second_epoch) == (2, first_epoch)
+
+
+def test_streaming_dataset_rejects_second_epoch_of_one_shot_iterator() -> None:
+    """A consumed one-shot iterator should fail loudly instead of yielding nothing."""
+    options = DataLoaderOptions(1, True, 2, 10, length_bucket_count=1)
+    dataset = _StreamingTokenBatches(iter(_build_records()), options, random_seed=7)
+    list(dataset)
+
+    with pytest.raises(ForgeServeError):
+        iter(dataset)
+
+    assert True
+
+
+def _varied_length_records() -> list[DataRecord]:
+    metadata = _build_records()[0].metadata
+    return [
+        DataRecord(record_id=str(index), text=" ".join(["t"] * length), metadata=metadata)
+        for index, length in enumerate([1, 9, 1, 9, 2, 8, 2, 8, 5])
+    ]
+
+
+def test_streaming_dataset_unsized_records_bucket_within_shuffle_windows() -> None:
+    """Unsized record streams should group similar lengths within each window."""
+    options = DataLoaderOptions(2, True, 1, 16, length_bucket_count=2)
+    dataset = _StreamingTokenBatches(iter(_varied_length_records()), options, random_seed=3)
+
+    batches = list(dataset)
+
+    assert sorted(sorted(len(row) for row in batch) for batch in batches) == [
+        [1, 1],
+        [2, 2],
+        [5],
+        [8, 8],
+        [9, 9],
+    ]
+
+
+def test_streaming_dataset_sized_records_match_create_token_batches() -> None:
+    """Sized records should give create_token_batches' batches and their count."""
+    records = _varied_length_records()
+    options = DataLoaderOptions(2, True, 4, 16, length_bucket_count=2)
+    expected = create_token_batches(records, options, random_seed=3)
+    dataset = _StreamingTokenBatches(records, options, random_seed=3)
+
+    assert (len(dataset), list(dataset)) == (len(expected), expected)
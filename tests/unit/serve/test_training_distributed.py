@@ -0,0 +1,97 @@
+"""Unit tests for multi-process data-parallel training setup."""
+
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from core.errors import ForgeServeError
+from serve.training_distributed import (
+    DistributedRuntime,
+    average_across_ranks,
+    destroy_distributed_process_group,
+    read_distributed_runtime,
+    shard_for_rank,
+    wrap_distributed_model,
+)
+
+
+def test_read_distributed_runtime_without_launcher_is_single_process() -> None:
+    """Missing launcher variables should describe one primary process."""
+    runtime = read_distributed_runtime({})
+
+    assert runtime == DistributedRuntime(rank=0, local_rank=0, world_size=1)
+
+
+def test_read_distributed_runtime_parses_launcher_environment() -> None:
+    """Launcher variables should map onto rank, local rank, and world size."""
+    runtime = read_distributed_runtime({"WORLD_SIZE": "4", "RANK": "3", "LOCAL_RANK": "1"})
+
+    assert (runtime.enabled, runtime.is_primary, runtime.local_rank) == (True, False, 1)
+
+
+def test_read_distributed_runtime_rank_out_of_range_raises() -> None:
+    """A rank outside the world size should fail with a serve error."""
+    with pytest.raises(ForgeServeError):
+        read_distributed_runtime({"WORLD_SIZE": "2", "RANK": "2"})
+
+    assert True
+
+
+def test_shard_for_rank_trims_to_equal_strided_shards() -> None:
+    """Every rank should receive the same number of strided items."""
+    items = list(range(7))
+    shards = [
+        shard_for_rank(items, DistributedRuntime(rank=rank, local_rank=rank, world_size=3))
+        for rank in range(3)
+    ]
+
+    assert shards == [[0, 3], [1, 4], [2, 5]]
+
+
+def test_wrap_distributed_model_single_process_returns_none() -> None:
+    """Single-process runs should train the model without a DDP wrapper."""
+    wrapped = wrap_distributed_model(object(), object(), "cpu", DistributedRuntime())
+
+    assert wrapped is None
+
+
+class _FakeScalarTensor:
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    def item(self) -> float:
+        return self.value
+
+
+def test_average_across_ranks_divides_reduced_sum_by_world_size() -> None:
+    """The summed per-rank values should be averaged over the world size."""
+
+    def _all_reduce(tensor: _FakeScalarTensor) -> None:
+        tensor.value += 3.0
+
+    torch_module = SimpleNamespace(
+        float64="float64",
+        tensor=lambda values, dtype, device: _FakeScalarTensor(values[0]),
+        distributed=SimpleNamespace(all_reduce=_all_reduce),
+    )
+    runtime = DistributedRuntime(rank=0, local_rank=0, world_size=2)
+
+    assert average_across_ranks(torch_module, 1.0, "cpu", runtime) == pytest.approx(2.0)
+
+
+def test_destroy_distributed_process_group_leaves_initialized_group(monkeypatch) -> None:
+    """Multi-process runs should destroy the process group they joined."""
+    destroyed: list[bool] = []
+    fake_distributed = SimpleNamespace(
+        is_available=lambda: True,
+        is_initialized=lambda: True,
+        destroy_process_group=lambda: destroyed.append(True),
+    )
+    monkeypatch.setitem(sys.modules, "torch", SimpleNamespace(distributed=fake_distributed))
+
+    destroy_distributed_process_group(DistributedRuntime(rank=1, local_rank=1, world_size=2))
+
+    assert destroyed == [True]
@@ -0,0 +1,145 @@
+"""Unit tests for train/validation epoch-pass execution."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from core.types import BatchLossMetric
+from serve.training_epoch_pass import run_epoch_pass
+from serve.training_metric_log import BatchLossLog
+from tests.unit.serve.epoch_pass_fakes import (
+    NoSyncModel,
+    build_batches,
+    build_context,
+    build_tracker,
+)
+
+
+def test_run_epoch_pass_returns_mean_loss_and_advances_steps() -> None:
+    """Training pass should average batch losses and advance one step per batch."""
+    context = build_context([1.0, 2.0, 3.0, 6.0])
+
+    mean_loss, global_step = run_epoch_pass(
+        context=context,
+        batches=build_batches(4),
+        phase="train",
+        epoch_index=1,
+        global_step=10,
+        batch_loss_log=BatchLossLog(),
+        progress_tracker=build_tracker(interval=100),
+    )
+
+    assert (mean_loss, global_step) == (3.0, 14)
+
+
+def test_run_epoch_pass_records_batch_rows_with_global_steps() -> None:
+    """Training pass should record one loss row per batch with its global step."""
+    context = build_context([0.5, 0.25])
+    batch_loss_log = BatchLossLog()
+
+    run_epoch_pass(
+        context=context,
+        batches=build_batches(2),
+        phase="train",
+        epoch_index=2,
+        global_step=4,
+        batch_loss_log=batch_loss_log,
+        progress_tracker=build_tracker(interval=100),
+    )
+
+    assert batch_loss_log.to_metrics() == [
+        BatchLossMetric(epoch=2, batch_index=1, global_step=5, train_loss=0.5),
+        BatchLossMetric(epoch=2, batch_index=2, global_step=6, train_loss=0.25),
+    ]
+
+
+def test_run_epoch_pass_reads_losses_with_single_sync_when_not_logging() -> None:
+    """Losses for batches without progress events should be read in one stacked copy."""
+    context = build_context([1.0, 1.0, 1.0, 1.0])
+
+    run_epoch_pass(
+        context=context,
+        batches=build_batches(4),
+        phase="train",
+        epoch_index=1,
+        global_step=0,
+        batch_loss_log=BatchLossLog(),
+        progress_tracker=build_tracker(interval=100),
+    )
+
+    item_calls = [tensor.item_calls for tensor in context.loss_function.tensors]
+    assert (item_calls, context.torch_module.stack_calls) == ([1, 0, 0, 1], 1)
+
+
+def test_run_epoch_pass_skips_loss_reads_when_info_logging_disabled(monkeypatch) -> None:
+    """Disabled progress logging should leave every loss to the single stacked copy."""
+    monkeypatch.setattr("serve.training_progress.is_info_enabled", lambda logger: False)
+    context = build_context([1.0, 1.0, 1.0, 1.0])
+
+    run_epoch_pass(
+        context=context,
+        batches=build_batches(4),
+        phase="train",
+        epoch_index=1,
+        global_step=0,
+        batch_loss_log=BatchLossLog(),
+        progress_tracker=build_tracker(interval=1),
+    )
+
+    assert [tensor.item_calls for tensor in context.loss_function.tensors] == [0, 0, 0, 0]
+
+
+def test_run_epoch_pass_accumulates_gradients_across_batches() -> None:
+    """Accumulation should step once per group and skip gradient sync inside groups."""
+    context = build_context([1.0, 1.0, 1.0, 1.0, 1.0])
+    context.model = NoSyncModel()
+    context.options = SimpleNamespace(gradient_accumulation_steps=2)
+
+    run_epoch_pass(
+        context=context,
+        batches=build_batches(5),
+        phase="train",
+        epoch_index=1,
+        global_step=0,
+        batch_loss_log=BatchLossLog(),
+        progress_tracker=build_tracker(interval=100),
+    )
+
+    assert (context.optimizer.steps, context.model.no_sync_entries) == (3, 2)
+
+
+def test_run_epoch_pass_accumulation_reads_losses_with_single_sync() -> None:
+    """Accumulated micro-batches should not read their losses back one by one."""
+    context = build_context([1.0, 1.0, 1.0, 1.0])
+    context.options = SimpleNamespace(gradient_accumulation_steps=2)
+
+    run_epoch_pass(
+        context=context,
+        batches=build_batches(4),
+        phase="train",
+        epoch_index=1,
+        global_step=0,
+        batch_loss_log=BatchLossLog(),
+        progress_tracker=build_tracker(interval=100),
+    )
+
+    item_calls = [tensor.item_calls for tensor in context.loss_function.tensors]
+    assert (item_calls, context.torch_module.stack_calls) == ([1, 0, 0, 1], 1)
+
+
+def test_run_epoch_pass_runs_validation_under_inference_mode() -> None:
+    """Validation batches should run without autograd while training batches keep it."""
+    context = build_context([1.0, 1.0, 1.0])
+
+    for phase, batch_count in (("train", 1), ("validation", 2)):
+        run_epoch_pass(
+            context=context,
+            batches=build_batches(batch_count),
+            phase=phase,
+            epoch_index=1,
+            global_step=0,
+            batch_loss_log=BatchLossLog(),
+            progress_tracker=build_tracker(interval=100),
+        )
+
+    assert context.torch_module.inference_mode_entries == 2
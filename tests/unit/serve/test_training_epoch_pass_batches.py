@@ -0,0 +1,68 @@
+"""Unit tests for epoch-pass batch padding, prefetch, and host tensor reuse."""
+
+from __future__ import annotations
+
+from serve.tokenization import SequenceBatch
+from serve.training_epoch_pass import run_epoch_pass
+from serve.training_metric_log import BatchLossLog
+from tests.unit.serve.epoch_pass_fakes import (
+    TensorCountingModel,
+    build_batches,
+    build_context,
+    build_tracker,
+)
+
+
+def test_run_epoch_pass_pads_ragged_batches_with_pad_id() -> None:
+    """Shorter sequences should be right-padded with the pad id to batch length."""
+    context = build_context([1.0])
+    batch = SequenceBatch(inputs=[[5, 6, 7], [8]], targets=[[6, 7, 9], [3]])
+
+    run_epoch_pass(
+        context=context,
+        batches=[batch],
+        phase="validation",
+        epoch_index=1,
+        global_step=0,
+        batch_loss_log=BatchLossLog(),
+        progress_tracker=build_tracker(interval=100),
+    )
+
+    assert context.model.seen_inputs == [[[5, 6, 7], [8, 0, 0]]]
+
+
+def test_run_epoch_pass_prepares_next_batch_before_current_step() -> None:
+    """The next batch should be tensorized before the current batch's forward pass."""
+    context = build_context([1.0, 1.0])
+    context.model = TensorCountingModel(context.torch_module)
+
+    run_epoch_pass(
+        context=context,
+        batches=build_batches(2),
+        phase="validation",
+        epoch_index=1,
+        global_step=0,
+        batch_loss_log=BatchLossLog(),
+        progress_tracker=build_tracker(interval=100),
+    )
+
+    assert context.model.tensors_built_at_forward == [4, 4]
+
+
+def test_run_epoch_pass_reuses_padded_tensors_for_run_batches() -> None:
+    """The run's own batches should be padded once and reused by later epochs."""
+    context = build_context([1.0, 1.0, 1.0, 1.0])
+    context.train_batches = build_batches(2)
+
+    for epoch_index in (1, 2):
+        run_epoch_pass(
+            context=context,
+            batches=context.train_batches,
+            phase="train",
+            epoch_index=epoch_index,
+            global_step=0,
+            batch_loss_log=BatchLossLog(),
+            progress_tracker=build_tracker(interval=100),
+        )
+
+    assert context.torch_module.frombuffer_calls == 4
@@ -16,9 +16,10 @@ from serve.training_hooks import (
 
 class _FakeTorch:
     class nn:
-        @staticmethod
-        def CrossEntropyLoss(ignore_index: int) -> str:
-            return f"default-loss-{ignore_index}"
+        class functional:
+            @staticmethod
+            def cross_entropy(logits: str, targets: str, ignore_index: int) -> str:
+                return f"{logits}-{targets}-ignore-{ignore_index}"
 
 
 def test_load_training_hooks_reads_optional_callbacks(tmp_path: Path) -> None:
@@ -40,9 +41,9 @@ def test_load_training_hooks_reads_optional_callbacks(tmp_path: Path) -> None:
 def test_build_loss_function_from_hooks_uses_default_when_unset() -> None:
     """Missing loss hook should fall back to default cross-entropy loss."""
     hooks = load_training_hooks(None)
-    loss = build_loss_function_from_hooks(_FakeTorch(), hooks, runtime_context=object())
+    loss_function = build_loss_function_from_hooks(_FakeTorch(), hooks, runtime_context=object())
 
-    assert loss == "default-loss-0"
+    assert loss_function("logits", "targets") == "logits-targets-ignore-0"
 
 
 def test_invoke_hook_raises_traceable_error_on_callback_failure() -> None:
@@ -55,3 +56,23 @@ def test_invoke_hook_raises_traceable_error_on_callback_failure() -> None:
         invoke_hook("on_run_start", _broken_hook)
 
     assert True
+
+
+def test_load_training_hooks_reexecutes_module_on_each_load(tmp_path: Path) -> None:
+    """Every load should run the hooks module again instead of reusing old hooks."""
+    hooks_file = tmp_path / "hooks.py"
+    hooks_file.write_text("def on_run_start(context):\n    _ = context\n", encoding="utf-8")
+
+    first = load_training_hooks(str(hooks_file))
+    repeated = load_training_hooks(str(hooks_file))
+
+    assert repeated.on_run_start is not first.on_run_start
+
+
+def test_load_training_hooks_rejects_non_callable_hook(tmp_path: Path) -> None:
+    """Hook names bound to non-callable values should fail with a clear error."""
+    hooks_file = tmp_path / "hooks.py"
+    hooks_file.write_text("on_epoch_end = 5\n", encoding="utf-8")
+
+    with pytest.raises(ForgeServeError, match="'on_epoch_end' exists but is not callable"):
+        load_training_hooks(str(hooks_file))
@@ -42,6 +42,10 @@ def test_save_and_load_training_config_round_trip(tmp_path: Path) -> None:
         "epochs": 3,
         "learning_rate": 0.001,
         "precision_mode": "auto",
+        "compile_model": False,
+        "compile_mode": "default",
+        "gradient_checkpointing": False,
+        "allow_tf32": True,
         "optimizer_type": "adam",
         "weight_decay": 0.0,
         "sgd_momentum": 0.9,
@@ -51,6 +55,8 @@ def test_save_and_load_training_config_round_trip(tmp_path: Path) -> None:
         "scheduler_t_max_epochs": None,
         "scheduler_eta_min": 0.0,
         "batch_size": 16,
+        "gradient_accumulation_steps": 1,
+        "length_bucket_count": 8,
         "max_token_length": 384,
         "validation_split": 0.1,
         "hidden_dim": 256,
@@ -65,6 +71,9 @@ def test_save_and_load_training_config_round_trip(tmp_path: Path) -> None:
         "checkpoint_every_epochs": 1,
         "save_best_checkpoint": True,
         "max_checkpoint_files": 5,
+        "checkpoint_format": "torch",
+        "async_checkpoint": False,
+        "checkpoint_fsync": False,
         "resume_checkpoint_path": None,
         "progress_log_interval_steps": 10,
     }
@@ -92,6 +101,16 @@ def test_load_training_config_returns_none_when_missing(tmp_path: Path) -> None:
     assert payload is None
 
 
+def test_load_tokenizer_returns_none_when_vocabulary_missing(tmp_path: Path) -> None:
+    """Missing vocabulary beside the model should return None without error."""
+    model_path = tmp_path / "model.pt"
+    model_path.write_text("placeholder", encoding="utf-8")
+
+    tokenizer = load_tokenizer(str(model_path))
+
+    assert tokenizer is None
+
+
 def test_load_tokenizer_from_path_reads_valid_vocabulary(tmp_path: Path) -> None:
     """Explicit vocabulary path should load a valid tokenizer."""
     import json
@@ -153,3 +172,32 @@ def test_load_tokenizer_from_path_raises_for_unrecognized_format(tmp_path: Path)
 
     with pytest.raises(ForgeServeError, match="Unrecognized tokenizer format"):
         load_tokenizer_from_path(str(bad_path))
+
+
+def test_load_tokenizer_from_path_names_token_with_non_integer_id(tmp_path: Path) -> None:
+    """Vocabulary validation should name the first entry whose id is not an integer."""
+    import json
+
+    vocabulary = {f"token{index}": index for index in range(6)}
+    vocabulary["broken"] = "7"  # type: ignore[assignment]
+    vocabulary_path = tmp_path / "vocab.json"
+    vocabulary_path.write_text(json.dumps(vocabulary), encoding="utf-8")
+
+    with pytest.raises(ForgeServeError, match="token id for 'broken' must be an integer"):
+        load_tokenizer_from_path(str(vocabulary_path))
+
+
+def test_save_tokenizer_vocabulary_orders_unsorted_vocabulary_by_id(tmp_path: Path) -> None:
+    """Vocabularies not known to be id-ordered should be written in id order."""
+    import json
+
+    tokenizer = VocabularyTokenizer(vocabulary={"beta": 3, "<pad>": 0, "alpha": 2, "<unk>": 1})
+
+    vocabulary_path = save_tokenizer_vocabulary(tmp_path, tokenizer)
+
+    assert list(json.loads(vocabulary_path.read_text(encoding="utf-8"))) == [
+        "<pad>",
+        "<unk>",
+        "alpha",
+        "beta",
+    ]
@@ -0,0 +1,37 @@
+"""Unit tests for compact training metric storage."""
+
+from __future__ import annotations
+
+from core.types import BatchLossMetric, EpochMetric
+from serve.training_metric_log import BatchLossLog, EpochLossLog
+
+
+def test_batch_loss_log_materializes_rows_across_epochs() -> None:
+    """Batch loss log should rebuild contiguous batch indexes and global steps per epoch."""
+    batch_loss_log = BatchLossLog()
+    batch_loss_log.extend_epoch(1, 0, [0.5, 0.25])
+    batch_loss_log.extend_epoch(2, 2, [0.1234567])
+
+    assert batch_loss_log.to_metrics() == [
+        BatchLossMetric(epoch=1, batch_index=1, global_step=1, train_loss=0.5),
+        BatchLossMetric(epoch=1, batch_index=2, global_step=2, train_loss=0.25),
+        BatchLossMetric(epoch=2, batch_index=1, global_step=3, train_loss=0.123457),
+    ]
+
+
+def test_batch_loss_log_skips_empty_epochs() -> None:
+    """Batch loss log should not record segments for epochs without batches."""
+    batch_loss_log = BatchLossLog()
+    batch_loss_log.extend_epoch(1, 0, [])
+
+    assert len(batch_loss_log) == 0
+
+
+def test_epoch_loss_log_rounds_losses_when_materialized() -> None:
+    """Epoch loss log should keep raw losses and round them into metric rows."""
+    epoch_loss_log = EpochLossLog()
+    epoch_loss_log.append(3, 1.23456789, 2.0)
+
+    assert epoch_loss_log.to_metrics() == [
+        EpochMetric(epoch=3, train_loss=1.234568, validation_loss=2.0)
+    ]
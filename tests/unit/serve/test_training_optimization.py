@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 from core.types import TrainingOptions
 from serve.training_optimization import build_training_optimization
 
@@ -101,3 +103,67 @@ def test_build_training_optimization_supports_sgd_with_cosine_scheduler(tmp_path
         and optimization.scheduler.kind == "cosine"
         and optimization.scheduler.kwargs == {"t_max": 7, "eta_min": 0.0001}
     )
+
+
+def test_build_training_optimization_requests_fused_adam_for_cuda_parameters(tmp_path) -> None:
+    """Adam on all-CUDA parameters should request the fused kernel."""
+    requested: dict[str, object] = {}
+
+    class _CudaModel:
+        def parameters(self) -> list[object]:
+            return [SimpleNamespace(is_cuda=True), SimpleNamespace(is_cuda=True)]
+
+    class _FusedOptimNamespace(_FakeOptimNamespace):
+        def Adam(self, params: list[object], lr: float, weight_decay: float, **kernel) -> object:
+            requested.update(kernel)
+            return super().Adam(params, lr, weight_decay)
+
+    torch_module = _FakeTorch()
+    torch_module.optim = _FusedOptimNamespace()
+    options = TrainingOptions(dataset_name="demo", output_dir=str(tmp_path))
+
+    build_training_optimization(torch_module, _CudaModel(), options)
+
+    assert requested == {"fused": True}
+
+
+def test_build_training_optimization_requests_foreach_sgd_kernels(tmp_path) -> None:
+    """SGD should request the foreach multi-tensor implementation."""
+    requested: dict[str, object] = {}
+
+    class _ForeachOptimNamespace(_FakeOptimNamespace):
+        def SGD(self, params, lr, momentum, weight_decay, **kernel) -> object:
+            requested.update(kernel)
+            return super().SGD(params, lr, momentum, weight_decay)
+
+    torch_module = _FakeTorch()
+    torch_module.optim = _ForeachOptimNamespace()
+    options = TrainingOptions(dataset_name="demo", output_dir=str(tmp_path), optimizer_type="sgd")
+
+    build_training_optimization(torch_module, _FakeModel(), options)
+
+    assert requested == {"foreach": True}
+
+
+def test_build_training_optimization_falls_back_to_foreach_without_fused_sgd(tmp_path) -> None:
+    """CUDA SGD should use foreach kernels when the torch build rejects fused."""
+    requested: list[dict[str, object]] = []
+
+    class _CudaModel:
+        def parameters(self) -> list[object]:
+            return [SimpleNamespace(is_cuda=True)]
+
+    class _NoFusedOptimNamespace(_FakeOptimNamespace):
+        def SGD(self, params, lr, momentum, weight_decay, **kernel) -> object:
+            requested.append(kernel)
+            if "fused" in kernel:
+                raise TypeError("SGD.__init__() got an unexpected keyword argument 'fused'")
+            return super().SGD(params, lr, momentum, weight_decay)
+
+    torch_module = _FakeTorch()
+    torch_module.optim = _NoFusedOptimNamespace()
+    options = TrainingOptions(dataset_name="demo", output_dir=str(tmp_path), optimizer_type="sgd")
+
+    build_training_optimization(torch_module, _CudaModel(), options)
+
+    assert requested == [{"fused": True}, {"foreach": True}]
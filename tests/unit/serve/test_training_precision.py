@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 from serve.training_precision import build_training_precision_runtime
 
 
@@ -10,25 +12,48 @@ class _FakeGradScaler:
         self.enabled = enabled
 
 
+class _FakeDeviceGradScaler:
+    def __init__(self, device: str, enabled: bool) -> None:
+        self.device = device
+        self.enabled = enabled
+
+
 class _FakeAmp:
     GradScaler = _FakeGradScaler
 
 
 class _FakeCuda:
-    def __init__(self, bf16_supported: bool) -> None:
+    def __init__(self, bf16_supported: bool, capability_major: int) -> None:
         self._bf16_supported = bf16_supported
+        self._capability_major = capability_major
         self.amp = _FakeAmp()
+        self.bf16_probe_calls = 0
 
     def is_bf16_supported(self) -> bool:
+        self.bf16_probe_calls += 1
         return self._bf16_supported
 
+    def get_device_capability(self, device: object) -> tuple[int, int]:
+        return (self._capability_major, 0)
+
 
 class _FakeTorch:
     float16 = "float16"
     bfloat16 = "bfloat16"
 
-    def __init__(self, bf16_supported: bool) -> None:
-        self.cuda = _FakeCuda(bf16_supported=bf16_supported)
+    def __init__(self, bf16_supported: bool, capability_major: int = 8) -> None:
+        self.cuda = _FakeCuda(bf16_supported=bf16_supported, capability_major=capability_major)
+        self.backends = SimpleNamespace(
+            cuda=SimpleNamespace(matmul=SimpleNamespace(allow_tf32=False)),
+            cudnn=SimpleNamespace(allow_tf32=False),
+        )
+        self.matmul_precision = "highest"
+
+    def set_float32_matmul_precision(self, precision: str) -> None:
+        self.matmul_precision = precision
+
+    def autocast(self, device_type: str, dtype: object) -> tuple[str, object]:
+        return (device_type, dtype)
 
 
 class _FakeDevice:
@@ -70,7 +95,7 @@ def test_build_precision_runtime_auto_on_cuda_prefers_bf16() -> None:
 def test_build_precision_runtime_bf16_falls_back_to_fp16_when_unsupported() -> None:
     """bf16 request should fall back to fp16 when hardware lacks bf16 support."""
     runtime = build_training_precision_runtime(
-        torch_module=_FakeTorch(bf16_supported=False),
+        torch_module=_FakeTorch(bf16_supported=False, capability_major=7),
         requested_mode="bf16",
         device=_FakeDevice("cuda"),
     )
@@ -82,3 +107,109 @@ def test_build_precision_runtime_bf16_falls_back_to_fp16_when_unsupported() -> N
         and runtime.scaler is not None
         and runtime.scaler.enabled
     )
+
+
+def test_build_precision_runtime_binds_autocast_factory_for_cuda() -> None:
+    """Autocast factory should be pre-bound with the resolved device type and dtype."""
+    runtime = build_training_precision_runtime(
+        torch_module=_FakeTorch(bf16_supported=True),
+        requested_mode="auto",
+        device=_FakeDevice("cuda"),
+    )
+
+    assert runtime.autocast_factory() == ("cuda", "bfloat16")
+
+
+def test_build_precision_runtime_fp32_on_ampere_enables_tf32() -> None:
+    """fp32 runs on capability 8.x CUDA devices should switch matmuls to TF32."""
+    torch_module = _FakeTorch(bf16_supported=True)
+
+    runtime = build_training_precision_runtime(
+        torch_module=torch_module,
+        requested_mode="fp32",
+        device=_FakeDevice("cuda"),
+    )
+
+    assert (
+        runtime.tf32_enabled,
+        torch_module.matmul_precision,
+        torch_module.backends.cuda.matmul.allow_tf32,
+        torch_module.backends.cudnn.allow_tf32,
+    ) == (True, "high", True, True)
+
+
+def test_build_precision_runtime_fp32_keeps_full_precision_when_tf32_disallowed() -> None:
+    """The TF32 opt-out should leave fp32 matmul precision untouched."""
+    torch_module = _FakeTorch(bf16_supported=True)
+
+    runtime = build_training_precision_runtime(
+        torch_module=torch_module,
+        requested_mode="fp32",
+        device=_FakeDevice("cuda"),
+        allow_tf32=False,
+    )
+
+    assert (runtime.tf32_enabled, torch_module.matmul_precision) == (False, "highest")
+
+
+def test_build_precision_runtime_auto_on_ampere_skips_bf16_probe() -> None:
+    """Auto precision on capability 8.x should pick bf16 without probing support."""
+    torch_module = _FakeTorch(bf16_supported=True)
+
+    runtime = build_training_precision_runtime(
+        torch_module=torch_module,
+        requested_mode="auto",
+        device=_FakeDevice("cuda"),
+    )
+
+    assert (runtime.resolved_mode, runtime.scaler, torch_module.cuda.bf16_probe_calls) == (
+        "bf16",
+        None,
+        0,
+    )
+
+
+def test_build_precision_runtime_fp16_on_ampere_warns_suboptimal(monkeypatch) -> None:
+    """Explicit fp16 on capability 8.x should be honored with a suboptimal warning."""
+    warnings: list[str] = []
+    fake_logger = SimpleNamespace(
+        warning=lambda event, **_: warnings.append(event),
+        info=lambda event, **_: None,
+    )
+    monkeypatch.setattr("serve.training_precision._LOGGER", fake_logger)
+
+    runtime = build_training_precision_runtime(
+        torch_module=_FakeTorch(bf16_supported=True),
+        requested_mode="fp16",
+        device=_FakeDevice("cuda"),
+    )
+
+    assert (runtime.resolved_mode, warnings) == ("fp16", ["training_precision_suboptimal"])
+
+
+def test_build_precision_runtime_probes_bf16_support_once_per_torch_module() -> None:
+    """Repeated runtime builds should reuse the cached bf16 support probe."""
+    torch_module = _FakeTorch(bf16_supported=True, capability_major=7)
+
+    for _ in range(3):
+        build_training_precision_runtime(
+            torch_module=torch_module,
+            requested_mode="auto",
+            device=_FakeDevice("cuda"),
+        )
+
+    assert torch_module.cuda.bf16_probe_calls == 1
+
+
+def test_build_precision_runtime_fp16_prefers_device_generic_grad_scaler() -> None:
+    """fp16 runs should build torch.amp.GradScaler for CUDA when it exists."""
+    torch_module = _FakeTorch(bf16_supported=True, capability_major=7)
+    torch_module.amp = SimpleNamespace(GradScaler=_FakeDeviceGradScaler)
+
+    runtime = build_training_precision_runtime(
+        torch_module=torch_module,
+        requested_mode="fp16",
+        device=_FakeDevice("cuda"),
+    )
+
+    assert (type(runtime.scaler), runtime.scaler.device) == (_FakeDeviceGradScaler, "cuda")
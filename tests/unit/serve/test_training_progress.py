@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from serve.training_progress import TrainingProgressTracker, read_optimizer_learning_rate
+from serve.training_progress import (
+    TrainingProgressTracker,
+    read_current_learning_rate,
+    read_optimizer_learning_rate,
+)
 
 
 class _FakeLogger:
@@ -18,6 +22,14 @@ class _FakeOptimizer:
         self.param_groups = [{"lr": lr}]
 
 
+class _FakeScheduler:
+    def __init__(self, last_lr: list[float]) -> None:
+        self._last_lr = last_lr
+
+    def get_last_lr(self) -> list[float]:
+        return self._last_lr
+
+
 def test_training_progress_tracker_logs_periodic_batch_updates(monkeypatch) -> None:
     """Progress tracker should emit first/interval/last batch updates."""
     fake_logger = _FakeLogger()
@@ -34,7 +46,8 @@ def test_training_progress_tracker_logs_periodic_batch_updates(monkeypatch) -> N
     tracker.log_training_started()
     tracker.log_epoch_started(1)
     for batch_index in [1, 2, 3, 4, 5]:
-        tracker.log_batch_progress("train", 1, batch_index, 5, batch_index, 0.5)
+        if tracker.should_log_batch(batch_index, 5):
+            tracker.log_batch_progress("train", 1, batch_index, 5, batch_index, 0.5)
     tracker.log_epoch_completed(1, train_loss=0.5, validation_loss=0.4, learning_rate=0.001)
 
     batch_events = [event for event, _ in fake_logger.events if event == "training_batch_progress"]
@@ -52,3 +65,92 @@ def test_read_optimizer_learning_rate_reads_first_param_group() -> None:
     learning_rate = read_optimizer_learning_rate(_FakeOptimizer(lr=0.003))
 
     assert learning_rate == 0.003
+
+
+def test_read_current_learning_rate_prefers_scheduler_last_lr() -> None:
+    """Current learning-rate reader should use the scheduler's last applied rate."""
+    learning_rate = read_current_learning_rate(
+        _FakeOptimizer(lr=0.003),
+        _FakeScheduler(last_lr=[0.0015]),
+    )
+
+    assert learning_rate == 0.0015
+
+
+def test_read_current_learning_rate_without_scheduler_reads_optimizer() -> None:
+    """Current learning-rate reader should fall back to optimizer param groups."""
+    learning_rate = read_current_learning_rate(_FakeOptimizer(lr=0.003), None)
+
+    assert learning_rate == 0.003
+
+
+def test_training_progress_tracker_logs_no_validation_loss_without_batches(monkeypatch) -> None:
+    """Epoch summary should report no validation loss when validation is disabled."""
+    fake_logger = _FakeLogger()
+    monkeypatch.setattr("serve.training_progress._LOGGER", fake_logger)
+    tracker = TrainingProgressTracker(
+        dataset_name="demo",
+        total_epochs=1,
+        start_epoch=1,
+        train_batch_count=2,
+        validation_batch_count=0,
+        batch_log_interval_steps=1,
+    )
+
+    tracker.log_epoch_completed(1, train_loss=0.5, validation_loss=0.0, learning_rate=0.001)
+
+    assert fake_logger.events[-1][1]["validation_loss"] is None
+
+
+def test_training_progress_tracker_power_of_two_interval_matches_modulo() -> None:
+    """Bitmask batch checks should select the same batches as a modulo check."""
+    tracker = TrainingProgressTracker(
+        dataset_name="demo",
+        total_epochs=1,
+        start_epoch=1,
+        train_batch_count=40,
+        validation_batch_count=0,
+        batch_log_interval_steps=8,
+    )
+
+    logged_batches = [index for index in range(1, 41) if tracker.should_log_batch(index, 40)]
+
+    assert logged_batches == [1, 8, 16, 24, 32, 40]
+
+
+def test_training_progress_tracker_epoch_summary_includes_run_fields(monkeypatch) -> None:
+    """Epoch summary should carry the fixed dataset and epoch-count fields."""
+    fake_logger = _FakeLogger()
+    monkeypatch.setattr("serve.training_progress._LOGGER", fake_logger)
+    tracker = TrainingProgressTracker(
+        dataset_name="demo",
+        total_epochs=4,
+        start_epoch=1,
+        train_batch_count=2,
+        validation_batch_count=1,
+        batch_log_interval_steps=1,
+    )
+
+    tracker.log_epoch_completed(2, train_loss=0.5, validation_loss=0.4, learning_rate=0.001)
+    fields = fake_logger.events[-1][1]
+
+    assert (fields["dataset_name"], fields["total_epochs"], fields["epoch"]) == ("demo", 4, 2)
+
+
+def test_training_progress_tracker_skips_batch_event_when_info_disabled(monkeypatch) -> None:
+    """Batch progress should not be logged when the logger drops info events."""
+    fake_logger = _FakeLogger()
+    monkeypatch.setattr("serve.training_progress._LOGGER", fake_logger)
+    monkeypatch.setattr("serve.training_progress.is_info_enabled", lambda logger: False)
+    tracker = TrainingProgressTracker(
+        dataset_name="demo",
+        total_epochs=1,
+        start_epoch=1,
+        train_batch_count=2,
+        validation_batch_count=0,
+        batch_log_interval_steps=1,
+    )
+
+    tracker.log_batch_progress("train", 1, 1, 2, 1, 0.5)
+
+    assert fake_logger.events == []
@@ -0,0 +1,14 @@
+"""Unit tests for the training run ID index."""
+
+from __future__ import annotations
+
+from serve.training_run_index import TrainingRunIndex
+
+
+def test_training_run_index_appends_unique_ids_in_order(tmp_path) -> None:
+    """Appending should keep insertion order and ignore already indexed IDs."""
+    run_index = TrainingRunIndex(tmp_path / "index.json")
+    for run_id in ["run-a", "run-b", "run-a"]:
+        run_index.append(run_id)
+
+    assert TrainingRunIndex(tmp_path / "index.json").run_ids() == ("run-a", "run-b")
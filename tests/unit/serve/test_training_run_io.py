@@ -0,0 +1,27 @@
+"""Unit tests for lifecycle metadata JSON I/O helpers."""
+
+from __future__ import annotations
+
+from serve.training_run_io import read_json_file, write_json_file
+
+
+def test_write_json_file_replaces_payload_without_leaving_staging_files(tmp_path) -> None:
+    """Atomic writes should swap in the new payload and clean up the staging file."""
+    payload_path = tmp_path / "lifecycle.json"
+    write_json_file(payload_path, {"state": "queued"})
+
+    write_json_file(payload_path, {"state": "running"})
+
+    assert (read_json_file(payload_path), sorted(path.name for path in tmp_path.iterdir())) == (
+        {"state": "running"},
+        ["lifecycle.json"],
+    )
+
+
+def test_read_json_file_decodes_memory_mapped_large_payload(tmp_path, monkeypatch) -> None:
+    """Payloads above the mmap threshold should decode like small ones."""
+    monkeypatch.setattr("core.json_codec.JSON_MMAP_MIN_BYTES", 1)
+    payload_path = tmp_path / "model_lineage.json"
+    write_json_file(payload_path, {"runs": ["run-a"], "edges": []})
+
+    assert read_json_file(payload_path) == {"runs": ["run-a"], "edges": []}
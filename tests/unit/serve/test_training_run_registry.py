@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
 import pytest
 
 from core.errors import ForgeServeError
 from serve.training_run_registry import TrainingRunRegistry
+from serve.training_run_types import run_event_from_payload, run_record_to_payload
 
 
 def test_start_run_persists_queued_record_and_lineage_edges(tmp_path) -> None:
@@ -76,3 +80,111 @@ def test_transition_completed_updates_artifact_and_model_lineage(tmp_path) -> No
     }
 
     assert completed.artifact_contract_path and produced_edge in lineage["edges"]
+
+
+def test_load_lineage_graph_rereads_file_changed_by_another_writer(tmp_path) -> None:
+    """Cached lineage should be dropped when model_lineage.json changes on disk."""
+    registry = TrainingRunRegistry(tmp_path)
+    registry.start_run(
+        dataset_name="demo",
+        dataset_version_id="demo-v1",
+        output_dir=str(tmp_path / "out"),
+        parent_model_path=None,
+        config_hash="abc123",
+    )
+    graph_path = tmp_path / "lineage" / "model_lineage.json"
+    graph_path.write_text('{"runs": {}, "edges": [{"from": "a", "to": "b", "type": "c"}]}')
+
+    lineage = registry.load_lineage_graph()
+
+    assert lineage == {"runs": {}, "edges": [{"from": "a", "to": "b", "type": "c"}]}
+
+
+def test_transition_does_not_duplicate_existing_model_edge(tmp_path) -> None:
+    """Reporting the same model path twice should keep one produced edge."""
+    registry = TrainingRunRegistry(tmp_path)
+    run_record = registry.start_run(
+        dataset_name="demo",
+        dataset_version_id="demo-v1",
+        output_dir=str(tmp_path / "out"),
+        parent_model_path=None,
+        config_hash="abc123",
+    )
+    registry.transition(run_record.run_id, "running", model_path="/tmp/out/model.pt")
+    TrainingRunRegistry(tmp_path).transition(
+        run_record.run_id, "completed", model_path="/tmp/out/model.pt"
+    )
+
+    edge_types = [edge["type"] for edge in registry.load_lineage_graph()["edges"]]
+
+    assert edge_types == ["trained_on", "produced"]
+
+
+def test_run_record_to_payload_matches_dataclass_layout(tmp_path) -> None:
+    """Direct record serialization should match the asdict payload field for field."""
+    registry = TrainingRunRegistry(tmp_path)
+    run_record = registry.start_run(
+        dataset_name="demo",
+        dataset_version_id="demo-v1",
+        output_dir=str(tmp_path / "out"),
+        parent_model_path=None,
+        config_hash="abc123",
+    )
+    expected_payload = asdict(run_record)
+    expected_payload["events"] = [asdict(event) for event in run_record.events]
+
+    assert list(run_record_to_payload(run_record).items()) == list(expected_payload.items())
+
+
+def test_transition_writes_utc_iso_timestamp(tmp_path) -> None:
+    """Transition timestamps should parse as ISO-8601 with a zero UTC offset."""
+    registry = TrainingRunRegistry(tmp_path)
+    run_record = registry.start_run(
+        dataset_name="demo",
+        dataset_version_id="demo-v1",
+        output_dir=str(tmp_path / "out"),
+        parent_model_path=None,
+        config_hash="abc123",
+    )
+    updated = registry.transition(run_record.run_id, "running")
+
+    assert datetime.fromisoformat(updated.updated_at).utcoffset() == timedelta(0)
+
+
+def test_run_event_from_payload_rejects_unknown_state(tmp_path) -> None:
+    """Event parsing should still reject states outside the lifecycle machine."""
+    with pytest.raises(ForgeServeError):
+        run_event_from_payload({"state": "paused", "timestamp": "t"}, tmp_path / "x.json")
+
+
+def test_load_run_rereads_record_changed_by_another_registry(tmp_path) -> None:
+    """Cached run records should be refreshed after another writer transitions them."""
+    registry = TrainingRunRegistry(tmp_path)
+    run_record = registry.start_run(
+        dataset_name="demo",
+        dataset_version_id="demo-v1",
+        output_dir=str(tmp_path / "out"),
+        parent_model_path=None,
+        config_hash="abc123",
+    )
+    TrainingRunRegistry(tmp_path).transition(run_record.run_id, "running", message="worker")
+
+    assert registry.load_run(run_record.run_id).state == "running"
+
+
+def test_load_run_interns_repeated_dataset_names(tmp_path) -> None:
+    """Records loaded from disk should share one string object per dataset name."""
+    registry = TrainingRunRegistry(tmp_path)
+    run_ids = [
+        registry.start_run(
+            dataset_name="demo",
+            dataset_version_id="demo-v1",
+            output_dir=str(tmp_path / "out"),
+            parent_model_path=None,
+            config_hash="abc123",
+        ).run_id
+        for _ in range(2)
+    ]
+    first, second = (TrainingRunRegistry(tmp_path).load_run(run_id) for run_id in run_ids)
+
+    assert first.dataset_name is second.dataset_name
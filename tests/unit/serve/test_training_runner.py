@@ -8,7 +8,8 @@ from types import SimpleNamespace
 import pytest
 
 from core.errors import ForgeDependencyError
-from core.types import DataRecord, RecordMetadata, TrainingOptions, TrainingRunResult
+from core.training_types import TrainingRunResult
+from core.types import DataRecord, RecordMetadata, TrainingOptions
 from serve.training_execution import TrainingLoopResult
 from serve.training_hooks import TrainingHooks
 from serve.training_run_registry import TrainingRunRegistry
@@ -82,7 +83,7 @@ def test_run_training_persists_completed_lifecycle_record(monkeypatch, tmp_path)
 
     monkeypatch.setattr("serve.training_runner._build_runtime_context", _fake_build_context)
     monkeypatch.setattr("serve.training_runner.run_training_loop", _fake_loop)
-    monkeypatch.setattr("serve.training_runner._persist_training_outputs", _fake_persist)
+    monkeypatch.setattr("serve.training_runner.persist_training_outputs", _fake_persist)
     result = run_training(
         records=_build_records(),
         options=options,
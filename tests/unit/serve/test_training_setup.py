@@ -130,3 +130,32 @@ def test_validate_training_options_rejects_unknown_precision_mode(tmp_path) -> N
         validate_training_options(options)
 
     assert True
+
+
+def test_validate_training_options_names_field_below_minimum(tmp_path) -> None:
+    """Lower-bound failures should report the field name and its minimum."""
+    options = TrainingOptions(dataset_name="demo", output_dir=str(tmp_path), max_token_length=2)
+
+    with pytest.raises(ForgeServeError, match="max_token_length 2: expected value >= 4"):
+        validate_training_options(options)
+
+    assert True
+
+
+def test_validate_training_options_accepts_defaults(tmp_path) -> None:
+    """Default options should pass every validation rule."""
+    options = TrainingOptions(dataset_name="demo", output_dir=str(tmp_path))
+
+    validate_training_options(options)
+
+    assert True
+
+
+def test_validate_training_options_rejects_validation_split_outside_unit_interval(tmp_path) -> None:
+    """Fraction fields should be rejected outside [0, 1) with their value in the message."""
+    options = TrainingOptions(dataset_name="demo", output_dir=str(tmp_path), validation_split=1.5)
+
+    with pytest.raises(ForgeServeError, match=r"validation_split 1.5: expected value in \[0, 1\)"):
+        validate_training_options(options)
+
+    assert True
@@ -0,0 +1,127 @@
+"""Unit tests for catalog and manifest persistence helpers."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from core.constants import MANIFEST_FILE_NAME
+from core.errors import ForgeStoreError
+from core.json_codec import load_json_file
+from core.types import DataRecord, RecordMetadata, SnapshotManifest
+from store.catalog_cache import CatalogCache
+from store.catalog_io import (
+    build_version_id,
+    manifest_from_dict,
+    read_catalog_file,
+    read_catalog_manifests,
+    update_catalog,
+    write_manifest_file,
+)
+
+
+def _record(record_id: str) -> DataRecord:
+    metadata = RecordMetadata(source_uri="a.txt", language="en", quality_score=0.5, perplexity=1.0)
+    return DataRecord(record_id=record_id, text="text", metadata=metadata)
+
+
+def _manifest(version_id: str) -> SnapshotManifest:
+    return SnapshotManifest(
+        dataset_name="demo",
+        version_id=version_id,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        parent_version=None,
+        recipe_steps=("ingest",),
+        record_count=1,
+    )
+
+
+def test_build_version_id_digest_matches_joined_record_ids() -> None:
+    """Streamed hashing should keep the digest of the pipe-joined record ids."""
+    records = (_record("a1"), _record("b2"), _record("c3"))
+    expected_digest = hashlib.sha256(b"a1|b2|c3").hexdigest()[:10]
+
+    version_id = build_version_id("demo", records)
+
+    assert version_id.startswith("demo-") and version_id.endswith(f"-{expected_digest}")
+
+
+def test_build_version_id_digest_spans_chunk_boundaries(monkeypatch) -> None:
+    """Chunked hashing should separate ids across chunk boundaries too."""
+    monkeypatch.setattr("store.catalog_io.RECORD_ID_HASH_CHUNK_SIZE", 2)
+    records = (_record("a1"), _record("b2"), _record("c3"))
+    expected_digest = hashlib.sha256(b"a1|b2|c3").hexdigest()[:10]
+
+    version_id = build_version_id("demo", records)
+
+    assert version_id.endswith(f"-{expected_digest}")
+
+
+def test_read_catalog_file_reuses_parsed_payload_until_file_changes(tmp_path: Path) -> None:
+    """Unchanged catalogs should be parsed once and re-read after an update."""
+    catalog_path = tmp_path / "catalog.json"
+    cache = CatalogCache()
+    update_catalog(catalog_path, _manifest("v1"), cache)
+    first_read = read_catalog_file(catalog_path, cache)
+    second_read = read_catalog_file(catalog_path, cache)
+    update_catalog(catalog_path, _manifest("v2"), cache)
+    updated_read = read_catalog_file(catalog_path, cache)
+
+    version_counts = (len(first_read["versions"]), len(updated_read["versions"]))
+    assert (second_read is first_read, version_counts) == (True, (1, 2))
+
+
+def test_read_catalog_file_separate_caches_parse_independently(tmp_path: Path) -> None:
+    """Each cache owner should hold its own parsed catalog payload."""
+    catalog_path = tmp_path / "catalog.json"
+    update_catalog(catalog_path, _manifest("v1"), CatalogCache())
+
+    first_read = read_catalog_file(catalog_path, CatalogCache())
+    second_read = read_catalog_file(catalog_path, CatalogCache())
+
+    assert second_read is not first_read
+
+
+def test_write_manifest_file_round_trips_manifest_fields(tmp_path: Path) -> None:
+    """Written manifests should decode back to the original manifest."""
+    manifest = _manifest("v1")
+    write_manifest_file(tmp_path, manifest, lance_written=False)
+    payload = load_json_file(tmp_path / MANIFEST_FILE_NAME)
+
+    assert (manifest_from_dict(payload), payload["lance_written"]) == (manifest, False)
+
+
+def test_read_catalog_manifests_extends_cached_view_on_append(tmp_path: Path) -> None:
+    """Appending a newer version should reuse already parsed manifests."""
+    catalog_path = tmp_path / "catalog.json"
+    cache = CatalogCache()
+    update_catalog(catalog_path, _manifest("v1"), cache)
+    first_view = read_catalog_manifests(catalog_path, cache)
+    update_catalog(catalog_path, _manifest("v2"), cache)
+    updated_view = read_catalog_manifests(catalog_path, cache)
+
+    version_ids = [manifest.version_id for manifest in updated_view]
+    assert (version_ids, updated_view[0] is first_view[0]) == (["v1", "v2"], True)
+
+
+def test_update_catalog_failed_replace_keeps_previous_catalog(tmp_path: Path, monkeypatch) -> None:
+    """A failed rename should leave the previous catalog and no staging file."""
+    catalog_path = tmp_path / "catalog.json"
+    cache = CatalogCache()
+    update_catalog(catalog_path, _manifest("v1"), cache)
+    previous_bytes = catalog_path.read_bytes()
+
+    def _failing_replace(source: Path, target: Path) -> None:
+        raise OSError(f"cannot replace {target} with {source}")
+
+    monkeypatch.setattr("core.file_io.os.replace", _failing_replace)
+    with pytest.raises(ForgeStoreError):
+        update_catalog(catalog_path, _manifest("v2"), cache)
+
+    assert (catalog_path.read_bytes(), sorted(tmp_path.iterdir())) == (
+        previous_bytes,
+        [catalog_path],
+    )
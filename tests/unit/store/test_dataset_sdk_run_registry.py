@@ -18,7 +18,7 @@ def test_client_run_spec_delegates_to_shared_executor(monkeypatch) -> None:
         _ = client_arg
         return (f"executed={spec_file}",)
 
-    monkeypatch.setattr("store.dataset_sdk.execute_run_spec_file", _fake_execute)
+    monkeypatch.setattr("core.run_spec_execution.execute_run_spec_file", _fake_execute)
     output = client.run_spec("pipeline.yaml")
 
     assert output == ("executed=pipeline.yaml",)
@@ -33,7 +33,7 @@ def test_client_hardware_profile_returns_profile_payload(monkeypatch) -> None:
         def to_dict(self) -> dict[str, object]:
             return {"accelerator": "cpu", "gpu_count": 0}
 
-    monkeypatch.setattr("store.dataset_sdk.detect_hardware_profile", lambda: _FakeProfile())
+    monkeypatch.setattr("serve.hardware_profile.detect_hardware_profile", lambda: _FakeProfile())
     payload = client.hardware_profile()
 
     assert payload == {"accelerator": "cpu", "gpu_count": 0}
@@ -57,3 +57,57 @@ def test_client_run_registry_helpers_load_runs_and_lineage(tmp_path) -> None:
         and client.get_training_run(run_record.run_id).run_id == run_record.run_id
         and isinstance(client.get_lineage_graph().get("runs"), dict)
     )
+
+
+def test_client_run_registry_reuses_registry_and_sees_new_runs(tmp_path) -> None:
+    """SDK registry helpers should share one registry that still sees external writes."""
+    config = replace(ForgeConfig.from_env(), data_root=tmp_path)
+    client = ForgeClient(config)
+    first_runs = client.list_training_runs()
+    first_registry = client._runtime_cache.run_registry()
+    run_record = TrainingRunRegistry(tmp_path).start_run(
+        dataset_name="demo",
+        dataset_version_id="demo-v1",
+        output_dir=str(tmp_path / "out"),
+        parent_model_path=None,
+        config_hash="abc123",
+    )
+
+    assert (
+        first_runs == ()
+        and client.list_training_runs() == (run_record.run_id,)
+        and client._runtime_cache.run_registry() is first_registry
+    )
+
+
+def test_client_and_dataset_handles_have_no_instance_dict(tmp_path) -> None:
+    """SDK handles should use slots instead of a per-instance attribute dict."""
+    config = replace(ForgeConfig.from_env(), data_root=tmp_path)
+    client = ForgeClient(config)
+    dataset = client.dataset("demo")
+
+    assert not hasattr(client, "__dict__") and not hasattr(dataset, "__dict__")
+
+
+def test_client_hardware_profile_detects_once_until_refreshed(monkeypatch) -> None:
+    """ForgeClient should reuse the detected profile until explicitly refreshed."""
+    config = replace(ForgeConfig.from_env())
+    client = ForgeClient(config)
+    detections: list[int] = []
+
+    class _FakeProfile:
+        def __init__(self, gpu_count: int) -> None:
+            self.gpu_count = gpu_count
+
+        def to_dict(self) -> dict[str, object]:
+            return {"gpu_count": self.gpu_count}
+
+    def _fake_detect() -> _FakeProfile:
+        detections.append(len(detections))
+        return _FakeProfile(len(detections))
+
+    monkeypatch.setattr("serve.hardware_profile.detect_hardware_profile", _fake_detect)
+    payloads = [client.hardware_profile(), client.hardware_profile()]
+    payloads.append(client.refresh_hardware_profile())
+
+    assert [payload["gpu_count"] for payload in payloads] == [1, 1, 2]
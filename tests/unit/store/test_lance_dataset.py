@@ -0,0 +1,39 @@
+"""Unit tests for Lance snapshot payload helpers."""
+
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+from core.constants import LANCE_DIR_NAME
+from store.lance_dataset import read_version_payload
+
+
+def _fake_lance_module(columns: dict[str, list[object]]) -> SimpleNamespace:
+    table = SimpleNamespace(
+        column=lambda name: SimpleNamespace(to_pylist=lambda: list(columns[name]))
+    )
+    dataset = SimpleNamespace(to_table=lambda columns: table)
+    return SimpleNamespace(dataset=lambda uri: dataset)
+
+
+def test_read_version_payload_prefers_lance_columns(tmp_path, monkeypatch) -> None:
+    """Snapshots with a Lance dataset should load from its columns, not JSONL."""
+    (tmp_path / LANCE_DIR_NAME).mkdir()
+    columns: dict[str, list[object]] = {
+        "record_id": ["id-1", "id-2"],
+        "text": ["alpha", "beta"],
+        "source_uri": ["a.txt", "b.txt"],
+        "language": ["en", "fr"],
+        "quality_score": [0.9, 0.4],
+        "perplexity": [1.5, 2.5],
+        "extra_fields": ["{}", '{"split": "train"}'],
+    }
+    monkeypatch.setitem(sys.modules, "lance", _fake_lance_module(columns))
+
+    records = read_version_payload(tmp_path)
+
+    assert [(record.text, dict(record.metadata.extra_fields)) for record in records] == [
+        ("alpha", {}),
+        ("beta", {"split": "train"}),
+    ]
@@ -0,0 +1,38 @@
+"""Unit tests for DataRecord JSONL serialization."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from core.types import DataRecord, RecordMetadata
+from store.record_payload import read_data_records_jsonl, write_data_records_jsonl
+
+
+def _record(record_id: str) -> DataRecord:
+    metadata = RecordMetadata(
+        source_uri="a.txt",
+        language="en",
+        quality_score=0.5,
+        perplexity=1.0,
+        extra_fields={"split": "train"},
+    )
+    return DataRecord(record_id=record_id, text=f"text {record_id}", metadata=metadata)
+
+
+def test_write_data_records_jsonl_round_trips_one_row_per_record(tmp_path) -> None:
+    """Streamed JSONL should hold one row per record and read back unchanged."""
+    records = [_record("id-1"), _record("id-2")]
+    records_path = tmp_path / "records.jsonl"
+    write_data_records_jsonl(records_path, records)
+
+    row_count = len(records_path.read_text(encoding="utf-8").splitlines())
+    assert (row_count, read_data_records_jsonl(records_path)) == (2, records)
+
+
+def test_read_data_records_jsonl_keeps_unicode_line_separators_in_text(tmp_path) -> None:
+    """Unescaped U+2028 and non-ASCII text should stay inside one record."""
+    record = replace(_record("id-1"), text="caf\u00e9\u2028next")
+    records_path = tmp_path / "records.jsonl"
+    write_data_records_jsonl(records_path, [record])
+
+    assert read_data_records_jsonl(records_path) == [record]
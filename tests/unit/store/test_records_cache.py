@@ -0,0 +1,35 @@
+"""Unit tests for the record-count bounded snapshot records cache."""
+
+from __future__ import annotations
+
+from core.types import DataRecord, RecordMetadata
+from store.records_cache import SnapshotRecordsCache
+
+
+def _records(count: int) -> tuple[DataRecord, ...]:
+    metadata = RecordMetadata(source_uri="a.txt", language="en", quality_score=0.5, perplexity=1.0)
+    return tuple(
+        DataRecord(record_id=str(index), text="text", metadata=metadata) for index in range(count)
+    )
+
+
+def test_put_evicts_least_recent_versions_past_record_bound() -> None:
+    """Adding records past the bound should evict the least recently used version."""
+    cache = SnapshotRecordsCache(max_records=4)
+    cache.put(("demo", "v1"), _records(2))
+    cache.put(("demo", "v2"), _records(2))
+    cache.get(("demo", "v1"))
+    cache.put(("demo", "v3"), _records(2))
+
+    cached_versions = [
+        version for version in ("v1", "v2", "v3") if cache.get(("demo", version)) is not None
+    ]
+    assert cached_versions == ["v1", "v3"]
+
+
+def test_put_skips_snapshot_larger_than_record_bound() -> None:
+    """A snapshot bigger than the whole bound should not be cached."""
+    cache = SnapshotRecordsCache(max_records=2)
+    cache.put(("demo", "v1"), _records(3))
+
+    assert cache.get(("demo", "v1")) is None
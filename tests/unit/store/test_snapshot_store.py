@@ -78,3 +78,49 @@ def test_load_records_raises_for_unknown_dataset(tmp_path) -> None:
         store.load_records("missing")
 
     assert (tmp_path / "datasets" / "missing").exists()
+
+
+def test_load_records_reuses_cached_version_payload(tmp_path, monkeypatch) -> None:
+    """Repeat loads of one version should not re-read the snapshot payload."""
+    config = replace(ForgeConfig.from_env(), data_root=tmp_path)
+    store = SnapshotStore(config)
+    request = SnapshotWriteRequest(
+        dataset_name="demo",
+        records=(_sample_record(),),
+        recipe_steps=("step",),
+    )
+    store.create_snapshot(request)
+    store.load_records("demo")
+
+    def _fail_read(version_dir):
+        raise AssertionError(f"unexpected payload read from {version_dir}")
+
+    monkeypatch.setattr("store.snapshot_store.read_version_payload", _fail_read)
+    _, records = store.load_records("demo")
+
+    assert records[0].text == "sample text"
+
+
+def test_filter_records_applies_every_constraint(tmp_path) -> None:
+    """Filtered snapshots should keep only records matching all constraints."""
+    config = replace(ForgeConfig.from_env(), data_root=tmp_path)
+    store = SnapshotStore(config)
+    kept = _sample_record()
+    low_quality = replace(
+        kept, record_id="id-2", metadata=replace(kept.metadata, quality_score=0.1)
+    )
+    other_source = replace(
+        kept, record_id="id-3", metadata=replace(kept.metadata, source_uri="s3://other/a.txt")
+    )
+    request = SnapshotWriteRequest(
+        dataset_name="demo",
+        records=(kept, low_quality, other_source),
+        recipe_steps=("step",),
+    )
+    store.create_snapshot(request)
+    filter_spec = MetadataFilter(language="en", min_quality_score=0.5, source_prefix="tests/")
+
+    child_manifest = store.filter_records("demo", filter_spec)
+    _, records = store.load_records("demo", child_manifest.version_id)
+
+    assert [record.record_id for record in records] == ["id-1"]